@@ -5,9 +5,11 @@ from typing import Optional
 from app.admin.schemas import (
     AdminMatchupResponse,
     ClaimApproval,
+    EloReplayResponse,
     EloSettingsResponse,
     EloSettingsUpdate,
     FeatureTogglesResponse,
+    MatchupIdCapacityResponse,
     RoleUpdate,
     UserResponse,
 )
@@ -21,10 +23,13 @@ from app.league.elo import (
     get_new_player_games_threshold,
     get_new_player_k_factor,
     get_setting,
+    replay_elo_history,
     set_setting,
 )
 from app.league.models import LeaguePlayer, PlayerElo
 from app.league.service import recalculate_all_army_stats
+from app.lists.service import load_army_lists
+from app.matchup.ids import matchup_id_capacity
 from app.matchup.models import Matchup
 from app.users.models import OAuthAccount, User
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -244,6 +249,19 @@ async def update_elo_settings(
     )
 
 
+@router.post("/settings/elo/replay", response_model=EloReplayResponse)
+async def replay_elo(
+    dry_run: bool = Query(default=True),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_admin),
+):
+    """Recompute all ratings from confirmed matches with the current settings.
+
+    Defaults to a dry run that only reports the changes.
+    """
+    return replay_elo_history(session, dry_run=dry_run)
+
+
 @router.get("/settings/features", response_model=FeatureTogglesResponse)
 async def get_feature_toggles(
     session: Session = Depends(get_session),
@@ -280,6 +298,15 @@ async def recalculate_army_stats(
 # ============ Matchups ============
 
 
+@router.get("/matchups/id-capacity", response_model=MatchupIdCapacityResponse)
+async def get_matchup_id_capacity(
+    session: Session = Depends(get_session),
+    _: User = Depends(get_admin),
+):
+    """How many matchup ids remain before the word lists need to grow."""
+    return matchup_id_capacity(session)
+
+
 @router.get("/matchups", response_model=list[AdminMatchupResponse])
 async def list_matchups(
     status_filter: Optional[str] = Query(
@@ -317,6 +344,13 @@ async def list_matchups(
         users = session.scalars(select(User).where(User.id.in_(user_ids))).all()
         users_map = {user.id: user.username for user in users}
 
+    # Lists are shown only for revealed matchups
+    revealed = [m for m in matchups if m.player1_submitted and m.player2_submitted]
+    lists = load_army_lists(
+        session,
+        [m.player1_list_id for m in revealed] + [m.player2_list_id for m in revealed],
+    )
+
     result = []
     for matchup in matchups:
         is_revealed = matchup.player1_submitted and matchup.player2_submitted
@@ -335,8 +369,12 @@ async def list_matchups(
                 is_public=matchup.is_public,
                 created_at=matchup.created_at,
                 # Only show lists if revealed
-                player1_list=matchup.player1_list if is_revealed else None,
-                player2_list=matchup.player2_list if is_revealed else None,
+                player1_list=(
+                    lists.get(matchup.player1_list_id) if is_revealed else None
+                ),
+                player2_list=(
+                    lists.get(matchup.player2_list_id) if is_revealed else None
+                ),
                 player1_army_faction=(
                     matchup.player1_army_faction if is_revealed else None
                 ),
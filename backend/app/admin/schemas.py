@@ -47,10 +47,34 @@ class EloSettingsUpdate(BaseModel):
     new_player_games: Optional[int] = Field(default=None, ge=1, le=50)
 
 
+class EloReplayPlayerChange(BaseModel):
+    user_id: int
+    elo_before: Optional[int] = None  # None if the player had no ELO record
+    elo_after: int
+    games_before: Optional[int] = None
+    games_after: int
+    k_factor_games: int
+
+
+class EloReplayResponse(BaseModel):
+    dry_run: bool
+    matches: int
+    players: int
+    matches_changed: int
+    players_changed: list[EloReplayPlayerChange]
+
+
 class FeatureTogglesResponse(BaseModel):
     rules_enabled: bool
 
 
+class MatchupIdCapacityResponse(BaseModel):
+    total: int
+    allocated: int
+    remaining: int
+    used_percent: float
+
+
 class AdminMatchupResponse(BaseModel):
     """Matchup info for admin panel (respects list visibility)."""
 
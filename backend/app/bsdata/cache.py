@@ -0,0 +1,176 @@
+"""Response cache for BSData read endpoints.
+
+BSData content only changes when a sync commits a new successful
+BSDataSyncStatus, so serialized responses are cached per status id and
+served with strong ETags. The commit hash would not do: a forced full sync
+of the same commit reinserts every row under new primary keys.
+"""
+
+import functools
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from app.bsdata.models import BSDataSyncStatus
+from app.config import settings
+from app.core.metrics import BSDATA_CACHE_REQUESTS
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Clients may keep responses but must revalidate them with If-None-Match
+CACHE_CONTROL = "private, no-cache"
+
+
+def _latest_status_query():
+    return (
+        select(BSDataSyncStatus.id)
+        .where(BSDataSyncStatus.status == "success")
+        .order_by(BSDataSyncStatus.id.desc())
+        .limit(1)
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+class ResponseCache:
+    """LRU of serialized responses for the current BSData sync.
+
+    The version (id of the latest successful sync status) is re-read from the database at most every
+    ``version_ttl`` seconds, so workers that did not run the sync pick up
+    new data without a shared store.
+    """
+
+    def __init__(self, max_entries: int, version_ttl: float):
+        self.max_entries = max_entries
+        self.version_ttl = version_ttl
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def set_version(self, version: str) -> None:
+        """Record the current BSData version, dropping entries of older ones."""
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+            self._version = version
+            self._version_checked_at = time.monotonic()
+
+    async def current_version(self, session: Session | AsyncSession) -> str:
+        """Id of the latest successful sync status ('' before the first sync)."""
+        age = time.monotonic() - self._version_checked_at
+        if self._version is None or age >= self.version_ttl:
+            query = _latest_status_query()
+            if isinstance(session, AsyncSession):
+                status_id = (await session.exec(query)).first()
+            else:
+                status_id = session.exec(query).first()
+            self.set_version(str(status_id) if status_id else "")
+        return self._version
+
+    def get(self, key: str) -> Optional[tuple[str, bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, body: bytes) -> str:
+        """Store a serialized body and return its ETag."""
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return etag
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._version_checked_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+response_cache = ResponseCache(
+    max_entries=settings.BSDATA_CACHE_MAX_ENTRIES,
+    version_ttl=settings.BSDATA_CACHE_VERSION_TTL,
+)
+
+
+def cached_response(response_model: Any) -> Callable:
+    """Serve an endpoint from the response cache with ETag / 304 support.
+
+    The endpoint must take a ``Session`` or ``AsyncSession`` dependency; it is
+    only called on a cache miss. Route dependencies (auth, feature toggles)
+    still run on every request.
+    """
+    adapter = TypeAdapter(response_model)
+
+    def decorator(endpoint: Callable) -> Callable:
+        signature = inspect.signature(endpoint)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, _cache_request: Request, **kwargs):
+            if not response_cache.enabled:
+                return await endpoint(*args, **kwargs)
+
+            session = next(
+                value
+                for value in kwargs.values()
+                if isinstance(value, (Session, AsyncSession))
+            )
+            version = await response_cache.current_version(session)
+            url = _cache_request.url
+            key = f"{version}:{url.path}?{url.query}"
+
+            entry = response_cache.get(key)
+            if entry is None:
+                BSDATA_CACHE_REQUESTS.inc(result="miss")
+                result = await endpoint(*args, **kwargs)
+                body = adapter.dump_json(
+                    adapter.validate_python(result, from_attributes=True),
+                    by_alias=True,
+                )
+                etag = response_cache.put(key, body)
+            else:
+                BSDATA_CACHE_REQUESTS.inc(result="hit")
+                etag, body = entry
+
+            headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+            if _etag_matches(_cache_request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(
+                content=body, media_type="application/json", headers=headers
+            )
+
+        wrapper.__signature__ = signature.replace(
+            parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(
+                    "_cache_request",
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=Request,
+                ),
+            ]
+        )
+        return wrapper
+
+    return decorator
@@ -0,0 +1,259 @@
+"""Background job runner for BSData syncs.
+
+``POST /bsdata/sync`` records a ``BSDataSyncJob`` and returns at once; the
+sync itself runs on a single worker thread with its own sessions. Phase
+progress is written through a separate session so it is visible while the
+sync transaction is still open. The unique ``active`` column allows only one
+queued or running job across all processes.
+
+SQLite refuses progress writes while the sync holds its write lock, so
+``updated_at`` alone cannot tell a long sync from a dead one. Each job
+records a token unique to its owning process. Jobs of this process are never
+released, jobs of any other process on this host are (that process has
+restarted), and jobs of other hosts are released once their heartbeat stops.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from app.bsdata.models import BSDataSyncJob
+from app.bsdata.sync import BSDataSync
+from app.config import settings
+from app.db import engine
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlmodel import Session, select
+
+logger = logging.getLogger(__name__)
+
+
+class SyncAlreadyRunning(Exception):
+    """Another sync job is queued or running."""
+
+    def __init__(self, job_id: Optional[int]):
+        super().__init__(f"BSData sync job {job_id} is already running")
+        self.job_id = job_id
+
+
+# Unique per process: the server runs as PID 1 in its container, so the
+# hostname and pid alone repeat across restarts
+PROCESS_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def owner_alive(owner: Optional[str]) -> Optional[bool]:
+    """Whether the owning process is running; None if it is on another host."""
+    if owner == PROCESS_OWNER:
+        return True
+    if not owner or owner.split(":", 1)[0] == socket.gethostname():
+        return False
+    return None
+
+
+class JobProgress:
+    """Records phase transitions of a running job."""
+
+    def __init__(self, session: Session, job: BSDataSyncJob):
+        self.session = session
+        self.job = job
+        self.phases: list[dict] = []
+        self._phase_started: Optional[datetime] = None
+
+    def _close_phase(self, now: datetime) -> None:
+        if self.phases and self._phase_started:
+            duration = (now - self._phase_started).total_seconds()
+            self.phases[-1]["duration_seconds"] = round(duration, 3)
+
+    def _save(self) -> None:
+        self.job.phases = json.dumps(self.phases)
+        self.job.updated_at = datetime.utcnow()
+        self.session.add(self.job)
+        try:
+            self.session.commit()
+        except OperationalError:
+            # SQLite refuses while the sync holds its write lock; the full
+            # phase list is written again on the next save
+            self.session.rollback()
+            logger.debug("Deferred progress update for sync job %s", self.job.id)
+
+    def start(self) -> None:
+        self.job.status = "running"
+        self.job.started_at = datetime.utcnow()
+        self._save()
+
+    def phase(self, name: str) -> None:
+        now = datetime.utcnow()
+        self._close_phase(now)
+        self.phases.append(
+            {"name": name, "started_at": now.isoformat(), "duration_seconds": None}
+        )
+        self._phase_started = now
+        self.job.phase = name
+        self._save()
+
+    def finish(self, result: dict) -> None:
+        now = datetime.utcnow()
+        self._close_phase(now)
+        failed = result.get("status") == "failed"
+        self.job.status = "failed" if failed else "success"
+        self.job.phase = None
+        self.job.result = json.dumps(result, default=str)
+        self.job.error_message = result.get("error")
+        self.job.finished_at = now
+        self.job.active = None
+        self._save()
+
+
+class SyncJobRunner:
+    """Queue BSData sync jobs and run them one at a time."""
+
+    def __init__(self, session_factory: Callable[[], Session], stale_after: float):
+        self.session_factory = session_factory
+        self.stale_after = stale_after
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _release_stale(self, session: Session) -> None:
+        """Fail active jobs whose process is gone.
+
+        Jobs of another process on this host are released at once; jobs of
+        another host once they stop reporting progress. Jobs of this process
+        are never released, however old their ``updated_at``.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.stale_after)
+        statement = select(BSDataSyncJob).where(
+            BSDataSyncJob.active == True  # noqa: E712
+        )
+        for job in session.exec(statement).all():
+            alive = owner_alive(job.owner)
+            if alive or (alive is None and job.updated_at >= cutoff):
+                continue
+            logger.warning("Releasing abandoned BSData sync job %s", job.id)
+            job.status = "failed"
+            job.error_message = "Abandoned: owning process is gone"
+            job.finished_at = datetime.utcnow()
+            job.active = None
+            session.add(job)
+        session.commit()
+
+    def enqueue(
+        self, session: Session, force_full: bool, requested_by: Optional[int] = None
+    ) -> BSDataSyncJob:
+        """Record a new job and start it in the background.
+
+        Raises SyncAlreadyRunning if another job is queued or running.
+        """
+        job = self._claim(
+            session, BSDataSyncJob(force_full=force_full, requested_by=requested_by)
+        )
+        self.submit(job.id)
+        return job
+
+    def _claim(self, session: Session, job: BSDataSyncJob) -> BSDataSyncJob:
+        """Insert an active job, taking the single active slot."""
+        self._release_stale(session)
+
+        job.owner = PROCESS_OWNER
+        session.add(job)
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            active = session.exec(
+                select(BSDataSyncJob).where(BSDataSyncJob.active == True)  # noqa: E712
+            ).first()
+            raise SyncAlreadyRunning(active.id if active else None)
+        session.refresh(job)
+        return job
+
+    def rollback(self, session: Session, requested_by: Optional[int] = None) -> dict:
+        """Roll back the last sync in the request, holding the active job slot.
+
+        Raises SyncAlreadyRunning if a sync is queued or running, so the two
+        never rewrite the rules tables at the same time.
+        """
+        job = self._claim(
+            session,
+            BSDataSyncJob(
+                status="running",
+                phase="rollback",
+                requested_by=requested_by,
+                started_at=datetime.utcnow(),
+            ),
+        )
+        try:
+            result = BSDataSync(session).rollback()
+        except Exception as error:
+            logger.exception("BSData rollback job %s crashed", job.id)
+            session.rollback()
+            result = {"sync_type": "rollback", "status": "failed", "error": str(error)}
+        JobProgress(session, job).finish(result)
+        return result
+
+    def submit(self, job_id: int) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="bsdata-sync"
+            )
+        self._executor.submit(self.run, job_id)
+
+    def run(self, job_id: int) -> None:
+        """Run a queued job to completion (called on the worker thread)."""
+        with self.session_factory() as progress_session:
+            job = progress_session.get(BSDataSyncJob, job_id)
+            if job is None:
+                return
+            job.owner = PROCESS_OWNER
+            progress = JobProgress(progress_session, job)
+            progress.start()
+
+            stop = threading.Event()
+            heartbeat = threading.Thread(
+                target=self._heartbeat, args=(job_id, stop), daemon=True
+            )
+            heartbeat.start()
+            try:
+                with self.session_factory() as sync_session:
+                    sync = BSDataSync(sync_session, progress=progress.phase)
+                    result = sync.sync(force_full=job.force_full)
+            except Exception as error:
+                logger.exception("BSData sync job %s crashed", job_id)
+                result = {"status": "failed", "error": str(error)}
+            finally:
+                stop.set()
+                heartbeat.join()
+            progress.finish(result)
+
+    def _heartbeat(self, job_id: int, stop: threading.Event) -> None:
+        """Advance ``updated_at`` on its own connection between phase updates."""
+        while not stop.wait(self.stale_after / 4):
+            self.beat(job_id)
+
+    def beat(self, job_id: int) -> None:
+        """Mark a running job as alive."""
+        with self.session_factory() as session:
+            try:
+                session.execute(
+                    update(BSDataSyncJob)
+                    .where(BSDataSyncJob.id == job_id)
+                    .values(updated_at=datetime.utcnow())
+                )
+                session.commit()
+            except OperationalError:
+                # Locked by the sync on SQLite; the owner check covers it
+                session.rollback()
+
+
+sync_job_runner = SyncJobRunner(
+    lambda: Session(engine), stale_after=settings.BSDATA_SYNC_JOB_STALE_SECONDS
+)
+
+
+def get_sync_job_runner() -> SyncJobRunner:
+    """Dependency returning the process-wide job runner."""
+    return sync_job_runner
@@ -0,0 +1,291 @@
+"""Army list parsing against the synced BSData units.
+
+Pasted lists (the GW app export's ``Liberators (200 points)`` or
+hand-written ``10x Liberators - 200pts`` lines) are split into unit lines,
+unit names are resolved through an in-memory name index of ``bsdata_units``
+with fuzzy matching, and the points are checked against BSData. The index is
+rebuilt when the BSData version (the response cache's sync status id)
+changes; parsed lists are cached per version and list hash, so matchup
+reveals and league standings parse each list once per sync.
+"""
+
+import difflib
+import hashlib
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Iterable, NamedTuple, Optional
+
+from app.bsdata.cache import response_cache
+from app.bsdata.models import Faction, Unit
+from app.bsdata.schemas import ParsedArmyList, ParsedListUnit
+from app.config import settings
+from app.core.settings_cache import settings_cache
+from app.data.armies import ARMY_FACTIONS, detect_army
+from sqlmodel import Session, select
+
+# Minimum difflib ratio for a fuzzy unit name match
+FUZZY_CUTOFF = 0.85
+
+_FACTION_NAMES = {faction.lower() for faction in ARMY_FACTIONS}
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "`": "'"})
+_BULLET = re.compile(r"^\s*[•●*\-]\s*")
+_QUANTITY = re.compile(r"^(\d+)\s*x\s+", re.IGNORECASE)
+_POINTS = re.compile(
+    r"[(\[]\s*(\d+)\s*(?:pts?|points)\s*[)\]]|(\d+)\s*(?:pts?|points)\b",
+    re.IGNORECASE,
+)
+_TOTAL = re.compile(
+    r"^(?:total|points)?\s*:?\s*(\d+)\s*/\s*(\d+)\s*(?:pts?|points)?$"
+    r"|^(?:total|points)\s*:?\s*(\d+)\s*(?:pts?|points)?$",
+    re.IGNORECASE,
+)
+_REINFORCED = re.compile(r"[(\[]\s*reinforced\s*[)\]]", re.IGNORECASE)
+_NOISE = re.compile(r"[(\[][^)\]]*[)\]]|\s[-–:|]\s*$")
+
+
+def normalize_unit_name(name: str) -> str:
+    """Lowercase, ASCII quotes and single spaces."""
+    return " ".join(name.translate(_QUOTES).lower().split())
+
+
+class IndexedUnit(NamedTuple):
+    id: int
+    name: str
+    faction_name: str
+    points: Optional[int]
+    can_be_reinforced: bool
+
+
+class UnitNameIndex:
+    """Normalized unit name -> units, with fuzzy lookup."""
+
+    def __init__(self, units: list[IndexedUnit]):
+        self._units: dict[str, list[IndexedUnit]] = defaultdict(list)
+        self._faction_names: dict[str, list[str]] = defaultdict(list)
+        for unit in units:
+            key = normalize_unit_name(unit.name)
+            if not self._units[key]:
+                self._faction_names[unit.faction_name].append(key)
+            self._units[key].append(unit)
+        self._names = list(self._units)
+
+    @classmethod
+    def load(cls, session: Session) -> "UnitNameIndex":
+        rows = session.exec(
+            select(
+                Unit.id,
+                Unit.name,
+                Faction.name,
+                Unit.points,
+                Unit.can_be_reinforced,
+            ).join(Faction)
+        ).all()
+        return cls([IndexedUnit(*row) for row in rows])
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def _pick(self, key: str, faction: Optional[str]) -> IndexedUnit:
+        units = self._units[key]
+        return next((u for u in units if u.faction_name == faction), units[0])
+
+    def lookup(
+        self, name: str, faction: Optional[str] = None, fuzzy: bool = True
+    ) -> Optional[tuple[IndexedUnit, bool]]:
+        """Best unit for ``name`` and whether the match was exact.
+
+        Units of ``faction`` win over same-named units of other factions,
+        and fuzzy matches are tried within the faction first.
+        """
+        key = normalize_unit_name(name)
+        for candidate in (key, key + "s", key.removesuffix("s")):
+            if candidate in self._units:
+                return self._pick(candidate, faction), True
+        if not fuzzy:
+            return None
+
+        for names in (self._faction_names.get(faction, []), self._names):
+            matches = difflib.get_close_matches(key, names, n=1, cutoff=FUZZY_CUTOFF)
+            if matches:
+                return self._pick(matches[0], faction), False
+        return None
+
+
+def _parse_points(line: str) -> tuple[str, Optional[int]]:
+    """Strip the points annotation from a line and return it."""
+    match = _POINTS.search(line)
+    if not match:
+        return line, None
+    points = int(match.group(1) or match.group(2))
+    return line[: match.start()] + line[match.end() :], points
+
+
+def _clean_name(text: str) -> str:
+    text = _NOISE.sub("", text)
+    return text.strip(" \t-–:|")
+
+
+def parse_army_list(text: str, index: UnitNameIndex) -> ParsedArmyList:
+    """Parse a pasted army list into units, points and validation errors."""
+    detection = detect_army(text, max_lines=text.count("\n") + 1)
+    faction = detection.faction if detection else None
+    result = ParsedArmyList(faction=faction)
+
+    for line_number, raw_line in enumerate(text.splitlines(), start=1):
+        line = raw_line.strip()
+        # Bulleted lines are options of the unit above (enhancements, weapons)
+        if not line or _BULLET.match(line):
+            continue
+
+        total = _TOTAL.match(line)
+        if total:
+            used, limit, only_used = total.groups()
+            result.declared_points = int(used or only_used)
+            if limit:
+                result.points_limit = int(limit)
+            continue
+
+        quantity_match = _QUANTITY.match(line)
+        quantity = int(quantity_match.group(1)) if quantity_match else None
+        rest = line[quantity_match.end() :] if quantity_match else line
+        reinforced = bool(_REINFORCED.search(rest))
+        rest, listed_points = _parse_points(rest)
+        name = _clean_name(rest)
+        if not name:
+            continue
+
+        # Header such as "Stormcast Eternals - 2000 points"
+        if name.lower() in _FACTION_NAMES:
+            if listed_points and result.points_limit is None:
+                result.points_limit = listed_points
+            continue
+
+        candidate = listed_points is not None or quantity is not None
+        match = index.lookup(name, faction, fuzzy=candidate)
+        if match is None:
+            if candidate:
+                result.errors.append(f"Line {line_number}: unknown unit '{name}'")
+            continue
+
+        unit, exact = match
+        expected = unit.points
+        allowed = {expected}
+        if expected is not None and reinforced:
+            expected *= 2
+            allowed = {expected}
+        elif expected is not None and unit.can_be_reinforced:
+            # Exports do not always mark reinforced units
+            allowed.add(expected * 2)
+        if (
+            listed_points is not None
+            and expected is not None
+            and listed_points not in allowed
+        ):
+            result.errors.append(
+                f"Line {line_number}: {unit.name} listed at {listed_points} pts, "
+                f"BSData has {expected} pts"
+            )
+
+        points = listed_points if listed_points is not None else expected
+        result.units.append(
+            ParsedListUnit(
+                line=line_number,
+                name=name,
+                unit_id=unit.id,
+                matched_name=unit.name,
+                exact_match=exact,
+                quantity=quantity,
+                points=points,
+                bsdata_points=expected,
+            )
+        )
+        result.points_total += points or 0
+
+    if (
+        result.declared_points is not None
+        and result.declared_points != result.points_total
+    ):
+        result.errors.append(
+            f"Declared total {result.declared_points} pts does not match "
+            f"unit points {result.points_total} pts"
+        )
+    if result.points_limit is not None and result.points_total > result.points_limit:
+        result.errors.append(
+            f"Army is {result.points_total} pts, over the "
+            f"{result.points_limit} pts limit"
+        )
+    result.valid = not result.errors
+    return result
+
+
+class ArmyListParser:
+    """Parses lists against a name index of the current BSData version.
+
+    Results are kept in an LRU keyed by version and list hash, so parsing
+    the same list again for the same version is a dictionary lookup.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._index: Optional[UnitNameIndex] = None
+        self._index_version: Optional[str] = None
+        self._entries: OrderedDict[str, ParsedArmyList] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_index(self, session: Session, version: str) -> UnitNameIndex:
+        with self._lock:
+            if self._index is not None and self._index_version == version:
+                return self._index
+        index = UnitNameIndex.load(session)
+        with self._lock:
+            if version != self._index_version:
+                self._entries.clear()
+            self._index = index
+            self._index_version = version
+        return index
+
+    def parse(self, session: Session, text: str, version: str) -> ParsedArmyList:
+        """Parse ``text`` against BSData ``version`` (a sync status id)."""
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        key = f"{version}:{digest}"
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        result = parse_army_list(text, self._get_index(session, version))
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[key] = result
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._index = None
+            self._index_version = None
+
+
+army_list_parser = ArmyListParser(max_entries=settings.BSDATA_LIST_CACHE_MAX_ENTRIES)
+
+
+async def parse_army_lists(
+    session: Session, texts: Iterable[Optional[str]]
+) -> dict[str, ParsedArmyList]:
+    """Parsed summaries of the given list texts, keyed by text. Skips None.
+
+    Empty while the rules feature is off or before the first sync, so
+    callers can attach the summaries unconditionally.
+    """
+    wanted = {text for text in texts if text}
+    if not wanted or settings_cache.get(session, "rules_enabled", "false") != "true":
+        return {}
+    version = await response_cache.current_version(session)
+    if not version:
+        return {}
+    return {text: army_list_parser.parse(session, text, version) for text in wanted}
@@ -386,6 +386,31 @@ class CoreAbility(AbilityBase, table=True):
     ability_type: str = Field(max_length=30)  # "passive", "command", etc.
 
 
+# =============================================================================
+# Search Index
+# =============================================================================
+
+
+class SearchEntry(SQLModel, table=True):
+    """Denormalized rules search row, rebuilt after every sync.
+
+    PostgreSQL adds a generated ``search_vector`` column (see migrations);
+    SQLite indexes name and body in the ``bsdata_search_fts`` FTS5 table.
+    """
+
+    __tablename__ = "bsdata_search_entries"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    result_type: str = Field(max_length=20)
+    name: str = Field(max_length=200)
+    body: Optional[str] = None  # Effect text / keywords
+    faction_id: Optional[int] = None
+    faction_name: Optional[str] = Field(default=None, max_length=100)
+    unit_id: Optional[int] = None
+    points: Optional[int] = None
+    extra: Optional[str] = Field(default=None, max_length=200)
+
+
 # =============================================================================
 # Sync Metadata
 # =============================================================================
@@ -405,3 +430,50 @@ class BSDataSyncStatus(SQLModel, table=True):
     sync_type: str = Field(max_length=20)  # "full", "incremental"
     status: str = Field(max_length=20, default="success")  # "success", "failed"
     error_message: Optional[str] = None
+
+
+class BSDataSyncJob(SQLModel, table=True):
+    """Background BSData sync run with per-phase progress."""
+
+    __tablename__ = "bsdata_sync_jobs"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    status: str = Field(
+        default="queued", max_length=20
+    )  # queued, running, success, failed
+    force_full: bool = Field(default=False)
+    requested_by: Optional[int] = None  # User id
+    phase: Optional[str] = Field(default=None, max_length=30)  # Current phase
+    phases: str = Field(default="[]")  # JSON: [{name, started_at, duration_seconds}]
+    result: Optional[str] = None  # JSON sync result
+    error_message: Optional[str] = None
+    owner: Optional[str] = Field(default=None, max_length=100)  # "host:pid"
+    # True while queued or running, NULL after; unique, so one active sync
+    active: Optional[bool] = Field(default=True, unique=True, nullable=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class BSDataFileHash(SQLModel, table=True):
+    """Content hash of a synced .cat/.gst file, used for incremental sync."""
+
+    __tablename__ = "bsdata_file_hashes"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    file_name: str = Field(unique=True, max_length=255)
+    content_hash: str = Field(max_length=64)
+    catalog_id: Optional[str] = Field(default=None, max_length=100)
+    synced_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class BSDataSnapshot(SQLModel, table=True):
+    """Rules tables as they were before the latest sync, for rollback."""
+
+    __tablename__ = "bsdata_snapshots"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    commit_hash: str = Field(max_length=40)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    payload: str  # JSON object: table name -> list of rows
@@ -1,8 +1,12 @@
 """BSData XML parser for Age of Sigmar 4th Edition catalog files."""
 
 import json
+import multiprocessing
 import re
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +14,11 @@ from typing import Optional
 NS = {"bs": "http://www.battlescribe.net/schema/catalogueSchema"}
 NS_GST = {"bs": "http://www.battlescribe.net/schema/gameSystemSchema"}
 
+# Clark-notation tags used by the streaming catalog parser
+TAG_SELECTION_ENTRY = "{%s}selectionEntry" % NS["bs"]
+TAG_PROFILE = "{%s}profile" % NS["bs"]
+TAG_CATEGORY_LINK = "{%s}categoryLink" % NS["bs"]
+
 # Profile type IDs from BSData
 PROFILE_TYPE_UNIT = "ff03-376e-972f-8ab2"
 PROFILE_TYPE_MELEE = "9074-76b6-9e2f-81e3"
@@ -69,6 +78,15 @@ HEROIC_TRAIT_LIKE_GROUPS = {"Monstrous Traits", "Mount Traits", "Big Names", "Ma
 # Groups to skip (Path to Glory, internal)
 SKIP_GROUPS = {"Battle Wounds + Scars", "Paths"}
 
+# Catalogs whose name contains any of these are not synced as factions
+SKIPPED_CATALOG_MARKERS = (
+    "Regiments of Renown",
+    "Lores",
+    "Path to Glory",
+    "[LEGENDS]",
+    "Anvil of Apotheosis",
+)
+
 # Grand Alliance mapping
 GRAND_ALLIANCE_FACTIONS = {
     "Order": [
@@ -117,6 +135,13 @@ def get_grand_alliance(faction_name: str) -> str:
     return "Unknown"
 
 
+def is_skipped_catalog(catalog_name: str) -> bool:
+    """Check if a catalog is not a playable faction (lores, legends, etc.)."""
+    return catalog_name.startswith("\u00fe") or any(
+        marker in catalog_name for marker in SKIPPED_CATALOG_MARKERS
+    )
+
+
 def clean_text(text: Optional[str]) -> Optional[str]:
     """Clean BSData text formatting (remove **^^...^^** markers)."""
     if not text:
@@ -175,6 +200,52 @@ def _extract_points(entry: ET.Element, ns: dict) -> Optional[int]:
     return None
 
 
+def iter_unit_entries(cat_path: Path):
+    """Stream the outermost unit selectionEntries of a catalog.
+
+    Each entry is cleared once the caller moves on, so only one unit's
+    subtree is held in memory at a time.
+    """
+    depth = 0
+    for event, element in ET.iterparse(cat_path, events=("start", "end")):
+        if element.tag != TAG_SELECTION_ENTRY or element.get("type") != "unit":
+            continue
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            yield element
+            element.clear()
+
+
+class EntryIndex:
+    """Single-pass index of a selectionEntry subtree.
+
+    Replaces one ``.//`` descendant scan per lookup with dict reads:
+    profiles by typeId and nested selectionEntries by id, both in document
+    order, plus every descendant categoryLink.
+    """
+
+    def __init__(self, entry: ET.Element):
+        self.profiles: dict[str, list[ET.Element]] = defaultdict(list)
+        self.entries: dict[str, ET.Element] = {}
+        self.category_links: list[ET.Element] = []
+        for element in entry.iter():
+            if element.tag == TAG_PROFILE:
+                self.profiles[element.get("typeId", "")].append(element)
+            elif element.tag == TAG_SELECTION_ENTRY and element is not entry:
+                self.entries[element.get("id", "")] = element
+            elif element.tag == TAG_CATEGORY_LINK:
+                self.category_links.append(element)
+
+    def profiles_of(self, type_id: str) -> list[ET.Element]:
+        return self.profiles.get(type_id, [])
+
+    def nested_units(self) -> list[ET.Element]:
+        return [entry for entry in self.entries.values() if entry.get("type") == "unit"]
+
+
 class BSDataParser:
     """Parser for BSData XML catalog files."""
 
@@ -255,67 +326,89 @@ class BSDataParser:
         return result
 
     def parse_catalog(self, cat_path: Path) -> dict:
-        """Parse a single catalog file."""
-        tree = ET.parse(cat_path)
-        root = tree.getroot()
-
-        catalog_name = root.get("name", cat_path.stem)
-        catalog_id = root.get("id", "")
+        """Read a catalog's name and id from its root element only."""
+        root = next(ET.iterparse(cat_path, events=("start",)))[1]
 
         return {
-            "name": catalog_name,
-            "bsdata_id": catalog_id,
+            "name": root.get("name", cat_path.stem),
+            "bsdata_id": root.get("id", ""),
             "file_path": str(cat_path),
         }
 
+    def parse_faction_catalogs(
+        self, faction_catalogs: list[tuple[Path, Optional[Path]]], workers: int = 1
+    ) -> list[dict]:
+        """Parse faction catalog pairs, in a process pool when workers > 1.
+
+        Results are plain dicts in the same order as ``faction_catalogs``.
+        """
+        if workers <= 1 or len(faction_catalogs) <= 1:
+            return [
+                parse_faction_catalog_pair(self.repo_path, main_cat, lib_cat)
+                for main_cat, lib_cat in faction_catalogs
+            ]
+
+        main_cats = [main_cat for main_cat, _ in faction_catalogs]
+        lib_cats = [lib_cat for _, lib_cat in faction_catalogs]
+        # spawn: forking a threaded web worker is not safe
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(faction_catalogs)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            return list(
+                executor.map(
+                    parse_faction_catalog_pair,
+                    repeat(self.repo_path),
+                    main_cats,
+                    lib_cats,
+                )
+            )
+
     def parse_library_catalog(self, lib_path: Path) -> dict:
-        """Parse a library catalog for unit profiles, weapons, abilities."""
-        tree = ET.parse(lib_path)
-        root = tree.getroot()
+        """Parse a library catalog for unit profiles, weapons, abilities.
 
+        Unit entries are streamed with iterparse and indexed once each.
+        """
         result = {
             "units": [],
             "manifestations": [],
         }
 
-        for unit_entry in root.findall(".//bs:selectionEntry[@type='unit']", NS):
-            # Check if this is a manifestation entry (has manifestation profile, no unit profile)
-            has_manif_profile = (
-                unit_entry.find(
-                    ".//bs:profile[@typeId='{}']".format(PROFILE_TYPE_MANIFESTATION), NS
-                )
-                is not None
-            )
-            has_unit_profile = (
-                unit_entry.find(
-                    ".//bs:profile[@typeId='{}']".format(PROFILE_TYPE_UNIT), NS
+        for outer_entry in iter_unit_entries(lib_path):
+            outer_index = EntryIndex(outer_entry)
+            # Nested unit entries are parsed on their own, like the outer one
+            for unit_entry in [outer_entry, *outer_index.nested_units()]:
+                index = (
+                    outer_index if unit_entry is outer_entry else EntryIndex(unit_entry)
                 )
-                is not None
-            )
-
-            if has_manif_profile and not has_unit_profile:
-                manif = self._parse_library_manifestation_entry(unit_entry)
-                if manif:
-                    result["manifestations"].append(manif)
-            else:
-                unit = self._parse_unit_entry(unit_entry)
-                if unit:
-                    result["units"].append(unit)
+                # Manifestation entries have a manifestation profile, no unit profile
+                if index.profiles_of(PROFILE_TYPE_MANIFESTATION) and not (
+                    index.profiles_of(PROFILE_TYPE_UNIT)
+                ):
+                    manif = self._parse_library_manifestation_entry(unit_entry, index)
+                    if manif:
+                        result["manifestations"].append(manif)
+                else:
+                    unit = self._parse_unit_entry(unit_entry, index)
+                    if unit:
+                        result["units"].append(unit)
 
         return result
 
-    def _parse_library_manifestation_entry(self, entry: ET.Element) -> Optional[dict]:
+    def _parse_library_manifestation_entry(
+        self, entry: ET.Element, index: Optional[EntryIndex] = None
+    ) -> Optional[dict]:
         """Parse a manifestation selectionEntry from a Library.cat file.
 
         Extracts manifestation stats, weapons, and abilities.
         """
         entry_name = entry.get("name", "")
+        index = index or EntryIndex(entry)
 
-        manif_profile = entry.find(
-            ".//bs:profile[@typeId='{}']".format(PROFILE_TYPE_MANIFESTATION), NS
-        )
-        if manif_profile is None:
+        manif_profiles = index.profiles_of(PROFILE_TYPE_MANIFESTATION)
+        if not manif_profiles:
             return None
+        manif_profile = manif_profiles[0]
 
         manif = self._parse_manifestation_profile(manif_profile, NS)
         if not manif:
@@ -327,16 +420,12 @@ class BSDataParser:
         # Extract weapons
         weapons = []
         seen_ids = set()
-        for weapon_profile in entry.findall(
-            ".//bs:profile[@typeId='{}']".format(PROFILE_TYPE_MELEE), NS
-        ):
+        for weapon_profile in index.profiles_of(PROFILE_TYPE_MELEE):
             weapon = self._parse_weapon_profile(weapon_profile, NS, "melee")
             if weapon and weapon["bsdata_id"] not in seen_ids:
                 weapons.append(weapon)
                 seen_ids.add(weapon["bsdata_id"])
-        for weapon_profile in entry.findall(
-            ".//bs:profile[@typeId='{}']".format(PROFILE_TYPE_RANGED), NS
-        ):
+        for weapon_profile in index.profiles_of(PROFILE_TYPE_RANGED):
             weapon = self._parse_weapon_profile(weapon_profile, NS, "ranged")
             if weapon and weapon["bsdata_id"] not in seen_ids:
                 weapons.append(weapon)
@@ -349,9 +438,7 @@ class BSDataParser:
             PROFILE_TYPE_ABILITY_ACTIVATED: "activated",
         }
         for profile_type_id, ability_type in ability_type_map.items():
-            for ability_profile in entry.findall(
-                ".//bs:profile[@typeId='{}']".format(profile_type_id), NS
-            ):
+            for ability_profile in index.profiles_of(profile_type_id):
                 ability = self._parse_ability_profile(ability_profile, NS, ability_type)
                 if ability and ability["bsdata_id"] not in seen_ids:
                     abilities.append(ability)
@@ -535,7 +622,9 @@ class BSDataParser:
             "unit_refs": unit_refs,
         }
 
-    def _parse_unit_entry(self, unit_entry: ET.Element) -> Optional[dict]:
+    def _parse_unit_entry(
+        self, unit_entry: ET.Element, index: Optional[EntryIndex] = None
+    ) -> Optional[dict]:
         """Parse a complete unit selectionEntry including weapons and abilities."""
         entry_name = unit_entry.get("name", "")
 
@@ -543,21 +632,18 @@ class BSDataParser:
         if "Anvil of Apotheosis" in entry_name:
             return None
 
+        index = index or EntryIndex(unit_entry)
+
         # Skip Legends units
-        for cat_link in unit_entry.findall(".//bs:categoryLink", NS):
+        for cat_link in index.category_links:
             if cat_link.get("name") == "Legends":
                 return None
 
         # Find the unit profile within this entry
-        unit_profile = None
-        for profile in unit_entry.findall(
-            ".//bs:profile[@typeId='{}']".format(PROFILE_TYPE_UNIT), NS
-        ):
-            unit_profile = profile
-            break
-
-        if unit_profile is None:
+        unit_profiles = index.profiles_of(PROFILE_TYPE_UNIT)
+        if not unit_profiles:
             return None
+        unit_profile = unit_profiles[0]
 
         profile_id = unit_profile.get("id")
         if not profile_id:
@@ -627,18 +713,14 @@ class BSDataParser:
         seen_weapon_ids = set()
 
         # Melee weapons
-        for weapon_profile in unit_entry.findall(
-            ".//bs:profile[@typeId='{}']".format(PROFILE_TYPE_MELEE), NS
-        ):
+        for weapon_profile in index.profiles_of(PROFILE_TYPE_MELEE):
             weapon = self._parse_weapon_profile(weapon_profile, NS, "melee")
             if weapon and weapon["bsdata_id"] not in seen_weapon_ids:
                 weapons.append(weapon)
                 seen_weapon_ids.add(weapon["bsdata_id"])
 
         # Ranged weapons
-        for weapon_profile in unit_entry.findall(
-            ".//bs:profile[@typeId='{}']".format(PROFILE_TYPE_RANGED), NS
-        ):
+        for weapon_profile in index.profiles_of(PROFILE_TYPE_RANGED):
             weapon = self._parse_weapon_profile(weapon_profile, NS, "ranged")
             if weapon and weapon["bsdata_id"] not in seen_weapon_ids:
                 weapons.append(weapon)
@@ -657,9 +739,7 @@ class BSDataParser:
         }
 
         for profile_type_id, ability_type in ability_type_map.items():
-            for ability_profile in unit_entry.findall(
-                ".//bs:profile[@typeId='{}']".format(profile_type_id), NS
-            ):
+            for ability_profile in index.profiles_of(profile_type_id):
                 ability = self._parse_ability_profile(ability_profile, NS, ability_type)
                 if ability and ability["bsdata_id"] not in seen_ability_ids:
                     abilities.append(ability)
@@ -1322,3 +1402,23 @@ class BSDataParser:
             "effect": effect,
             "keywords": _keywords_to_json(keywords_raw),
         }
+
+
+def parse_faction_catalog_pair(
+    repo_path: Path, main_cat: Path, lib_cat: Optional[Path]
+) -> dict:
+    """Parse a faction's main and library catalogs (process pool entry point)."""
+    parser = BSDataParser(repo_path)
+    catalog = parser.parse_catalog(main_cat)
+    if is_skipped_catalog(catalog["name"]):
+        return {"catalog": catalog, "main": None, "library": None}
+
+    return {
+        "catalog": catalog,
+        "main": parser.parse_faction_main_catalog(main_cat),
+        "library": (
+            parser.parse_library_catalog(lib_cat)
+            if lib_cat and lib_cat.exists()
+            else None
+        ),
+    }
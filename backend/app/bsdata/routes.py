@@ -1,12 +1,17 @@
 """BSData API routes."""
 
+import json
 from typing import Optional
 
+from app.bsdata.cache import cached_response, response_cache
+from app.bsdata.jobs import SyncAlreadyRunning, SyncJobRunner, get_sync_job_runner
+from app.bsdata.lists import army_list_parser
 from app.bsdata.models import (
     Artefact,
     BattleFormation,
     BattleTacticCard,
     BattleTrait,
+    BSDataSyncJob,
     BSDataSyncStatus,
     CoreAbility,
     Faction,
@@ -26,6 +31,7 @@ from app.bsdata.models import (
     Weapon,
 )
 from app.bsdata.schemas import (
+    ArmyListParseRequest,
     ArtefactResponse,
     BattleFormationResponse,
     BattleTacticCardResponse,
@@ -38,6 +44,7 @@ from app.bsdata.schemas import (
     HeroicTraitResponse,
     ManifestationLoreResponse,
     ManifestationResponse,
+    ParsedArmyList,
     PrayerLoreResponse,
     PrayerResponse,
     RegimentOfRenownResponse,
@@ -46,6 +53,7 @@ from app.bsdata.schemas import (
     SearchResultItem,
     SpellLoreResponse,
     SpellResponse,
+    SyncJobResponse,
     SyncResultResponse,
     SyncStatusResponse,
     UnitAbilityResponse,
@@ -53,12 +61,14 @@ from app.bsdata.schemas import (
     UnitListItem,
     WeaponResponse,
 )
-from app.bsdata.sync import BSDataSync
+from app.bsdata.search import query_search_index
 from app.core.deps import get_current_user, require_rules_enabled
-from app.db import get_session
+from app.db import get_async_session, get_session
 from app.users.models import User
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(
     prefix="/bsdata", tags=["bsdata"], dependencies=[Depends(require_rules_enabled)]
@@ -66,17 +76,19 @@ router = APIRouter(
 
 
 @router.get("/grand-alliances", response_model=list[GrandAllianceResponse])
-async def list_grand_alliances(session: Session = Depends(get_session)):
+@cached_response(list[GrandAllianceResponse])
+async def list_grand_alliances(session: AsyncSession = Depends(get_async_session)):
     """List all grand alliances."""
-    alliances = session.exec(select(GrandAlliance)).all()
+    alliances = (await session.exec(select(GrandAlliance))).all()
     return alliances
 
 
 @router.get("/factions", response_model=list[FactionListItem])
+@cached_response(list[FactionListItem])
 async def list_factions(
     grand_alliance: Optional[str] = None,
     include_aor: bool = False,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List all factions with unit counts. AoR factions excluded by default."""
     query = (
@@ -100,16 +112,18 @@ async def list_factions(
     if grand_alliance:
         query = query.where(GrandAlliance.name == grand_alliance)
 
-    results = session.exec(query).all()
+    results = (await session.exec(query)).all()
 
     items = []
     for row in results:
         units_count = row.units_count or 0
         # AoR factions have units linked via junction table, not direct
         if row.is_aor:
-            units_count = session.exec(
-                select(func.count(UnitFaction.id)).where(
-                    UnitFaction.faction_id == row.id
+            units_count = (
+                await session.exec(
+                    select(func.count(UnitFaction.id)).where(
+                        UnitFaction.faction_id == row.id
+                    )
                 )
             ).one()
         items.append(
@@ -126,26 +140,43 @@ async def list_factions(
 
 
 @router.get("/factions/{faction_id}", response_model=FactionDetail)
-async def get_faction(faction_id: int, session: Session = Depends(get_session)):
+@cached_response(FactionDetail)
+async def get_faction(
+    faction_id: int, session: AsyncSession = Depends(get_async_session)
+):
     """Get faction details with counts."""
-    faction = session.get(Faction, faction_id)
+    faction = await session.get(
+        Faction, faction_id, options=[selectinload(Faction.grand_alliance)]
+    )
     if not faction:
         raise HTTPException(status_code=404, detail="Faction not found")
 
-    units_count = session.exec(
-        select(func.count(Unit.id)).where(Unit.faction_id == faction_id)
+    units_count = (
+        await session.exec(
+            select(func.count(Unit.id)).where(Unit.faction_id == faction_id)
+        )
     ).one()
 
-    battle_traits_count = session.exec(
-        select(func.count(BattleTrait.id)).where(BattleTrait.faction_id == faction_id)
+    battle_traits_count = (
+        await session.exec(
+            select(func.count(BattleTrait.id)).where(
+                BattleTrait.faction_id == faction_id
+            )
+        )
     ).one()
 
-    heroic_traits_count = session.exec(
-        select(func.count(HeroicTrait.id)).where(HeroicTrait.faction_id == faction_id)
+    heroic_traits_count = (
+        await session.exec(
+            select(func.count(HeroicTrait.id)).where(
+                HeroicTrait.faction_id == faction_id
+            )
+        )
     ).one()
 
-    artefacts_count = session.exec(
-        select(func.count(Artefact.id)).where(Artefact.faction_id == faction_id)
+    artefacts_count = (
+        await session.exec(
+            select(func.count(Artefact.id)).where(Artefact.faction_id == faction_id)
+        )
     ).one()
 
     return FactionDetail(
@@ -166,26 +197,31 @@ async def get_faction(faction_id: int, session: Session = Depends(get_session)):
 
 
 @router.get("/factions/{faction_id}/units", response_model=list[UnitListItem])
+@cached_response(list[UnitListItem])
 async def list_faction_units(
     faction_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List all units in a faction. AoR factions use junction table."""
-    faction = session.get(Faction, faction_id)
+    faction = await session.get(Faction, faction_id)
     if not faction:
         raise HTTPException(status_code=404, detail="Faction not found")
 
     if faction.is_aor:
         # AoR: units linked via junction table
-        units = session.exec(
-            select(Unit)
-            .join(UnitFaction, Unit.id == UnitFaction.unit_id)
-            .where(UnitFaction.faction_id == faction_id)
-            .order_by(Unit.name)
+        units = (
+            await session.exec(
+                select(Unit)
+                .join(UnitFaction, Unit.id == UnitFaction.unit_id)
+                .where(UnitFaction.faction_id == faction_id)
+                .order_by(Unit.name)
+            )
         ).all()
     else:
-        units = session.exec(
-            select(Unit).where(Unit.faction_id == faction_id).order_by(Unit.name)
+        units = (
+            await session.exec(
+                select(Unit).where(Unit.faction_id == faction_id).order_by(Unit.name)
+            )
         ).all()
 
     return [
@@ -211,15 +247,18 @@ async def list_faction_units(
 @router.get(
     "/factions/{faction_id}/battle-traits", response_model=list[BattleTraitResponse]
 )
+@cached_response(list[BattleTraitResponse])
 async def list_faction_battle_traits(
     faction_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List battle traits for a faction."""
-    traits = session.exec(
-        select(BattleTrait)
-        .where(BattleTrait.faction_id == faction_id)
-        .order_by(BattleTrait.name)
+    traits = (
+        await session.exec(
+            select(BattleTrait)
+            .where(BattleTrait.faction_id == faction_id)
+            .order_by(BattleTrait.name)
+        )
     ).all()
     return traits
 
@@ -227,15 +266,18 @@ async def list_faction_battle_traits(
 @router.get(
     "/factions/{faction_id}/heroic-traits", response_model=list[HeroicTraitResponse]
 )
+@cached_response(list[HeroicTraitResponse])
 async def list_faction_heroic_traits(
     faction_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List heroic traits for a faction."""
-    traits = session.exec(
-        select(HeroicTrait)
-        .where(HeroicTrait.faction_id == faction_id)
-        .order_by(HeroicTrait.name)
+    traits = (
+        await session.exec(
+            select(HeroicTrait)
+            .where(HeroicTrait.faction_id == faction_id)
+            .order_by(HeroicTrait.name)
+        )
     ).all()
     return traits
 
@@ -244,29 +286,35 @@ async def list_faction_heroic_traits(
     "/factions/{faction_id}/battle-formations",
     response_model=list[BattleFormationResponse],
 )
+@cached_response(list[BattleFormationResponse])
 async def list_faction_battle_formations(
     faction_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List battle formations for a faction."""
-    formations = session.exec(
-        select(BattleFormation)
-        .where(BattleFormation.faction_id == faction_id)
-        .order_by(BattleFormation.name)
+    formations = (
+        await session.exec(
+            select(BattleFormation)
+            .where(BattleFormation.faction_id == faction_id)
+            .order_by(BattleFormation.name)
+        )
     ).all()
     return formations
 
 
 @router.get("/factions/{faction_id}/artefacts", response_model=list[ArtefactResponse])
+@cached_response(list[ArtefactResponse])
 async def list_faction_artefacts(
     faction_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List artefacts for a faction."""
-    artefacts = session.exec(
-        select(Artefact)
-        .where(Artefact.faction_id == faction_id)
-        .order_by(Artefact.name)
+    artefacts = (
+        await session.exec(
+            select(Artefact)
+            .where(Artefact.faction_id == faction_id)
+            .order_by(Artefact.name)
+        )
     ).all()
     return artefacts
 
@@ -274,6 +322,7 @@ async def list_faction_artefacts(
 @router.get(
     "/factions/{faction_id}/spell-lores", response_model=list[SpellLoreResponse]
 )
+@cached_response(list[SpellLoreResponse])
 async def list_faction_spell_lores(
     faction_id: int,
     session: Session = Depends(get_session),
@@ -306,6 +355,7 @@ async def list_faction_spell_lores(
     "/factions/{faction_id}/manifestation-lores",
     response_model=list[ManifestationLoreResponse],
 )
+@cached_response(list[ManifestationLoreResponse])
 async def list_faction_manifestation_lores(
     faction_id: int,
     session: Session = Depends(get_session),
@@ -342,6 +392,7 @@ async def list_faction_manifestation_lores(
     "/factions/{faction_id}/prayer-lores",
     response_model=list[PrayerLoreResponse],
 )
+@cached_response(list[PrayerLoreResponse])
 async def list_faction_prayer_lores(
     faction_id: int,
     session: Session = Depends(get_session),
@@ -374,6 +425,7 @@ async def list_faction_prayer_lores(
     "/factions/{faction_id}/armies-of-renown",
     response_model=list[FactionListItem],
 )
+@cached_response(list[FactionListItem])
 async def list_faction_armies_of_renown(
     faction_id: int,
     session: Session = Depends(get_session),
@@ -412,6 +464,7 @@ async def list_faction_armies_of_renown(
 
 
 @router.get("/manifestation-lores", response_model=list[ManifestationLoreResponse])
+@cached_response(list[ManifestationLoreResponse])
 async def list_manifestation_lores(session: Session = Depends(get_session)):
     """List universal manifestation lores (not faction-specific)."""
     lores = session.exec(
@@ -448,7 +501,7 @@ async def list_units(
     faction_id: Optional[int] = None,
     limit: int = Query(default=50, le=200),
     offset: int = 0,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """List units with optional search and filtering."""
     query = select(Unit, Faction.name.label("faction_name")).join(Faction)
@@ -460,7 +513,7 @@ async def list_units(
         query = query.where(Unit.faction_id == faction_id)
 
     query = query.order_by(Unit.name).offset(offset).limit(limit)
-    results = session.exec(query).all()
+    results = (await session.exec(query)).all()
 
     return [
         UnitListItem(
@@ -483,16 +536,19 @@ async def list_units(
 
 
 @router.get("/units/{unit_id}", response_model=UnitDetail)
-async def get_unit(unit_id: int, session: Session = Depends(get_session)):
+@cached_response(UnitDetail)
+async def get_unit(unit_id: int, session: AsyncSession = Depends(get_async_session)):
     """Get unit details with weapons and abilities."""
-    unit = session.get(Unit, unit_id)
+    unit = await session.get(Unit, unit_id, options=[selectinload(Unit.faction)])
     if not unit:
         raise HTTPException(status_code=404, detail="Unit not found")
 
-    weapons = session.exec(select(Weapon).where(Weapon.unit_id == unit_id)).all()
+    weapons = (
+        await session.exec(select(Weapon).where(Weapon.unit_id == unit_id))
+    ).all()
 
-    abilities = session.exec(
-        select(UnitAbility).where(UnitAbility.unit_id == unit_id)
+    abilities = (
+        await session.exec(select(UnitAbility).where(UnitAbility.unit_id == unit_id))
     ).all()
 
     return UnitDetail(
@@ -522,7 +578,7 @@ async def get_unit(unit_id: int, session: Session = Depends(get_session)):
 async def search_units(
     q: str = Query(..., min_length=2),
     limit: int = Query(default=20, le=100),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Search units by name."""
     query = (
@@ -532,7 +588,7 @@ async def search_units(
         .order_by(Unit.name)
         .limit(limit)
     )
-    results = session.exec(query).all()
+    results = (await session.exec(query)).all()
 
     return [
         UnitListItem(
@@ -555,24 +611,27 @@ async def search_units(
 
 
 @router.get("/regiments-of-renown", response_model=list[RegimentOfRenownResponse])
-async def list_regiments_of_renown(session: Session = Depends(get_session)):
+@cached_response(list[RegimentOfRenownResponse])
+async def list_regiments_of_renown(session: AsyncSession = Depends(get_async_session)):
     """List all Regiments of Renown."""
-    regiments = session.exec(
-        select(RegimentOfRenown).order_by(RegimentOfRenown.name)
+    regiments = (
+        await session.exec(select(RegimentOfRenown).order_by(RegimentOfRenown.name))
     ).all()
     return regiments
 
 
 @router.get("/manifestations", response_model=list[ManifestationResponse])
-async def list_manifestations(session: Session = Depends(get_session)):
+@cached_response(list[ManifestationResponse])
+async def list_manifestations(session: AsyncSession = Depends(get_async_session)):
     """List all manifestations (endless spells, invocations)."""
-    manifestations = session.exec(
-        select(Manifestation).order_by(Manifestation.name)
+    manifestations = (
+        await session.exec(select(Manifestation).order_by(Manifestation.name))
     ).all()
     return manifestations
 
 
 @router.get("/spell-lores", response_model=list[SpellLoreResponse])
+@cached_response(list[SpellLoreResponse])
 async def list_spell_lores(session: Session = Depends(get_session)):
     """List all spell lores with their spells."""
     lores = session.exec(select(SpellLore).order_by(SpellLore.name)).all()
@@ -595,187 +654,45 @@ async def list_spell_lores(session: Session = Depends(get_session)):
 
 
 @router.get("/battle-tactics", response_model=list[BattleTacticCardResponse])
-async def list_battle_tactics(session: Session = Depends(get_session)):
+@cached_response(list[BattleTacticCardResponse])
+async def list_battle_tactics(session: AsyncSession = Depends(get_async_session)):
     """List all battle tactic cards."""
-    cards = session.exec(select(BattleTacticCard).order_by(BattleTacticCard.name)).all()
+    cards = (
+        await session.exec(select(BattleTacticCard).order_by(BattleTacticCard.name))
+    ).all()
     return cards
 
 
 @router.get("/core-abilities", response_model=list[CoreAbilityResponse])
-async def list_core_abilities(session: Session = Depends(get_session)):
+@cached_response(list[CoreAbilityResponse])
+async def list_core_abilities(session: AsyncSession = Depends(get_async_session)):
     """List all core abilities."""
-    abilities = session.exec(select(CoreAbility).order_by(CoreAbility.name)).all()
+    abilities = (
+        await session.exec(select(CoreAbility).order_by(CoreAbility.name))
+    ).all()
     return abilities
 
 
 @router.get("/search", response_model=list[SearchResultItem])
 async def search_rules(
     query: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(default=50, le=100),
     session: Session = Depends(get_session),
 ):
-    """Search across units, abilities, traits, spells, prayers."""
-    pattern = f"%{query}%"
-    results: list[SearchResultItem] = []
-
-    # Units (exclude AoR to avoid duplicates)
-    units = session.exec(
-        select(
-            Unit.id,
-            Unit.name,
-            Unit.points,
-            Faction.name.label("faction_name"),
-            Faction.id.label("faction_id"),
-        )
-        .join(Faction, Unit.faction_id == Faction.id)
-        .where(Unit.name.ilike(pattern))
-        .where(Faction.is_aor == False)
-        .order_by(Unit.name)
-        .limit(20)
-    ).all()
-    for row in units:
-        results.append(
-            SearchResultItem(
-                result_type="unit",
-                name=row.name,
-                faction_name=row.faction_name,
-                faction_id=row.faction_id,
-                unit_id=row.id,
-                points=row.points,
-            )
-        )
-
-    # Unit Abilities (exclude AoR to avoid duplicates)
-    abilities = session.exec(
-        select(
-            UnitAbility.name,
-            UnitAbility.ability_type,
-            Unit.id.label("unit_id"),
-            Unit.name.label("unit_name"),
-            Faction.name.label("faction_name"),
-            Faction.id.label("faction_id"),
-        )
-        .join(Unit, UnitAbility.unit_id == Unit.id)
-        .join(Faction, Unit.faction_id == Faction.id)
-        .where(UnitAbility.name.ilike(pattern))
-        .where(Faction.is_aor == False)
-        .order_by(UnitAbility.name)
-        .limit(15)
-    ).all()
-    for row in abilities:
-        results.append(
-            SearchResultItem(
-                result_type="ability",
-                name=row.name,
-                faction_name=row.faction_name,
-                faction_id=row.faction_id,
-                unit_id=row.unit_id,
-                extra=row.unit_name,
-            )
-        )
+    """Search across units, abilities, traits, spells, prayers by relevance."""
+    rows = query_search_index(session, query, limit)
+    return [SearchResultItem(**row) for row in rows]
 
-    # Battle Traits
-    traits = session.exec(
-        select(
-            BattleTrait.name,
-            Faction.name.label("faction_name"),
-            Faction.id.label("faction_id"),
-        )
-        .join(Faction, BattleTrait.faction_id == Faction.id)
-        .where(BattleTrait.name.ilike(pattern))
-        .order_by(BattleTrait.name)
-        .limit(10)
-    ).all()
-    for row in traits:
-        results.append(
-            SearchResultItem(
-                result_type="battle_trait",
-                name=row.name,
-                faction_name=row.faction_name,
-                faction_id=row.faction_id,
-            )
-        )
 
-    # Heroic Traits
-    heroic = session.exec(
-        select(
-            HeroicTrait.name,
-            Faction.name.label("faction_name"),
-            Faction.id.label("faction_id"),
-        )
-        .join(Faction, HeroicTrait.faction_id == Faction.id)
-        .where(HeroicTrait.name.ilike(pattern))
-        .order_by(HeroicTrait.name)
-        .limit(10)
-    ).all()
-    for row in heroic:
-        results.append(
-            SearchResultItem(
-                result_type="heroic_trait",
-                name=row.name,
-                faction_name=row.faction_name,
-                faction_id=row.faction_id,
-            )
-        )
-
-    # Artefacts
-    artefacts = session.exec(
-        select(
-            Artefact.name,
-            Faction.name.label("faction_name"),
-            Faction.id.label("faction_id"),
-        )
-        .join(Faction, Artefact.faction_id == Faction.id)
-        .where(Artefact.name.ilike(pattern))
-        .order_by(Artefact.name)
-        .limit(10)
-    ).all()
-    for row in artefacts:
-        results.append(
-            SearchResultItem(
-                result_type="artefact",
-                name=row.name,
-                faction_name=row.faction_name,
-                faction_id=row.faction_id,
-            )
-        )
-
-    # Spells
-    spells = session.exec(
-        select(Spell.name, SpellLore.name.label("lore_name"), SpellLore.faction_id)
-        .join(SpellLore, Spell.lore_id == SpellLore.id)
-        .where(Spell.name.ilike(pattern))
-        .order_by(Spell.name)
-        .limit(10)
-    ).all()
-    for row in spells:
-        results.append(
-            SearchResultItem(
-                result_type="spell",
-                name=row.name,
-                faction_id=row.faction_id,
-                extra=row.lore_name,
-            )
-        )
-
-    # Prayers
-    prayers = session.exec(
-        select(Prayer.name, PrayerLore.name.label("lore_name"), PrayerLore.faction_id)
-        .join(PrayerLore, Prayer.lore_id == PrayerLore.id)
-        .where(Prayer.name.ilike(pattern))
-        .order_by(Prayer.name)
-        .limit(10)
-    ).all()
-    for row in prayers:
-        results.append(
-            SearchResultItem(
-                result_type="prayer",
-                name=row.name,
-                faction_id=row.faction_id,
-                extra=row.lore_name,
-            )
-        )
-
-    return results
+@router.post("/lists/parse", response_model=ParsedArmyList)
+async def parse_list(
+    data: ArmyListParseRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """Parse a pasted army list and validate its points against BSData."""
+    version = await response_cache.current_version(session)
+    return army_list_parser.parse(session, data.army_list, version)
 
 
 @router.get("/status", response_model=Optional[SyncStatusResponse])
@@ -800,17 +717,75 @@ async def get_sync_status(session: Session = Depends(get_session)):
     )
 
 
-@router.post("/sync", response_model=SyncResultResponse)
+def _sync_job_response(job: BSDataSyncJob) -> SyncJobResponse:
+    return SyncJobResponse(
+        id=job.id,
+        status=job.status,
+        force_full=job.force_full,
+        phase=job.phase,
+        phases=json.loads(job.phases),
+        result=json.loads(job.result) if job.result else None,
+        error=job.error_message,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+@router.post("/sync", response_model=SyncJobResponse, status_code=202)
 async def trigger_sync(
     force_full: bool = False,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
+    runner: SyncJobRunner = Depends(get_sync_job_runner),
+):
+    """Start a BSData sync in the background (admin only)."""
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    try:
+        job = runner.enqueue(
+            session, force_full=force_full, requested_by=current_user.id
+        )
+    except SyncAlreadyRunning as error:
+        raise HTTPException(status_code=409, detail=str(error))
+
+    return _sync_job_response(job)
+
+
+@router.get("/sync/jobs/{job_id}", response_model=SyncJobResponse)
+async def get_sync_job(
+    job_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """Progress of a background sync job (admin only)."""
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    job = session.get(BSDataSyncJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Sync job not found")
+    session.refresh(job)
+
+    return _sync_job_response(job)
+
+
+@router.post("/sync/rollback", response_model=SyncResultResponse)
+async def rollback_sync(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+    runner: SyncJobRunner = Depends(get_sync_job_runner),
 ):
-    """Trigger BSData sync (admin only)."""
+    """Restore the BSData snapshot taken before the last sync (admin only)."""
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    sync_service = BSDataSync(session)
-    result = sync_service.sync(force_full=force_full)
+    try:
+        result = runner.rollback(session, requested_by=current_user.id)
+    except SyncAlreadyRunning as error:
+        raise HTTPException(status_code=409, detail=str(error))
+    if result.get("status") == "failed":
+        raise HTTPException(status_code=409, detail=result["error"])
 
     return SyncResultResponse(**result)
@@ -4,7 +4,7 @@ import json
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 # =============================================================================
 # Shared Base
@@ -373,6 +373,26 @@ class SyncResultResponse(BaseModel):
     message: Optional[str] = None
     error: Optional[str] = None
     status: Optional[str] = None
+    changed_files: Optional[list[str]] = None  # Incremental syncs only
+
+
+class SyncJobPhase(BaseModel):
+    name: str
+    started_at: datetime
+    duration_seconds: Optional[float] = None  # None while running
+
+
+class SyncJobResponse(BaseModel):
+    id: int
+    status: str  # queued, running, success, failed
+    force_full: bool
+    phase: Optional[str] = None
+    phases: list[SyncJobPhase] = []
+    result: Optional[SyncResultResponse] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
 
 
 # =============================================================================
@@ -483,3 +503,33 @@ class SearchResultItem(BaseModel):
     unit_id: Optional[int] = None
     points: Optional[int] = None
     extra: Optional[str] = None  # e.g. ability type, phase
+
+
+# =============================================================================
+# Army List Parsing
+# =============================================================================
+
+
+class ArmyListParseRequest(BaseModel):
+    army_list: str = Field(min_length=1, max_length=10000)
+
+
+class ParsedListUnit(BaseModel):
+    line: int
+    name: str  # As written in the list
+    unit_id: int
+    matched_name: str  # BSData unit name
+    exact_match: bool
+    quantity: Optional[int] = None
+    points: Optional[int] = None  # Listed points, else BSData points
+    bsdata_points: Optional[int] = None
+
+
+class ParsedArmyList(BaseModel):
+    faction: Optional[str] = None
+    units: list[ParsedListUnit] = []
+    points_total: int = 0
+    declared_points: Optional[int] = None
+    points_limit: Optional[int] = None
+    errors: list[str] = []
+    valid: bool = True
@@ -0,0 +1,207 @@
+"""Unified rules search index.
+
+Every searchable rule (unit, ability, trait, artefact, spell, prayer) is
+copied into ``bsdata_search_entries`` after a sync so /search runs a single
+ranked query. PostgreSQL matches a weighted ``tsvector`` plus a trigram
+index on names; SQLite uses an FTS5 trigram table over the same rows.
+"""
+
+from app.bsdata.models import (
+    Artefact,
+    BattleTrait,
+    Faction,
+    HeroicTrait,
+    Prayer,
+    PrayerLore,
+    SearchEntry,
+    Spell,
+    SpellLore,
+    Unit,
+    UnitAbility,
+)
+from sqlalchemy import Select, delete, func, insert, literal, null, text
+from sqlmodel import Session, select
+
+SEARCH_FTS_TABLE = "bsdata_search_fts"
+
+# FTS5 trigram tokens need at least three characters
+_MIN_FTS_QUERY_LENGTH = 3
+
+_INDEX_COLUMNS = (
+    "result_type",
+    "name",
+    "body",
+    "faction_id",
+    "faction_name",
+    "unit_id",
+    "points",
+    "extra",
+)
+
+_RESULT_COLUMNS = (
+    "e.result_type, e.name, e.faction_name, e.faction_id, e.unit_id, e.points, "
+    "e.extra"
+)
+
+_POSTGRES_SEARCH = text(
+    f"""
+    SELECT {_RESULT_COLUMNS}
+    FROM bsdata_search_entries e,
+         websearch_to_tsquery('english', :query) q
+    WHERE e.search_vector @@ q OR e.name ILIKE :pattern ESCAPE '\\'
+    ORDER BY ts_rank_cd(e.search_vector, q) + similarity(e.name, :query) DESC,
+             e.name
+    LIMIT :limit
+    """
+)
+
+# bm25() is lower-is-better; name matches weigh ten times the body text
+_SQLITE_FTS_SEARCH = text(
+    f"""
+    SELECT {_RESULT_COLUMNS}
+    FROM {SEARCH_FTS_TABLE}
+    JOIN bsdata_search_entries e ON e.id = {SEARCH_FTS_TABLE}.rowid
+    WHERE {SEARCH_FTS_TABLE} MATCH :match
+    ORDER BY bm25({SEARCH_FTS_TABLE}, 10.0, 1.0), e.name
+    LIMIT :limit
+    """
+)
+
+_NAME_SEARCH = text(
+    f"""
+    SELECT {_RESULT_COLUMNS}
+    FROM bsdata_search_entries e
+    WHERE lower(e.name) LIKE lower(:pattern) ESCAPE '\\'
+    ORDER BY length(e.name), e.name
+    LIMIT :limit
+    """
+)
+
+
+def _index_sources() -> list[Select]:
+    """One SELECT per result type, in ``_INDEX_COLUMNS`` order."""
+    # AoR units duplicate their parent faction's units, so they are skipped
+    units = (
+        select(
+            literal("unit"),
+            Unit.name,
+            Unit.keywords,
+            Faction.id,
+            Faction.name,
+            Unit.id,
+            Unit.points,
+            null(),
+        )
+        .join(Faction, Unit.faction_id == Faction.id)
+        .where(Faction.is_aor == False)
+    )
+    abilities = (
+        select(
+            literal("ability"),
+            UnitAbility.name,
+            UnitAbility.effect,
+            Faction.id,
+            Faction.name,
+            Unit.id,
+            null(),
+            Unit.name,
+        )
+        .join(Unit, UnitAbility.unit_id == Unit.id)
+        .join(Faction, Unit.faction_id == Faction.id)
+        .where(Faction.is_aor == False)
+    )
+    faction_rules = [
+        select(
+            literal(result_type),
+            model.name,
+            model.effect,
+            Faction.id,
+            Faction.name,
+            null(),
+            null(),
+            null(),
+        ).join(Faction, model.faction_id == Faction.id)
+        for result_type, model in (
+            ("battle_trait", BattleTrait),
+            ("heroic_trait", HeroicTrait),
+            ("artefact", Artefact),
+        )
+    ]
+    lore_rules = [
+        select(
+            literal(result_type),
+            model.name,
+            model.effect,
+            lore.faction_id,
+            null(),
+            null(),
+            null(),
+            lore.name,
+        ).join(lore, model.lore_id == lore.id)
+        for result_type, model, lore in (
+            ("spell", Spell, SpellLore),
+            ("prayer", Prayer, PrayerLore),
+        )
+    ]
+    return [units, abilities, *faction_rules, *lore_rules]
+
+
+def _ensure_sqlite_fts(session: Session) -> None:
+    session.execute(
+        text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} USING fts5("
+            "name, body, content='bsdata_search_entries', content_rowid='id', "
+            "tokenize='trigram')"
+        )
+    )
+
+
+def rebuild_search_index(session: Session) -> int:
+    """Repopulate the search index from the BSData tables. Does not commit."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        _ensure_sqlite_fts(session)
+
+    session.execute(delete(SearchEntry))
+    for source in _index_sources():
+        session.execute(insert(SearchEntry).from_select(_INDEX_COLUMNS, source))
+
+    if dialect == "sqlite":
+        session.execute(
+            text(
+                f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}) VALUES('rebuild')"
+            )
+        )
+    return session.exec(select(func.count(SearchEntry.id))).one()
+
+
+def _like_pattern(query: str) -> str:
+    """Substring LIKE pattern with the user's wildcards escaped."""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def query_search_index(session: Session, query: str, limit: int) -> list[dict]:
+    """
+    Ranked search over names and effect text, most relevant first.
+
+    The index is built by syncs and migrations only; before the first one
+    there is nothing to search (and on SQLite no FTS table yet).
+    """
+    if session.exec(select(SearchEntry.id).limit(1)).first() is None:
+        return []
+
+    pattern = _like_pattern(query)
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = _POSTGRES_SEARCH
+        params = {"query": query, "pattern": pattern}
+    elif dialect == "sqlite" and len(query) >= _MIN_FTS_QUERY_LENGTH:
+        statement = _SQLITE_FTS_SEARCH
+        params = {"match": '"' + query.replace('"', '""') + '"'}
+    else:
+        statement = _NAME_SEARCH
+        params = {"pattern": pattern}
+
+    rows = session.execute(statement, {**params, "limit": limit}).mappings()
+    return [dict(row) for row in rows]
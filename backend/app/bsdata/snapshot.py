@@ -0,0 +1,200 @@
+"""Previous-snapshot storage for the BSData rules tables.
+
+Right before a sync rewrites rules rows, the rows it is about to replace
+are stored as a JSON snapshot: every table for a full sync, only the
+affected factions (and Regiments of Renown) for an incremental one.
+Rolling back swaps the live rows in the same scope with the snapshot in one
+transaction, keeping the replaced rows so the rollback can itself be undone.
+At most ``BSDATA_SNAPSHOTS_KEPT`` snapshots are stored.
+"""
+
+import json
+from typing import NamedTuple, Optional
+
+from app.bsdata.models import (
+    Artefact,
+    BattleFormation,
+    BattleTacticCard,
+    BattleTrait,
+    BSDataSnapshot,
+    CoreAbility,
+    Faction,
+    GrandAlliance,
+    HeroicTrait,
+    Manifestation,
+    ManifestationLore,
+    Prayer,
+    PrayerLore,
+    RegimentOfRenown,
+    RoRUnit,
+    Spell,
+    SpellLore,
+    Unit,
+    UnitAbility,
+    UnitFaction,
+    Weapon,
+)
+from app.config import settings
+from sqlalchemy import delete, insert, or_, true
+from sqlmodel import Session, select
+
+# Parents before children; deletes run in reverse
+SNAPSHOT_MODELS = [
+    GrandAlliance,
+    Faction,
+    Unit,
+    UnitFaction,
+    Weapon,
+    UnitAbility,
+    BattleTrait,
+    BattleFormation,
+    HeroicTrait,
+    Artefact,
+    RegimentOfRenown,
+    RoRUnit,
+    SpellLore,
+    Spell,
+    PrayerLore,
+    Prayer,
+    ManifestationLore,
+    Manifestation,
+    BattleTacticCard,
+    CoreAbility,
+]
+
+# Rows per executemany statement when restoring
+_RESTORE_BATCH_SIZE = 1000
+
+
+class SnapshotScope(NamedTuple):
+    """Rows a snapshot covers; ``factions`` None means every rules table."""
+
+    factions: Optional[list[str]] = None  # Catalog bsdata ids
+    regiments_of_renown: bool = False
+
+
+FULL_SCOPE = SnapshotScope()
+
+
+def _scope_faction_ids(session: Session, bsdata_ids: list[str]) -> set[int]:
+    """Ids of the factions with these catalog ids and their Armies of Renown."""
+    faction_ids = set(
+        session.exec(select(Faction.id).where(Faction.bsdata_id.in_(bsdata_ids))).all()
+    )
+    if faction_ids:
+        faction_ids.update(
+            session.exec(
+                select(Faction.id).where(Faction.parent_faction_id.in_(faction_ids))
+            ).all()
+        )
+    return faction_ids
+
+
+def _scope_filters(faction_ids: set[int], regiments_of_renown: bool) -> dict:
+    """Model -> condition selecting the rows owned by the given factions."""
+    unit_ids = select(Unit.id).where(Unit.faction_id.in_(faction_ids))
+    filters = {
+        Faction: Faction.id.in_(faction_ids),
+        Unit: Unit.faction_id.in_(faction_ids),
+        UnitFaction: or_(
+            UnitFaction.unit_id.in_(unit_ids),
+            UnitFaction.faction_id.in_(faction_ids),
+        ),
+        Weapon: Weapon.unit_id.in_(unit_ids),
+        UnitAbility: UnitAbility.unit_id.in_(unit_ids),
+    }
+    for model in (BattleTrait, BattleFormation, HeroicTrait, Artefact):
+        filters[model] = model.faction_id.in_(faction_ids)
+    for lore_model, entry_model in (
+        (SpellLore, Spell),
+        (PrayerLore, Prayer),
+        (ManifestationLore, Manifestation),
+    ):
+        filters[lore_model] = lore_model.faction_id.in_(faction_ids)
+        filters[entry_model] = entry_model.lore_id.in_(
+            select(lore_model.id).where(lore_model.faction_id.in_(faction_ids))
+        )
+    if regiments_of_renown:
+        filters[RegimentOfRenown] = true()
+        filters[RoRUnit] = true()
+    return filters
+
+
+def _filters_for(
+    session: Session, scope: SnapshotScope, extra_faction_ids: set[int] = frozenset()
+) -> dict:
+    if scope.factions is None:
+        return {model: true() for model in SNAPSHOT_MODELS}
+    faction_ids = _scope_faction_ids(session, scope.factions) | extra_faction_ids
+    return _scope_filters(faction_ids, scope.regiments_of_renown)
+
+
+def dump_rules_tables(
+    session: Session, scope: SnapshotScope = FULL_SCOPE
+) -> dict[str, list[dict]]:
+    """Rows of the rules tables in ``scope``, ordered by id."""
+    filters = _filters_for(session, scope)
+    return {
+        model.__tablename__: [
+            dict(row)
+            for row in session.execute(
+                select(model.__table__)
+                .where(filters[model])
+                .order_by(model.__table__.c.id)
+            ).mappings()
+        ]
+        for model in SNAPSHOT_MODELS
+        if model in filters
+    }
+
+
+def save_snapshot(
+    session: Session, commit_hash: str, scope: SnapshotScope = FULL_SCOPE
+) -> BSDataSnapshot:
+    """Store the rules rows in ``scope`` and prune old snapshots. Does not commit."""
+    snapshot = BSDataSnapshot(
+        commit_hash=commit_hash,
+        payload=json.dumps(
+            {"scope": scope._asdict(), "tables": dump_rules_tables(session, scope)}
+        ),
+    )
+    session.add(snapshot)
+    session.flush()
+
+    kept = select(BSDataSnapshot.id).order_by(BSDataSnapshot.id.desc())
+    kept = kept.limit(max(settings.BSDATA_SNAPSHOTS_KEPT, 1))
+    session.execute(delete(BSDataSnapshot).where(BSDataSnapshot.id.not_in(kept)))
+    return snapshot
+
+
+def get_snapshot(session: Session) -> Optional[BSDataSnapshot]:
+    return session.exec(
+        select(BSDataSnapshot).order_by(BSDataSnapshot.id.desc())
+    ).first()
+
+
+def load_snapshot(
+    snapshot: BSDataSnapshot,
+) -> tuple[SnapshotScope, dict[str, list[dict]]]:
+    payload = json.loads(snapshot.payload)
+    return SnapshotScope(**payload["scope"]), payload["tables"]
+
+
+def restore_rules_tables(
+    session: Session,
+    tables: dict[str, list[dict]],
+    scope: SnapshotScope = FULL_SCOPE,
+) -> None:
+    """Replace the rows in ``scope`` with the given rows, keeping their ids."""
+    # Factions in the snapshot may since have been deleted or re-keyed
+    snapshot_faction_ids = {row["id"] for row in tables.get(Faction.__tablename__, [])}
+    filters = _filters_for(session, scope, snapshot_faction_ids)
+    for model in reversed(SNAPSHOT_MODELS):
+        if model in filters:
+            session.execute(delete(model).where(filters[model]))
+    for model in SNAPSHOT_MODELS:
+        rows = tables.get(model.__tablename__, [])
+        for start in range(0, len(rows), _RESTORE_BATCH_SIZE):
+            session.execute(
+                insert(model.__table__), rows[start : start + _RESTORE_BATCH_SIZE]
+            )
@@ -1,19 +1,28 @@
 """BSData synchronization service using GitHub API (no git required)."""
 
-import io
+import argparse
+import hashlib
 import json
 import logging
+import os
+import re
+import shutil
 import tarfile
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Optional
 
 import httpx
+from app.bsdata.cache import response_cache
 from app.bsdata.models import (
     Artefact,
     BattleFormation,
     BattleTacticCard,
     BattleTrait,
+    BSDataFileHash,
+    BSDataSnapshot,
     BSDataSyncStatus,
     CoreAbility,
     Faction,
@@ -32,7 +41,20 @@ from app.bsdata.models import (
     UnitFaction,
     Weapon,
 )
-from app.bsdata.parser import BSDataParser, get_grand_alliance
+from app.bsdata.parser import BSDataParser, get_grand_alliance, is_skipped_catalog
+from app.bsdata.search import rebuild_search_index
+from app.bsdata.snapshot import (
+    FULL_SCOPE,
+    SnapshotScope,
+    get_snapshot,
+    load_snapshot,
+    restore_rules_tables,
+    save_snapshot,
+)
+from app.bsdata.writer import BulkWriter, Ref
+from app.config import settings
+from app.core.metrics import BSDATA_SYNC_DURATION
+from sqlalchemy import delete, func, or_
 from sqlmodel import Session, select
 
 logger = logging.getLogger(__name__)
@@ -42,6 +64,24 @@ GITHUB_TARBALL_URL = (
     "https://github.com/BSData/age-of-sigmar-4th/archive/refs/heads/main.tar.gz"
 )
 BSDATA_LOCAL_PATH = Path("/app/bsdata/age-of-sigmar-4th")
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Files every faction draws from; a change to any of them forces a full sync
+SHARED_FILES = {"Age of Sigmar 4.0.gst", "Lores.cat"}
+REGIMENTS_OF_RENOWN_FILE = "Regiments of Renown.cat"
+
+
+class _DigestReader:
+    """File wrapper feeding everything read through a hash."""
+
+    def __init__(self, fileobj: BinaryIO, digest):
+        self.fileobj = fileobj
+        self.digest = digest
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.digest.update(data)
+        return data
 
 
 class BSDataSync:
@@ -57,15 +97,37 @@ class BSDataSync:
         }
     )
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[str], None]] = None,
+        source: Optional[str] = None,
+    ):
         self.session = session
+        # Tarball path or mirror URL; empty means GitHub
+        self.source = source if source is not None else settings.BSDATA_TARBALL_SOURCE
+        # Called with the name of each sync phase as it starts
+        self.progress = progress
+        if workers is None:
+            workers = settings.BSDATA_SYNC_WORKERS
+        # Catalog parsing processes; 1 parses in-process, 0 one per CPU core
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.writer = BulkWriter(session)
         self.repo_path = BSDATA_LOCAL_PATH
         self.parser: Optional[BSDataParser] = None
+        # Commit of the data a sync replaces, recorded on its snapshot
+        self._previous_commit: Optional[str] = None
         self._grand_alliance_cache: dict[str, int] = {}
         self._faction_cache: dict[str, int] = {}
         self._lores_index: dict = {}
         self._manifestation_stats_cache: dict[str, dict] = {}
 
+    def _phase(self, name: str):
+        logger.info("BSData sync phase: %s", name)
+        if self.progress:
+            self.progress(name)
+
     @classmethod
     def _normalize_cache_key(cls, name: str) -> str:
         """Normalize a manifestation name for cache key lookup.
@@ -84,62 +146,138 @@ class BSDataSync:
         status = self.session.execute(statement).scalars().first()
         return status.commit_hash if status else None
 
-    def _get_latest_commit(self) -> str:
-        """Get latest commit SHA from GitHub API."""
+    def _get_latest_commit(self) -> Optional[str]:
+        """Latest commit SHA from the GitHub API, None for a custom source."""
+        if self.source:
+            return None
         with httpx.Client(timeout=30.0) as client:
             response = client.get(f"{GITHUB_API_URL}/commits/main")
             response.raise_for_status()
             data = response.json()
             return data["sha"]
 
-    def _download_and_extract(self) -> str:
-        """Download tarball from GitHub and extract .cat/.gst files."""
-        logger.info("Downloading BSData from GitHub...")
+    @property
+    def _etag_path(self) -> Path:
+        return self.repo_path.with_name(self.repo_path.name + ".etag")
 
-        # Create directory
-        self.repo_path.parent.mkdir(parents=True, exist_ok=True)
+    def _cached_download(self, url: str) -> Optional[dict]:
+        """ETag and commit of the extracted tree, if it came from ``url``."""
+        if not self.repo_path.exists() or not self._etag_path.exists():
+            return None
+        cached = json.loads(self._etag_path.read_text())
+        return cached if cached.get("url") == url else None
 
-        # Remove old data if exists
-        if self.repo_path.exists():
-            import shutil
+    def _download_and_extract(self) -> str:
+        """Fetch the BSData tarball and extract its .cat/.gst files.
 
-            shutil.rmtree(self.repo_path)
+        The archive is read from ``self.source`` if it is a local path, and
+        otherwise streamed to a temporary file from the source URL (GitHub by
+        default). A download answered with 304 Not Modified keeps the
+        previously extracted tree. Returns the commit of the extracted data.
+        """
+        url = self.source or GITHUB_TARBALL_URL
+        if not url.startswith(("http://", "https://")):
+            logger.info(f"Reading BSData from {url}")
+            with open(url, "rb") as archive:
+                return self._extract_tarball(archive)
+
+        logger.info(f"Downloading BSData from {url}...")
+        cached = self._cached_download(url)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+        with tempfile.TemporaryFile() as archive:
+            with httpx.Client(timeout=120.0, follow_redirects=True) as client:
+                with client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == 304 and cached:
+                        logger.info("BSData tarball not modified")
+                        return cached["commit"]
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        archive.write(chunk)
+                    etag = response.headers.get("etag")
+
+            archive.seek(0)
+            commit = self._extract_tarball(archive)
+
+        if etag:
+            self._etag_path.write_text(
+                json.dumps({"url": url, "etag": etag, "commit": commit})
+            )
+        return commit
 
-        # Download tarball
-        with httpx.Client(timeout=120.0, follow_redirects=True) as client:
-            response = client.get(GITHUB_TARBALL_URL)
-            response.raise_for_status()
+    def _extract_tarball(self, archive: BinaryIO) -> str:
+        """Extract .cat/.gst members of a gzipped tarball into the repo path.
 
-            # Extract tarball
-            with tarfile.open(fileobj=io.BytesIO(response.content), mode="r:gz") as tar:
-                # Find the root directory name (usually "age-of-sigmar-4th-main")
-                root_dir = None
-                for member in tar.getmembers():
-                    if member.isdir() and "/" not in member.name:
-                        root_dir = member.name
-                        break
-
-                # Extract only .cat and .gst files
-                for member in tar.getmembers():
-                    if member.name.endswith(".cat") or member.name.endswith(".gst"):
-                        # Strip the root directory from the path
-                        if root_dir and member.name.startswith(root_dir + "/"):
-                            member.name = member.name[len(root_dir) + 1 :]
-
-                        # Extract to our target directory
-                        target_path = self.repo_path / member.name
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                        # Extract file content
-                        file_obj = tar.extractfile(member)
-                        if file_obj:
-                            target_path.write_bytes(file_obj.read())
+        The archive is read in stream mode, so only one member is held at a
+        time. Files are extracted to a staging directory that replaces the
+        repo path once extraction succeeded. The commit is taken from the
+        pax header GitHub writes into its archives, falling back to a
+        digest of the archive.
+        """
+        staging = self.repo_path.with_name(self.repo_path.name + ".partial")
+        if staging.exists():
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True)
+
+        digest = hashlib.sha1()
+        reader = _DigestReader(archive, digest)
+        with tarfile.open(fileobj=reader, mode="r|gz") as tar:
+            # The root directory (usually "age-of-sigmar-4th-main") is stripped
+            root_dir = None
+            for member in tar:
+                if member.isdir() and "/" not in member.name.rstrip("/"):
+                    root_dir = member.name.rstrip("/")
+                    continue
+                if not member.isfile() or not member.name.endswith((".cat", ".gst")):
+                    continue
+
+                name = member.name
+                if root_dir and name.startswith(root_dir + "/"):
+                    name = name[len(root_dir) + 1 :]
+                target_path = (staging / name).resolve()
+                if not target_path.is_relative_to(staging.resolve()):
+                    logger.warning(f"Skipping tarball member outside repo: {name}")
+                    continue
+
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                with tar.extractfile(member) as source, open(target_path, "wb") as out:
+                    shutil.copyfileobj(source, out)
+            commit = tar.pax_headers.get("comment", "")
+            # Drain the rest so the digest covers the whole archive
+            while reader.read(DOWNLOAD_CHUNK_SIZE):
+                pass
 
+        if self.repo_path.exists():
+            shutil.rmtree(self.repo_path)
+        staging.rename(self.repo_path)
         logger.info(f"Extracted BSData to {self.repo_path}")
-        return self._get_latest_commit()
+
+        if re.fullmatch(r"[0-9a-f]{40}", commit):
+            return commit
+        return digest.hexdigest()
 
     def sync(self, force_full: bool = False) -> dict:
         """Main sync method. Returns stats dict."""
+        started = time.perf_counter()
+        stats = self._sync(force_full)
+
+        if stats.get("status") == "failed":
+            outcome = "failed"
+        elif stats.get("message") == "No changes":
+            outcome = "unchanged"
+        else:
+            outcome = "success"
+        BSDATA_SYNC_DURATION.observe(time.perf_counter() - started, status=outcome)
+        return stats
+
+    @staticmethod
+    def _unchanged(stats: dict, commit: str) -> dict:
+        stats["message"] = "No changes"
+        stats["commit"] = commit
+        stats["commit_short"] = commit[:7]
+        return stats
+
+    def _sync(self, force_full: bool) -> dict:
         start_time = datetime.utcnow()
         stats = {
             "sync_type": "full" if force_full else "incremental",
@@ -149,28 +287,38 @@ class BSDataSync:
         }
 
         try:
-            # Get latest commit from GitHub
+            self._phase("download")
+            # Get latest commit from GitHub (unknown for a custom source)
             latest_commit = self._get_latest_commit()
             current_commit = self.get_current_commit()
 
             # Check if we need to sync
             if (
                 not force_full
+                and latest_commit
                 and current_commit == latest_commit
                 and self.repo_path.exists()
             ):
-                stats["message"] = "No changes"
-                stats["commit"] = latest_commit
-                stats["commit_short"] = latest_commit[:7]
-                return stats
+                return self._unchanged(stats, latest_commit)
 
             # Download and extract
             new_commit = self._download_and_extract()
-
-            # Full sync always (incremental would require git diff which we don't have)
-            stats["sync_type"] = "full"
+            if not force_full and new_commit == current_commit:
+                return self._unchanged(stats, new_commit)
             self.parser = BSDataParser(self.repo_path)
-            sync_stats = self._full_sync()
+            self.writer = BulkWriter(self.session)
+            self._previous_commit = current_commit
+
+            # Compare per-file content hashes against the last successful sync
+            file_hashes = self._compute_file_hashes()
+            changes = None if force_full else self._detect_changes(file_hashes)
+            if changes is None:
+                stats["sync_type"] = "full"
+                sync_stats = self._full_sync()
+            else:
+                stats["sync_type"] = "incremental"
+                sync_stats = self._incremental_sync(*changes)
+            self._store_file_hashes(file_hashes)
 
             stats.update(sync_stats)
             stats["commit"] = new_commit
@@ -187,13 +335,16 @@ class BSDataSync:
                 status="success",
             )
             self.session.add(sync_status)
+            # Data and status commit together: readers switch atomically
             self.session.commit()
+            response_cache.set_version(str(sync_status.id))
 
             stats["duration_seconds"] = (datetime.utcnow() - start_time).total_seconds()
             logger.info(f"Sync completed: {stats}")
 
         except Exception as error:
             logger.exception("Sync failed")
+            self.session.rollback()
             stats["status"] = "failed"
             stats["error"] = str(error)
 
@@ -211,8 +362,71 @@ class BSDataSync:
 
         return stats
 
+    def _save_snapshot(self, scope: SnapshotScope):
+        """Keep the rows about to be replaced so the sync can be rolled back."""
+        if self._previous_commit:
+            save_snapshot(self.session, self._previous_commit, scope)
+
+    def rollback(self) -> dict:
+        """Swap the live rules rows with the snapshot taken before the last sync.
+
+        The replaced rows become the new snapshot, so a rollback can be undone
+        by rolling back again.
+        """
+        snapshot = get_snapshot(self.session)
+        if snapshot is None:
+            return {
+                "sync_type": "rollback",
+                "status": "failed",
+                "error": "No previous snapshot",
+            }
+
+        restored_commit = snapshot.commit_hash
+        scope, tables = load_snapshot(snapshot)
+        self.session.execute(
+            delete(BSDataSnapshot).where(BSDataSnapshot.id == snapshot.id)
+        )
+        current_commit = self.get_current_commit()
+        if current_commit:
+            save_snapshot(self.session, current_commit, scope)
+        restore_rules_tables(self.session, tables, scope)
+
+        # Stored hashes describe the replaced data; the next sync must be full
+        self.session.execute(delete(BSDataFileHash))
+        rebuild_search_index(self.session)
+
+        stats = {
+            "sync_type": "rollback",
+            "commit": restored_commit,
+            "commit_short": restored_commit[:7],
+            "factions_count": self.session.execute(
+                select(func.count(Faction.id))
+            ).scalar_one(),
+            "units_count": self.session.execute(
+                select(func.count(Unit.id))
+            ).scalar_one(),
+        }
+        sync_status = BSDataSyncStatus(
+            commit_hash=restored_commit,
+            commit_short=restored_commit[:7],
+            synced_at=datetime.utcnow(),
+            factions_count=stats["factions_count"],
+            units_count=stats["units_count"],
+            sync_type="rollback",
+            status="success",
+        )
+        self.session.add(sync_status)
+        self.session.commit()
+        response_cache.set_version(str(sync_status.id))
+        logger.info("Rolled BSData back to %s", restored_commit[:7])
+        return stats
+
     def _full_sync(self) -> dict:
-        """Full sync - parse all catalogs."""
+        """Full sync - parse all catalogs.
+
+        Runs in the caller's transaction, so readers keep seeing the previous
+        data until the sync status is committed.
+        """
         stats = {
             "factions_count": 0,
             "units_count": 0,
@@ -223,6 +437,7 @@ class BSDataSync:
         }
 
         # Clear all existing data before full sync
+        self._save_snapshot(FULL_SCOPE)
         self._clear_all_data()
         self._ensure_grand_alliances()
 
@@ -231,44 +446,22 @@ class BSDataSync:
         gst_data = self.parser.parse_game_system()
         for manif_data in gst_data.get("manifestations", []):
             self._upsert_manifestation(manif_data)
-            manif_name = manif_data.get("name", "")
-            if manif_name:
-                self._manifestation_stats_cache[
-                    self._normalize_cache_key(manif_name)
-                ] = {
-                    "move": manif_data.get("move"),
-                    "health": manif_data.get("health"),
-                    "save": manif_data.get("save"),
-                    "banishment": manif_data.get("banishment"),
-                    "weapons": manif_data.get("weapons", []),
-                    "abilities": manif_data.get("abilities", []),
-                }
+            self._cache_manifestation_stats(manif_data)
             stats["manifestations_count"] += 1
 
+        # Parse every faction catalog up front (in parallel when configured)
+        faction_catalogs = self._order_catalogs(self.parser.get_faction_catalogs())
+        parsed_catalogs = self._parse_faction_catalogs(faction_catalogs)
+
         # Library.cat manifestation profiles (faction-specific manifestations)
-        faction_catalogs = self.parser.get_faction_catalogs()
-        for main_cat, lib_cat in faction_catalogs:
-            if lib_cat and lib_cat.exists():
-                lib_data = self.parser.parse_library_catalog(lib_cat)
-                for manif_data in lib_data.get("manifestations", []):
-                    manif_name = manif_data.get("name", "")
-                    if manif_name:
-                        self._manifestation_stats_cache[
-                            self._normalize_cache_key(manif_name)
-                        ] = {
-                            "move": manif_data.get("move"),
-                            "health": manif_data.get("health"),
-                            "save": manif_data.get("save"),
-                            "banishment": manif_data.get("banishment"),
-                            "weapons": manif_data.get("weapons", []),
-                            "abilities": manif_data.get("abilities", []),
-                        }
+        self._cache_library_manifestations(parsed_catalogs)
 
         # ── Phase 2: Build lores index and sync factions ──
         self._lores_index = self.parser.parse_lores_indexed()
 
-        for main_cat, lib_cat in faction_catalogs:
-            faction_stats = self._sync_faction(main_cat, lib_cat)
+        self._phase("factions")
+        for parsed in parsed_catalogs:
+            faction_stats = self._sync_faction(parsed)
             if faction_stats:
                 stats["factions_count"] += 1
                 stats["units_count"] += faction_stats.get("units", 0)
@@ -276,6 +469,7 @@ class BSDataSync:
                 stats["abilities_count"] += faction_stats.get("abilities", 0)
 
         # ── Phase 3: Core content (battle tactics, core abilities, etc.) ──
+        self._phase("lores")
         for card_data in gst_data.get("battle_tactic_cards", []):
             self._upsert_battle_tactic_card(card_data)
             stats["battle_tactics_count"] += 1
@@ -298,9 +492,258 @@ class BSDataSync:
         for lore_data in universal_lores:
             self._upsert_universal_manifestation_lore(lore_data)
 
-        self.session.commit()
+        self._phase("write")
+        self.writer.flush()
+        logger.info("Wrote BSData rows in %d statements", self.writer.statements)
+        self._phase("search_index")
+        stats["search_entries_count"] = rebuild_search_index(self.session)
         return stats
 
+    def _cache_manifestation_stats(self, manif_data: dict):
+        """Remember manifestation stats for lore entries that reference them."""
+        manif_name = manif_data.get("name", "")
+        if manif_name:
+            self._manifestation_stats_cache[self._normalize_cache_key(manif_name)] = {
+                "move": manif_data.get("move"),
+                "health": manif_data.get("health"),
+                "save": manif_data.get("save"),
+                "banishment": manif_data.get("banishment"),
+                "weapons": manif_data.get("weapons", []),
+                "abilities": manif_data.get("abilities", []),
+            }
+
+    def _cache_library_manifestations(self, parsed_catalogs: list[dict]):
+        """Cache manifestation profiles defined in faction Library.cat files."""
+        for parsed in parsed_catalogs:
+            if parsed["library"]:
+                for manif_data in parsed["library"].get("manifestations", []):
+                    self._cache_manifestation_stats(manif_data)
+
+    def _parse_faction_catalogs(
+        self, faction_catalogs: list[tuple[Path, Optional[Path]]]
+    ) -> list[dict]:
+        self._phase("parse")
+        started = time.perf_counter()
+        parsed_catalogs = self.parser.parse_faction_catalogs(
+            faction_catalogs, workers=self.workers
+        )
+        logger.info(
+            "Parsed %d faction catalogs with %d worker(s) in %.1fs",
+            len(parsed_catalogs),
+            self.workers,
+            time.perf_counter() - started,
+        )
+        return parsed_catalogs
+
+    @staticmethod
+    def _order_catalogs(
+        faction_catalogs: list[tuple[Path, Optional[Path]]]
+    ) -> list[tuple[Path, Optional[Path]]]:
+        """Put Armies of Renown after main factions; they need their parent."""
+        return sorted(faction_catalogs, key=lambda pair: " - " in pair[0].stem)
+
+    # =========================================================================
+    # Incremental sync
+    # =========================================================================
+
+    def _compute_file_hashes(self) -> dict[str, str]:
+        """SHA-256 of every extracted .cat/.gst file, keyed by file name."""
+        paths = [*self.repo_path.glob("*.cat"), *self.repo_path.glob("*.gst")]
+        return {
+            path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+            for path in sorted(paths)
+        }
+
+    def _detect_changes(
+        self, file_hashes: dict[str, str]
+    ) -> Optional[tuple[set[str], dict[str, Optional[str]]]]:
+        """Return (changed files, removed files -> catalog id).
+
+        None means an incremental sync is not possible: nothing was hashed
+        yet, or a file shared by every faction changed.
+        """
+        statement = select(BSDataFileHash)
+        stored = {
+            row.file_name: row
+            for row in self.session.execute(statement).scalars().all()
+        }
+        if not stored:
+            return None
+
+        changed = {
+            name
+            for name, content_hash in file_hashes.items()
+            if name not in stored or stored[name].content_hash != content_hash
+        }
+        removed = {
+            name: stored[name].catalog_id for name in stored.keys() - file_hashes.keys()
+        }
+        if (changed | removed.keys()) & SHARED_FILES:
+            return None
+        return changed, removed
+
+    def _store_file_hashes(self, file_hashes: dict[str, str]):
+        """Replace stored hashes with those of the files just synced."""
+        self.session.execute(delete(BSDataFileHash))
+        for name, content_hash in file_hashes.items():
+            path = self.repo_path / name
+            self.session.add(
+                BSDataFileHash(
+                    file_name=name,
+                    content_hash=content_hash,
+                    catalog_id=(
+                        self.parser.parse_catalog(path)["bsdata_id"]
+                        if path.suffix == ".cat"
+                        else None
+                    ),
+                )
+            )
+
+    def _incremental_sync(
+        self, changed: set[str], removed: dict[str, Optional[str]]
+    ) -> dict:
+        """Re-sync only the catalogs whose content hash changed.
+
+        Runs in the caller's transaction, so readers keep seeing the previous
+        data until the sync status is committed.
+        """
+        stats = {
+            "changed_files": sorted(changed | removed.keys()),
+            "factions_synced": 0,
+            "units_synced": 0,
+        }
+        self._ensure_grand_alliances()
+
+        faction_catalogs = self._catalogs_to_resync(changed | removed.keys())
+        parsed_catalogs = self._parse_faction_catalogs(faction_catalogs)
+
+        removed_catalog_ids = [
+            catalog_id for catalog_id in removed.values() if catalog_id
+        ]
+        scope = SnapshotScope(
+            factions=[
+                *removed_catalog_ids,
+                *(parsed["catalog"]["bsdata_id"] for parsed in parsed_catalogs),
+            ],
+            regiments_of_renown=REGIMENTS_OF_RENOWN_FILE in changed,
+        )
+        if scope.factions or scope.regiments_of_renown:
+            self._save_snapshot(scope)
+
+        for catalog_id in removed_catalog_ids:
+            self._delete_faction(catalog_id)
+        if parsed_catalogs:
+            # Lore entries need the stats of the manifestations they summon
+            gst_data = self.parser.parse_game_system()
+            for manif_data in gst_data.get("manifestations", []):
+                self._cache_manifestation_stats(manif_data)
+            self._cache_library_manifestations(parsed_catalogs)
+            self._lores_index = self.parser.parse_lores_indexed()
+
+        # Delete everything being replaced before staging any rows, so the
+        # writer's view of existing bsdata_ids is taken after the deletes
+        for parsed in parsed_catalogs:
+            catalog_id = parsed["catalog"]["bsdata_id"]
+            statement = select(Faction).where(Faction.bsdata_id == catalog_id)
+            existing = self.session.execute(statement).scalars().first()
+            if existing:
+                self._delete_faction_content(existing.id)
+        if REGIMENTS_OF_RENOWN_FILE in changed:
+            self.session.execute(delete(RoRUnit))
+            self.session.execute(delete(RegimentOfRenown))
+
+        self._phase("factions")
+        for parsed in parsed_catalogs:
+            faction_stats = self._sync_faction(parsed)
+            if faction_stats:
+                stats["factions_synced"] += 1
+                stats["units_synced"] += faction_stats.get("units", 0)
+
+        if REGIMENTS_OF_RENOWN_FILE in changed:
+            for regiment_data in self.parser.parse_regiments_of_renown():
+                self._upsert_regiment_of_renown(regiment_data)
+
+        self._phase("write")
+        self.writer.flush()
+        self.session.flush()
+        self._phase("search_index")
+        stats["search_entries_count"] = rebuild_search_index(self.session)
+        stats["factions_count"] = self.session.execute(
+            select(func.count(Faction.id))
+        ).scalar_one()
+        stats["units_count"] = self.session.execute(
+            select(func.count(Unit.id))
+        ).scalar_one()
+        return stats
+
+    def _catalogs_to_resync(
+        self, file_names: set[str]
+    ) -> list[tuple[Path, Optional[Path]]]:
+        """Faction catalog pairs touched by the given files.
+
+        Armies of Renown link their parent's units, so they are re-synced
+        (after the parent) whenever the parent faction is.
+        """
+        stems = {Path(name).stem.removesuffix(" - Library") for name in file_names}
+        return [
+            (main_cat, lib_cat)
+            for main_cat, lib_cat in self._order_catalogs(
+                self.parser.get_faction_catalogs()
+            )
+            if main_cat.stem in stems
+            or any(main_cat.stem.startswith(f"{stem} - ") for stem in stems)
+        ]
+
+    def _delete_faction(self, catalog_id: str):
+        """Delete a faction whose catalog was removed, with its AoRs."""
+        statement = select(Faction).where(Faction.bsdata_id == catalog_id)
+        faction = self.session.execute(statement).scalars().first()
+        if not faction:
+            return
+
+        statement = select(Faction).where(Faction.parent_faction_id == faction.id)
+        for aor_faction in self.session.execute(statement).scalars().all():
+            self._delete_faction_content(aor_faction.id)
+            self.session.delete(aor_faction)
+        self.session.flush()
+
+        self._delete_faction_content(faction.id)
+        self.session.delete(faction)
+        self.session.flush()
+
+    def _delete_faction_content(self, faction_id: int):
+        """Delete everything synced for a faction, keeping the faction row."""
+        unit_ids = select(Unit.id).where(Unit.faction_id == faction_id)
+        self.session.execute(delete(Weapon).where(Weapon.unit_id.in_(unit_ids)))
+        self.session.execute(
+            delete(UnitAbility).where(UnitAbility.unit_id.in_(unit_ids))
+        )
+        self.session.execute(
+            delete(UnitFaction).where(
+                or_(
+                    UnitFaction.unit_id.in_(unit_ids),
+                    UnitFaction.faction_id == faction_id,
+                )
+            )
+        )
+        self.session.execute(delete(Unit).where(Unit.faction_id == faction_id))
+
+        for model in (BattleTrait, BattleFormation, HeroicTrait, Artefact):
+            self.session.execute(delete(model).where(model.faction_id == faction_id))
+
+        for lore_model, entry_model in (
+            (SpellLore, Spell),
+            (PrayerLore, Prayer),
+            (ManifestationLore, Manifestation),
+        ):
+            lore_ids = select(lore_model.id).where(lore_model.faction_id == faction_id)
+            self.session.execute(
+                delete(entry_model).where(entry_model.lore_id.in_(lore_ids))
+            )
+            self.session.execute(
+                delete(lore_model).where(lore_model.faction_id == faction_id)
+            )
+
     def _clear_all_data(self):
         """Clear all BSData tables before full sync."""
         from sqlalchemy import text
@@ -330,7 +773,6 @@ class BSDataSync:
         ]
         for table_name in tables_to_clear:
             self.session.execute(text(f"DELETE FROM {table_name}"))
-        self.session.commit()
 
         # Clear caches
         self._grand_alliance_cache.clear()
@@ -397,49 +839,37 @@ class BSDataSync:
         self._faction_cache[bsdata_id] = faction.id
         return faction.id
 
-    def _sync_faction(self, main_cat: Path, lib_cat: Optional[Path]) -> Optional[dict]:
-        """Sync a single faction from its catalog files."""
+    def _sync_faction(self, parsed: dict) -> Optional[dict]:
+        """Sync a single faction from its parsed catalog files."""
         stats = {"units": 0, "weapons": 0, "abilities": 0}
 
-        catalog_data = self.parser.parse_catalog(main_cat)
-        faction_name = catalog_data.get("name", main_cat.stem)
-
-        if any(
-            skip in faction_name
-            for skip in [
-                "Regiments of Renown",
-                "Lores",
-                "Path to Glory",
-                "[LEGENDS]",
-                "Anvil of Apotheosis",
-            ]
-        ):
-            return None
-        if faction_name.startswith("\u00fe"):
+        catalog_data = parsed["catalog"]
+        faction_name = catalog_data["name"]
+
+        if is_skipped_catalog(faction_name):
             return None
 
         is_army_of_renown = " - " in faction_name and "Library" not in faction_name
 
         if is_army_of_renown:
-            self._sync_army_of_renown(main_cat, catalog_data)
+            self._sync_army_of_renown(catalog_data, parsed["main"])
             return {"units": 0, "weapons": 0, "abilities": 0}
 
         faction_id = self._get_or_create_faction(
             faction_name, catalog_data.get("bsdata_id", "")
         )
 
-        self._sync_faction_content(faction_id, main_cat, lib_cat, stats)
+        self._sync_faction_content(faction_id, parsed["main"], parsed["library"], stats)
         return stats
 
     def _sync_faction_content(
         self,
         faction_id: int,
-        main_cat: Path,
-        lib_cat: Optional[Path],
+        main_data: dict,
+        lib_data: Optional[dict],
         stats: dict,
     ):
         """Sync all content for a faction (battle traits, lores, units, etc.)."""
-        main_data = self.parser.parse_faction_main_catalog(main_cat)
         points_map = main_data.get("points", {})
         reinforced_units = main_data.get("reinforced_units", set())
         notes_map = main_data.get("notes", {})
@@ -493,9 +923,7 @@ class BSDataSync:
                 )
 
         # Units from library catalog
-        if lib_cat and lib_cat.exists():
-            lib_data = self.parser.parse_library_catalog(lib_cat)
-
+        if lib_data:
             for unit_data in lib_data.get("units", []):
                 unit_name = unit_data["name"]
                 unit_data["points"] = points_map.get(unit_name)
@@ -511,7 +939,7 @@ class BSDataSync:
         if unit_ref_names:
             self._link_aor_units(faction_id, unit_ref_names, stats)
 
-    def _sync_army_of_renown(self, cat_path: Path, catalog_data: dict):
+    def _sync_army_of_renown(self, catalog_data: dict, main_data: dict):
         """Sync an Army of Renown as a regular faction with is_aor=True."""
         full_name = catalog_data.get("name", "")
         bsdata_id = catalog_data.get("bsdata_id", "")
@@ -541,7 +969,7 @@ class BSDataSync:
         # AoRs have battle traits, heroic traits, artefacts, spell lores etc.
         # They typically don't have battle formations or their own units
         stats = {"units": 0, "weapons": 0, "abilities": 0}
-        self._sync_faction_content(faction_id, cat_path, None, stats)
+        self._sync_faction_content(faction_id, main_data, None, stats)
 
     def _link_aor_units(self, aor_faction_id: int, unit_ref_names: set, stats: dict):
         """Link parent faction units to AoR via junction table."""
@@ -549,433 +977,267 @@ class BSDataSync:
         if not aor_faction or not aor_faction.parent_faction_id:
             return
 
+        # The parent's units may still be staged
+        self.writer.flush()
         statement = select(Unit).where(Unit.faction_id == aor_faction.parent_faction_id)
         parent_units = self.session.execute(statement).scalars().all()
 
         for parent_unit in parent_units:
             if parent_unit.name in unit_ref_names:
-                link = UnitFaction(
-                    unit_id=parent_unit.id,
-                    faction_id=aor_faction_id,
+                self.writer.add(
+                    UnitFaction,
+                    {"unit_id": parent_unit.id, "faction_id": aor_faction_id},
                 )
-                self.session.add(link)
                 stats["units"] += 1
 
     def _upsert_unit(self, faction_id: int, unit_data: dict) -> dict:
         """Upsert a unit and its weapons/abilities."""
         stats = {"weapons": 0, "abilities": 0}
 
-        bsdata_id = unit_data.get("bsdata_id", "")
         keywords_list = unit_data.get("keywords", [])
-        keywords_json = json.dumps(keywords_list) if keywords_list else None
-
-        statement = select(Unit).where(Unit.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = unit_data.get("name", existing.name)
-            existing.points = unit_data.get("points", existing.points)
-            existing.move = unit_data.get("move", existing.move)
-            existing.health = unit_data.get("health", existing.health)
-            existing.save = unit_data.get("save", existing.save)
-            existing.control = unit_data.get("control", existing.control)
-            existing.keywords = keywords_json
-            existing.base_size = unit_data.get("base_size", existing.base_size)
-            existing.unit_size = unit_data.get("unit_size", existing.unit_size)
-            existing.can_be_reinforced = unit_data.get(
-                "can_be_reinforced", existing.can_be_reinforced
-            )
-            existing.notes = unit_data.get("notes", existing.notes)
-            unit = existing
-        else:
-            unit = Unit(
-                faction_id=faction_id,
-                bsdata_id=bsdata_id,
-                name=unit_data.get("name", ""),
-                points=unit_data.get("points"),
-                move=unit_data.get("move"),
-                health=unit_data.get("health"),
-                save=unit_data.get("save"),
-                control=unit_data.get("control"),
-                keywords=keywords_json,
-                base_size=unit_data.get("base_size"),
-                unit_size=unit_data.get("unit_size"),
-                can_be_reinforced=unit_data.get("can_be_reinforced", False),
-                notes=unit_data.get("notes"),
-            )
-            self.session.add(unit)
-            self.session.flush()
+        unit = self.writer.upsert(
+            Unit,
+            {
+                "faction_id": faction_id,
+                "bsdata_id": unit_data.get("bsdata_id", ""),
+                "name": unit_data.get("name", ""),
+                "points": unit_data.get("points"),
+                "move": unit_data.get("move"),
+                "health": unit_data.get("health"),
+                "save": unit_data.get("save"),
+                "control": unit_data.get("control"),
+                "keywords": json.dumps(keywords_list) if keywords_list else None,
+                "base_size": unit_data.get("base_size"),
+                "unit_size": unit_data.get("unit_size"),
+                "can_be_reinforced": unit_data.get("can_be_reinforced", False),
+                "notes": unit_data.get("notes"),
+            },
+            keep=("faction_id",),
+        )
 
         for weapon_data in unit_data.get("weapons", []):
-            self._upsert_weapon(unit.id, weapon_data)
+            self._upsert_weapon(unit, weapon_data)
             stats["weapons"] += 1
 
         for ability_data in unit_data.get("abilities", []):
-            self._upsert_unit_ability(unit.id, ability_data)
+            self._upsert_unit_ability(unit, ability_data)
             stats["abilities"] += 1
 
         return stats
 
-    def _upsert_weapon(self, unit_id: int, weapon_data: dict):
+    def _upsert_weapon(self, unit: Ref, weapon_data: dict):
         """Upsert a weapon."""
-        bsdata_id = weapon_data.get("bsdata_id", "")
-        statement = select(Weapon).where(Weapon.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = weapon_data.get("name", existing.name)
-            existing.weapon_type = weapon_data.get("weapon_type", existing.weapon_type)
-            existing.range = weapon_data.get("range", existing.range)
-            existing.attacks = weapon_data.get("attacks", existing.attacks)
-            existing.hit = weapon_data.get("hit", existing.hit)
-            existing.wound = weapon_data.get("wound", existing.wound)
-            existing.rend = weapon_data.get("rend", existing.rend)
-            existing.damage = weapon_data.get("damage", existing.damage)
-            existing.ability = weapon_data.get("ability", existing.ability)
-        else:
-            weapon = Weapon(
-                unit_id=unit_id,
-                bsdata_id=bsdata_id,
-                name=weapon_data.get("name", ""),
-                weapon_type=weapon_data.get("weapon_type", "melee"),
-                range=weapon_data.get("range"),
-                attacks=weapon_data.get("attacks"),
-                hit=weapon_data.get("hit"),
-                wound=weapon_data.get("wound"),
-                rend=weapon_data.get("rend"),
-                damage=weapon_data.get("damage"),
-                ability=weapon_data.get("ability"),
-            )
-            self.session.add(weapon)
+        self.writer.upsert(
+            Weapon,
+            {
+                "unit_id": unit,
+                "bsdata_id": weapon_data.get("bsdata_id", ""),
+                "name": weapon_data.get("name", ""),
+                "weapon_type": weapon_data.get("weapon_type", "melee"),
+                "range": weapon_data.get("range"),
+                "attacks": weapon_data.get("attacks"),
+                "hit": weapon_data.get("hit"),
+                "wound": weapon_data.get("wound"),
+                "rend": weapon_data.get("rend"),
+                "damage": weapon_data.get("damage"),
+                "ability": weapon_data.get("ability"),
+            },
+            keep=("unit_id",),
+        )
 
-    def _upsert_unit_ability(self, unit_id: int, ability_data: dict):
+    def _upsert_unit_ability(self, unit: Ref, ability_data: dict):
         """Upsert a unit ability."""
-        bsdata_id = ability_data.get("bsdata_id", "")
-        statement = select(UnitAbility).where(UnitAbility.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = ability_data.get("name", existing.name)
-            existing.ability_type = ability_data.get(
-                "ability_type", existing.ability_type
-            )
-            existing.effect = ability_data.get("effect", existing.effect)
-            existing.keywords = ability_data.get("keywords", existing.keywords)
-            existing.timing = ability_data.get("timing", existing.timing)
-            existing.declare = ability_data.get("declare", existing.declare)
-            existing.color = ability_data.get("color", existing.color)
-        else:
-            ability = UnitAbility(
-                unit_id=unit_id,
-                bsdata_id=bsdata_id,
-                name=ability_data.get("name", ""),
-                ability_type=ability_data.get("ability_type", "passive"),
-                effect=ability_data.get("effect"),
-                keywords=ability_data.get("keywords"),
-                timing=ability_data.get("timing"),
-                declare=ability_data.get("declare"),
-                color=ability_data.get("color"),
-            )
-            self.session.add(ability)
+        self.writer.upsert(
+            UnitAbility,
+            {
+                "unit_id": unit,
+                "bsdata_id": ability_data.get("bsdata_id", ""),
+                "name": ability_data.get("name", ""),
+                "ability_type": ability_data.get("ability_type", "passive"),
+                "effect": ability_data.get("effect"),
+                "keywords": ability_data.get("keywords"),
+                "timing": ability_data.get("timing"),
+                "declare": ability_data.get("declare"),
+                "color": ability_data.get("color"),
+            },
+            keep=("unit_id",),
+        )
 
     def _upsert_battle_trait(self, faction_id: int, trait_data: dict):
         """Upsert a battle trait."""
-        bsdata_id = trait_data.get("bsdata_id", "")
-        statement = select(BattleTrait).where(BattleTrait.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = trait_data.get("name", existing.name)
-            existing.effect = trait_data.get("effect", existing.effect)
-            existing.timing = trait_data.get("timing", existing.timing)
-            existing.declare = trait_data.get("declare", existing.declare)
-            existing.color = trait_data.get("color", existing.color)
-            existing.keywords = trait_data.get("keywords", existing.keywords)
-        else:
-            trait = BattleTrait(
-                faction_id=faction_id,
-                bsdata_id=bsdata_id,
-                name=trait_data.get("name", ""),
-                effect=trait_data.get("effect"),
-                timing=trait_data.get("timing"),
-                declare=trait_data.get("declare"),
-                color=trait_data.get("color"),
-                keywords=trait_data.get("keywords"),
-            )
-            self.session.add(trait)
+        self.writer.upsert(
+            BattleTrait,
+            {
+                "faction_id": faction_id,
+                "bsdata_id": trait_data.get("bsdata_id", ""),
+                "name": trait_data.get("name", ""),
+                "effect": trait_data.get("effect"),
+                "timing": trait_data.get("timing"),
+                "declare": trait_data.get("declare"),
+                "color": trait_data.get("color"),
+                "keywords": trait_data.get("keywords"),
+            },
+            keep=("faction_id",),
+        )
 
     def _upsert_heroic_trait(self, faction_id: int, trait_data: dict):
         """Upsert a heroic trait."""
-        bsdata_id = trait_data.get("bsdata_id", "")
-        statement = select(HeroicTrait).where(HeroicTrait.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = trait_data.get("name", existing.name)
-            existing.points = trait_data.get("points")
-            existing.effect = trait_data.get("effect", existing.effect)
-            existing.timing = trait_data.get("timing", existing.timing)
-            existing.declare = trait_data.get("declare", existing.declare)
-            existing.color = trait_data.get("color", existing.color)
-            existing.keywords = trait_data.get("keywords", existing.keywords)
-            existing.group_name = trait_data.get("group_name", existing.group_name)
-            existing.is_seasonal = trait_data.get("is_seasonal", existing.is_seasonal)
-        else:
-            trait = HeroicTrait(
-                faction_id=faction_id,
-                bsdata_id=bsdata_id,
-                name=trait_data.get("name", ""),
-                points=trait_data.get("points"),
-                effect=trait_data.get("effect"),
-                timing=trait_data.get("timing"),
-                declare=trait_data.get("declare"),
-                color=trait_data.get("color"),
-                keywords=trait_data.get("keywords"),
-                group_name=trait_data.get("group_name"),
-                is_seasonal=trait_data.get("is_seasonal", False),
-            )
-            self.session.add(trait)
+        self.writer.upsert(
+            HeroicTrait,
+            {
+                "faction_id": faction_id,
+                "bsdata_id": trait_data.get("bsdata_id", ""),
+                "name": trait_data.get("name", ""),
+                "points": trait_data.get("points"),
+                "effect": trait_data.get("effect"),
+                "timing": trait_data.get("timing"),
+                "declare": trait_data.get("declare"),
+                "color": trait_data.get("color"),
+                "keywords": trait_data.get("keywords"),
+                "group_name": trait_data.get("group_name"),
+                "is_seasonal": trait_data.get("is_seasonal", False),
+            },
+            keep=("faction_id",),
+        )
 
     def _upsert_artefact(self, faction_id: int, artefact_data: dict):
         """Upsert an artefact."""
-        bsdata_id = artefact_data.get("bsdata_id", "")
-        statement = select(Artefact).where(Artefact.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = artefact_data.get("name", existing.name)
-            existing.points = artefact_data.get("points")
-            existing.effect = artefact_data.get("effect", existing.effect)
-            existing.timing = artefact_data.get("timing", existing.timing)
-            existing.declare = artefact_data.get("declare", existing.declare)
-            existing.color = artefact_data.get("color", existing.color)
-            existing.keywords = artefact_data.get("keywords", existing.keywords)
-            existing.group_name = artefact_data.get("group_name", existing.group_name)
-            existing.is_seasonal = artefact_data.get(
-                "is_seasonal", existing.is_seasonal
-            )
-        else:
-            artefact = Artefact(
-                faction_id=faction_id,
-                bsdata_id=bsdata_id,
-                name=artefact_data.get("name", ""),
-                points=artefact_data.get("points"),
-                effect=artefact_data.get("effect"),
-                timing=artefact_data.get("timing"),
-                declare=artefact_data.get("declare"),
-                color=artefact_data.get("color"),
-                keywords=artefact_data.get("keywords"),
-                group_name=artefact_data.get("group_name"),
-                is_seasonal=artefact_data.get("is_seasonal", False),
-            )
-            self.session.add(artefact)
+        self.writer.upsert(
+            Artefact,
+            {
+                "faction_id": faction_id,
+                "bsdata_id": artefact_data.get("bsdata_id", ""),
+                "name": artefact_data.get("name", ""),
+                "points": artefact_data.get("points"),
+                "effect": artefact_data.get("effect"),
+                "timing": artefact_data.get("timing"),
+                "declare": artefact_data.get("declare"),
+                "color": artefact_data.get("color"),
+                "keywords": artefact_data.get("keywords"),
+                "group_name": artefact_data.get("group_name"),
+                "is_seasonal": artefact_data.get("is_seasonal", False),
+            },
+            keep=("faction_id",),
+        )
 
     def _upsert_battle_formation(self, faction_id: int, formation_data: dict):
         """Upsert a battle formation."""
-        bsdata_id = formation_data.get("bsdata_id", "")
-        statement = select(BattleFormation).where(
-            BattleFormation.bsdata_id == bsdata_id
+        self.writer.upsert(
+            BattleFormation,
+            {
+                "faction_id": faction_id,
+                "bsdata_id": formation_data.get("bsdata_id", ""),
+                "name": formation_data.get("name", ""),
+                "points": formation_data.get("points"),
+                "ability_name": formation_data.get("ability_name"),
+                "ability_type": formation_data.get("ability_type"),
+                "effect": formation_data.get("effect"),
+                "timing": formation_data.get("timing"),
+                "declare": formation_data.get("declare"),
+                "color": formation_data.get("color"),
+                "keywords": formation_data.get("keywords"),
+            },
+            keep=("faction_id",),
         )
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = formation_data.get("name", existing.name)
-            existing.points = formation_data.get("points")
-            existing.ability_name = formation_data.get("ability_name")
-            existing.ability_type = formation_data.get("ability_type")
-            existing.effect = formation_data.get("effect")
-            existing.timing = formation_data.get("timing")
-            existing.declare = formation_data.get("declare")
-            existing.color = formation_data.get("color")
-            existing.keywords = formation_data.get("keywords")
-        else:
-            formation = BattleFormation(
-                faction_id=faction_id,
-                bsdata_id=bsdata_id,
-                name=formation_data.get("name", ""),
-                points=formation_data.get("points"),
-                ability_name=formation_data.get("ability_name"),
-                ability_type=formation_data.get("ability_type"),
-                effect=formation_data.get("effect"),
-                timing=formation_data.get("timing"),
-                declare=formation_data.get("declare"),
-                color=formation_data.get("color"),
-                keywords=formation_data.get("keywords"),
-            )
-            self.session.add(formation)
 
     def _upsert_manifestation(self, manif_data: dict):
         """Upsert a manifestation."""
-        bsdata_id = manif_data.get("bsdata_id", "")
-        weapons_json = (
-            json.dumps(manif_data["weapons"]) if manif_data.get("weapons") else None
-        )
-        abilities_json = (
-            json.dumps(manif_data["abilities"]) if manif_data.get("abilities") else None
+        self.writer.upsert(
+            Manifestation,
+            {
+                "bsdata_id": manif_data.get("bsdata_id", ""),
+                "name": manif_data.get("name", ""),
+                "move": manif_data.get("move"),
+                "health": manif_data.get("health"),
+                "save": manif_data.get("save"),
+                "banishment": manif_data.get("banishment"),
+                "weapons": (
+                    json.dumps(manif_data["weapons"])
+                    if manif_data.get("weapons")
+                    else None
+                ),
+                "abilities": (
+                    json.dumps(manif_data["abilities"])
+                    if manif_data.get("abilities")
+                    else None
+                ),
+            },
+            keep_if_empty=("weapons", "abilities"),
         )
 
-        statement = select(Manifestation).where(Manifestation.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = manif_data.get("name", existing.name)
-            existing.move = manif_data.get("move", existing.move)
-            existing.health = manif_data.get("health", existing.health)
-            existing.save = manif_data.get("save", existing.save)
-            existing.banishment = manif_data.get("banishment", existing.banishment)
-            if weapons_json:
-                existing.weapons = weapons_json
-            if abilities_json:
-                existing.abilities = abilities_json
-        else:
-            manif = Manifestation(
-                bsdata_id=bsdata_id,
-                name=manif_data.get("name", ""),
-                move=manif_data.get("move"),
-                health=manif_data.get("health"),
-                save=manif_data.get("save"),
-                banishment=manif_data.get("banishment"),
-                weapons=weapons_json,
-                abilities=abilities_json,
-            )
-            self.session.add(manif)
-
     def _upsert_battle_tactic_card(self, card_data: dict):
         """Upsert a battle tactic card."""
-        bsdata_id = card_data.get("bsdata_id", "")
-        statement = select(BattleTacticCard).where(
-            BattleTacticCard.bsdata_id == bsdata_id
+        self.writer.upsert(
+            BattleTacticCard,
+            {
+                "bsdata_id": card_data.get("bsdata_id", ""),
+                "name": card_data.get("name", ""),
+                "card_rules": card_data.get("card_rules"),
+                "affray_name": card_data.get("affray_name"),
+                "affray_effect": card_data.get("affray_effect"),
+                "strike_name": card_data.get("strike_name"),
+                "strike_effect": card_data.get("strike_effect"),
+                "domination_name": card_data.get("domination_name"),
+                "domination_effect": card_data.get("domination_effect"),
+            },
         )
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = card_data.get("name", existing.name)
-            existing.card_rules = card_data.get("card_rules", existing.card_rules)
-            existing.affray_name = card_data.get("affray_name", existing.affray_name)
-            existing.affray_effect = card_data.get(
-                "affray_effect", existing.affray_effect
-            )
-            existing.strike_name = card_data.get("strike_name", existing.strike_name)
-            existing.strike_effect = card_data.get(
-                "strike_effect", existing.strike_effect
-            )
-            existing.domination_name = card_data.get(
-                "domination_name", existing.domination_name
-            )
-            existing.domination_effect = card_data.get(
-                "domination_effect", existing.domination_effect
-            )
-        else:
-            card = BattleTacticCard(
-                bsdata_id=bsdata_id,
-                name=card_data.get("name", ""),
-                card_rules=card_data.get("card_rules"),
-                affray_name=card_data.get("affray_name"),
-                affray_effect=card_data.get("affray_effect"),
-                strike_name=card_data.get("strike_name"),
-                strike_effect=card_data.get("strike_effect"),
-                domination_name=card_data.get("domination_name"),
-                domination_effect=card_data.get("domination_effect"),
-            )
-            self.session.add(card)
 
     def _upsert_core_ability(self, ability_data: dict):
         """Upsert a core ability (with full ability fields)."""
-        bsdata_id = ability_data.get("bsdata_id", "")
-        statement = select(CoreAbility).where(CoreAbility.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = ability_data.get("name", existing.name)
-            existing.ability_type = ability_data.get(
-                "ability_type", existing.ability_type
-            )
-            existing.effect = ability_data.get("effect", existing.effect)
-            existing.keywords = ability_data.get("keywords", existing.keywords)
-            existing.timing = ability_data.get("timing", existing.timing)
-            existing.declare = ability_data.get("declare", existing.declare)
-            existing.color = ability_data.get("color", existing.color)
-        else:
-            ability = CoreAbility(
-                bsdata_id=bsdata_id,
-                name=ability_data.get("name", ""),
-                ability_type=ability_data.get("ability_type", "passive"),
-                effect=ability_data.get("effect"),
-                keywords=ability_data.get("keywords"),
-                timing=ability_data.get("timing"),
-                declare=ability_data.get("declare"),
-                color=ability_data.get("color"),
-            )
-            self.session.add(ability)
+        self.writer.upsert(
+            CoreAbility,
+            {
+                "bsdata_id": ability_data.get("bsdata_id", ""),
+                "name": ability_data.get("name", ""),
+                "ability_type": ability_data.get("ability_type", "passive"),
+                "effect": ability_data.get("effect"),
+                "keywords": ability_data.get("keywords"),
+                "timing": ability_data.get("timing"),
+                "declare": ability_data.get("declare"),
+                "color": ability_data.get("color"),
+            },
+        )
 
     def _upsert_regiment_of_renown(self, regiment_data: dict):
         """Upsert a Regiment of Renown."""
-        bsdata_id = regiment_data.get("bsdata_id", "")
-        statement = select(RegimentOfRenown).where(
-            RegimentOfRenown.bsdata_id == bsdata_id
+        self.writer.upsert(
+            RegimentOfRenown,
+            {
+                "bsdata_id": regiment_data.get("bsdata_id", ""),
+                "name": regiment_data.get("name", ""),
+                "points": regiment_data.get("points"),
+                "description": regiment_data.get("description"),
+            },
         )
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = regiment_data.get("name", existing.name)
-            existing.points = regiment_data.get("points", existing.points)
-            existing.description = regiment_data.get(
-                "description", existing.description
-            )
-        else:
-            regiment = RegimentOfRenown(
-                bsdata_id=bsdata_id,
-                name=regiment_data.get("name", ""),
-                points=regiment_data.get("points"),
-                description=regiment_data.get("description"),
-            )
-            self.session.add(regiment)
 
     def _upsert_spell_lore(self, lore_data: dict):
         """Upsert a spell lore with its spells."""
-        bsdata_id = lore_data.get("bsdata_id", "")
-        statement = select(SpellLore).where(SpellLore.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = lore_data.get("name", existing.name)
-            lore = existing
-        else:
-            lore = SpellLore(
-                bsdata_id=bsdata_id,
-                name=lore_data.get("name", ""),
-            )
-            self.session.add(lore)
-            self.session.flush()
+        lore = self.writer.upsert(
+            SpellLore,
+            {
+                "bsdata_id": lore_data.get("bsdata_id", ""),
+                "name": lore_data.get("name", ""),
+            },
+        )
 
         for spell_data in lore_data.get("spells", []):
-            self._upsert_spell(lore.id, spell_data)
+            self._upsert_spell(lore, spell_data)
 
-    def _upsert_spell(self, lore_id: int, spell_data: dict):
+    def _upsert_spell(self, lore: Ref, spell_data: dict):
         """Upsert a spell."""
-        bsdata_id = spell_data.get("bsdata_id", "")
-        statement = select(Spell).where(Spell.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = spell_data.get("name", existing.name)
-            existing.casting_value = spell_data.get(
-                "casting_value", existing.casting_value
-            )
-            existing.declare = spell_data.get("declare", existing.declare)
-            existing.effect = spell_data.get("effect", existing.effect)
-            existing.keywords = spell_data.get("keywords", existing.keywords)
-        else:
-            spell = Spell(
-                lore_id=lore_id,
-                bsdata_id=bsdata_id,
-                name=spell_data.get("name", ""),
-                casting_value=spell_data.get("casting_value"),
-                declare=spell_data.get("declare"),
-                effect=spell_data.get("effect"),
-                keywords=spell_data.get("keywords"),
-            )
-            self.session.add(spell)
+        self.writer.upsert(
+            Spell,
+            {
+                "lore_id": lore,
+                "bsdata_id": spell_data.get("bsdata_id", ""),
+                "name": spell_data.get("name", ""),
+                "casting_value": spell_data.get("casting_value"),
+                "declare": spell_data.get("declare"),
+                "effect": spell_data.get("effect"),
+                "keywords": spell_data.get("keywords"),
+            },
+            keep=("lore_id",),
+        )
 
     def _upsert_faction_spell_lore(
         self,
@@ -986,26 +1248,18 @@ class BSDataSync:
         points: Optional[int] = None,
     ):
         """Upsert a faction-specific spell lore resolved from Lores.cat."""
-        statement = select(SpellLore).where(SpellLore.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = lore_name
-            existing.faction_id = faction_id
-            existing.points = points
-            lore = existing
-        else:
-            lore = SpellLore(
-                bsdata_id=bsdata_id,
-                faction_id=faction_id,
-                name=lore_name,
-                points=points,
-            )
-            self.session.add(lore)
-            self.session.flush()
+        lore = self.writer.upsert(
+            SpellLore,
+            {
+                "bsdata_id": bsdata_id,
+                "faction_id": faction_id,
+                "name": lore_name,
+                "points": points,
+            },
+        )
 
         for entry_data in entries:
-            self._upsert_spell(lore.id, entry_data)
+            self._upsert_spell(lore, entry_data)
 
     def _upsert_faction_prayer_lore(
         self,
@@ -1016,77 +1270,46 @@ class BSDataSync:
         points: Optional[int] = None,
     ):
         """Upsert a faction-specific prayer lore resolved from Lores.cat."""
-        statement = select(PrayerLore).where(PrayerLore.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = lore_name
-            existing.faction_id = faction_id
-            existing.points = points
-            lore = existing
-        else:
-            lore = PrayerLore(
-                bsdata_id=bsdata_id,
-                faction_id=faction_id,
-                name=lore_name,
-                points=points,
-            )
-            self.session.add(lore)
-            self.session.flush()
+        lore = self.writer.upsert(
+            PrayerLore,
+            {
+                "bsdata_id": bsdata_id,
+                "faction_id": faction_id,
+                "name": lore_name,
+                "points": points,
+            },
+        )
 
         for entry_data in entries:
-            self._upsert_prayer(lore.id, entry_data)
+            self._upsert_prayer(lore, entry_data)
 
-    def _upsert_prayer(self, lore_id: int, prayer_data: dict):
+    def _upsert_prayer(self, lore: Ref, prayer_data: dict):
         """Upsert a prayer."""
-        bsdata_id = prayer_data.get("bsdata_id", "")
-        statement = select(Prayer).where(Prayer.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = prayer_data.get("name", existing.name)
-            existing.chanting_value = prayer_data.get(
-                "casting_value", existing.chanting_value
-            )
-            existing.declare = prayer_data.get("declare", existing.declare)
-            existing.effect = prayer_data.get("effect", existing.effect)
-            existing.keywords = prayer_data.get("keywords", existing.keywords)
-        else:
-            prayer = Prayer(
-                lore_id=lore_id,
-                bsdata_id=bsdata_id,
-                name=prayer_data.get("name", ""),
-                chanting_value=prayer_data.get("casting_value"),
-                declare=prayer_data.get("declare"),
-                effect=prayer_data.get("effect"),
-                keywords=prayer_data.get("keywords"),
-            )
-            self.session.add(prayer)
+        self.writer.upsert(
+            Prayer,
+            {
+                "lore_id": lore,
+                "bsdata_id": prayer_data.get("bsdata_id", ""),
+                "name": prayer_data.get("name", ""),
+                "chanting_value": prayer_data.get("casting_value"),
+                "declare": prayer_data.get("declare"),
+                "effect": prayer_data.get("effect"),
+                "keywords": prayer_data.get("keywords"),
+            },
+            keep=("lore_id",),
+        )
 
     def _upsert_faction_manifestation_lore(
         self, faction_id: int, bsdata_id: str, lore_name: str, entries: list
     ):
         """Upsert a faction-specific manifestation lore resolved from Lores.cat."""
-        statement = select(ManifestationLore).where(
-            ManifestationLore.bsdata_id == bsdata_id
+        lore = self.writer.upsert(
+            ManifestationLore,
+            {"bsdata_id": bsdata_id, "faction_id": faction_id, "name": lore_name},
         )
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = lore_name
-            existing.faction_id = faction_id
-            lore = existing
-        else:
-            lore = ManifestationLore(
-                bsdata_id=bsdata_id,
-                faction_id=faction_id,
-                name=lore_name,
-            )
-            self.session.add(lore)
-            self.session.flush()
 
         for entry_data in entries:
-            self._upsert_faction_manifestation(lore.id, entry_data)
+            self._upsert_faction_manifestation(lore, entry_data)
 
     def _upsert_universal_manifestation_lore(self, lore_data: dict):
         """Upsert a universal manifestation lore (Morbid Conjuration, etc.).
@@ -1095,39 +1318,26 @@ class BSDataSync:
         The lore_data contains a target_id pointing to the actual lore group
         in the lores index, whose entries contain the summoning spells.
         """
-        bsdata_id = lore_data["bsdata_id"]
-        lore_name = lore_data["name"]
-        points = lore_data.get("points")
         target_id = lore_data.get("target_id")
 
-        statement = select(ManifestationLore).where(
-            ManifestationLore.bsdata_id == bsdata_id
+        lore = self.writer.upsert(
+            ManifestationLore,
+            {
+                "bsdata_id": lore_data["bsdata_id"],
+                "faction_id": None,
+                "name": lore_data["name"],
+                "points": lore_data.get("points"),
+            },
         )
-        existing = self.session.execute(statement).scalars().first()
-
-        if existing:
-            existing.name = lore_name
-            existing.faction_id = None
-            existing.points = points
-            lore = existing
-        else:
-            lore = ManifestationLore(
-                bsdata_id=bsdata_id,
-                faction_id=None,
-                name=lore_name,
-                points=points,
-            )
-            self.session.add(lore)
-            self.session.flush()
 
         # Resolve target lore group from lores index
         if target_id and self._lores_index:
             lore_content = self._lores_index.get(target_id)
             if lore_content:
                 for entry_data in lore_content.get("entries", []):
-                    self._upsert_faction_manifestation(lore.id, entry_data)
+                    self._upsert_faction_manifestation(lore, entry_data)
 
-    def _upsert_faction_manifestation(self, lore_id: int, entry_data: dict):
+    def _upsert_faction_manifestation(self, lore: Ref, entry_data: dict):
         """Upsert a manifestation entry (summoning spell stored as manifestation).
 
         Merges stats (move/health/save/banishment) and weapons/abilities from two sources:
@@ -1135,7 +1345,6 @@ class BSDataSync:
         2. GST manifestation stats cache (fallback for universal manifestations)
         Entry-level data takes priority over cache.
         """
-        bsdata_id = entry_data.get("bsdata_id", "")
         manif_name = entry_data.get("name", "")
 
         # Look up stats from manifestation stats cache by name.
@@ -1151,14 +1360,6 @@ class BSDataSync:
                     "the " + stripped, {}
                 )
 
-        # Resolve stats: entry_data (from lore parser) first, cache fallback
-        resolved_move = entry_data.get("move") or cached_stats.get("move")
-        resolved_health = entry_data.get("health") or cached_stats.get("health")
-        resolved_save = entry_data.get("save") or cached_stats.get("save")
-        resolved_banishment = entry_data.get("banishment") or cached_stats.get(
-            "banishment"
-        )
-
         # Resolve weapons/abilities: entry_data first, cache fallback
         entry_weapons = entry_data.get("weapons", [])
         entry_abilities = entry_data.get("abilities", [])
@@ -1168,39 +1369,66 @@ class BSDataSync:
         resolved_abilities = (
             entry_abilities if entry_abilities else cached_stats.get("abilities", [])
         )
-        weapons_json = json.dumps(resolved_weapons) if resolved_weapons else None
-        abilities_json = json.dumps(resolved_abilities) if resolved_abilities else None
 
-        statement = select(Manifestation).where(Manifestation.bsdata_id == bsdata_id)
-        existing = self.session.execute(statement).scalars().first()
+        # Stats: entry_data (from lore parser) first, cache fallback; an
+        # existing row keeps its values where neither source has one
+        self.writer.upsert(
+            Manifestation,
+            {
+                "bsdata_id": entry_data.get("bsdata_id", ""),
+                "lore_id": lore,
+                "name": manif_name,
+                "casting_value": entry_data.get("casting_value"),
+                "declare": entry_data.get("declare"),
+                "effect": entry_data.get("effect"),
+                "move": entry_data.get("move") or cached_stats.get("move"),
+                "health": entry_data.get("health") or cached_stats.get("health"),
+                "save": entry_data.get("save") or cached_stats.get("save"),
+                "banishment": (
+                    entry_data.get("banishment") or cached_stats.get("banishment")
+                ),
+                "weapons": json.dumps(resolved_weapons) if resolved_weapons else None,
+                "abilities": (
+                    json.dumps(resolved_abilities) if resolved_abilities else None
+                ),
+            },
+            keep_if_empty=(
+                "name",
+                "move",
+                "health",
+                "save",
+                "banishment",
+                "weapons",
+                "abilities",
+            ),
+        )
 
-        if existing:
-            existing.name = manif_name or existing.name
-            existing.lore_id = lore_id
-            existing.casting_value = entry_data.get("casting_value")
-            existing.declare = entry_data.get("declare")
-            existing.effect = entry_data.get("effect")
-            existing.move = resolved_move or existing.move
-            existing.health = resolved_health or existing.health
-            existing.save = resolved_save or existing.save
-            existing.banishment = resolved_banishment or existing.banishment
-            if weapons_json:
-                existing.weapons = weapons_json
-            if abilities_json:
-                existing.abilities = abilities_json
-        else:
-            manifestation = Manifestation(
-                bsdata_id=bsdata_id,
-                lore_id=lore_id,
-                name=manif_name,
-                casting_value=entry_data.get("casting_value"),
-                declare=entry_data.get("declare"),
-                effect=entry_data.get("effect"),
-                move=resolved_move,
-                health=resolved_health,
-                save=resolved_save,
-                banishment=resolved_banishment,
-                weapons=weapons_json,
-                abilities=abilities_json,
-            )
-            self.session.add(manifestation)
+
+def main(argv: Optional[list[str]] = None):
+    """Run a BSData sync from the command line."""
+    from app.db import engine
+
+    arg_parser = argparse.ArgumentParser(description="Sync BSData into the database")
+    arg_parser.add_argument(
+        "--force-full",
+        action="store_true",
+        help="re-sync every catalog even if its content hash is unchanged",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="catalog parsing processes (default: BSDATA_SYNC_WORKERS, 0 = per core)",
+    )
+    args = arg_parser.parse_args(argv)
+
+    with Session(engine) as session:
+        result = BSDataSync(session, workers=args.workers).sync(
+            force_full=args.force_full
+        )
+    print(json.dumps(result, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
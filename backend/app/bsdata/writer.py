@@ -0,0 +1,156 @@
+"""Batched writer for BSData sync.
+
+Parsed rows are staged in memory per model, keyed by ``bsdata_id``, and
+written with one executemany INSERT/UPDATE per model and column set instead
+of a SELECT plus ``add`` per row. Foreign keys to rows staged in the same
+run are expressed as ``Ref``s and resolved through in-memory id maps when
+the batch is flushed.
+"""
+
+from collections import defaultdict
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import bindparam, insert, update
+from sqlmodel import Session, SQLModel, select
+
+# Rows per executemany statement
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Ref(NamedTuple):
+    """Foreign key to a row identified by its bsdata_id."""
+
+    model: type[SQLModel]
+    bsdata_id: str
+
+
+class BulkWriter:
+    """Stage BSData rows and write them in batches.
+
+    ``upsert`` keeps the semantics of the former per-row upserts: a row whose
+    bsdata_id already exists (in the database or earlier in this run) is
+    updated, except for the ``keep`` columns and any ``keep_if_empty``
+    column whose new value is empty.
+    """
+
+    def __init__(self, session: Session, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.session = session
+        self.batch_size = batch_size
+        # model -> bsdata_id -> row id (None until re-read after an insert)
+        self._ids: dict[type[SQLModel], dict[str, Optional[int]]] = {}
+        # model -> bsdata_id -> staged column values
+        self._inserts: dict[type[SQLModel], dict[str, dict]] = defaultdict(dict)
+        self._updates: dict[type[SQLModel], dict[str, dict]] = defaultdict(dict)
+        # Rows without a bsdata_id (link tables), insert only
+        self._links: dict[type[SQLModel], list[dict]] = defaultdict(list)
+        self.statements = 0
+
+    def _load_ids(self, model: type[SQLModel]) -> dict[str, Optional[int]]:
+        rows = self.session.execute(select(model.bsdata_id, model.id)).all()
+        self.statements += 1
+        self._ids[model] = dict(rows)
+        return self._ids[model]
+
+    def _known_ids(self, model: type[SQLModel]) -> dict[str, Optional[int]]:
+        if model not in self._ids:
+            return self._load_ids(model)
+        return self._ids[model]
+
+    def upsert(
+        self,
+        model: type[SQLModel],
+        values: dict[str, Any],
+        keep: tuple[str, ...] = (),
+        keep_if_empty: tuple[str, ...] = (),
+    ) -> Ref:
+        """Stage an insert or update of ``model`` keyed by ``values["bsdata_id"]``."""
+        bsdata_id = values["bsdata_id"]
+        staged = self._inserts[model].get(bsdata_id)
+        if staged is None:
+            if bsdata_id not in self._known_ids(model):
+                self._inserts[model][bsdata_id] = dict(values)
+                return Ref(model, bsdata_id)
+            staged = self._updates[model].setdefault(bsdata_id, {})
+
+        for column, value in values.items():
+            if column == "bsdata_id" or column in keep:
+                continue
+            if column in keep_if_empty and not value:
+                continue
+            staged[column] = value
+        return Ref(model, bsdata_id)
+
+    def add(self, model: type[SQLModel], values: dict[str, Any]) -> None:
+        """Stage an insert-only row (e.g. a link table entry)."""
+        self._links[model].append(values)
+
+    def resolve(self, ref: Ref) -> Optional[int]:
+        """Row id of a referenced row that has already been written."""
+        ids = self._known_ids(ref.model)
+        if ids.get(ref.bsdata_id) is None and ref.bsdata_id in ids:
+            ids = self._load_ids(ref.model)
+        return ids.get(ref.bsdata_id)
+
+    def _execute(self, statement, rows: list[dict]) -> None:
+        # Group by column set so every executemany batch is homogeneous
+        groups: dict[tuple, list[dict]] = defaultdict(list)
+        for row in rows:
+            groups[tuple(sorted(row))].append(row)
+        for group in groups.values():
+            for start in range(0, len(group), self.batch_size):
+                self.session.execute(statement, group[start : start + self.batch_size])
+                self.statements += 1
+
+    def _resolved(self, rows: list[dict]) -> list[dict]:
+        return [
+            {
+                column: self.resolve(value) if isinstance(value, Ref) else value
+                for column, value in row.items()
+            }
+            for row in rows
+        ]
+
+    def flush(self) -> None:
+        """Write all staged rows, referenced (parent) models first."""
+        staged_rows = [
+            *(row for rows in self._inserts.values() for row in rows.values()),
+            *(row for rows in self._updates.values() for row in rows.values()),
+            *(row for rows in self._links.values() for row in rows),
+        ]
+        parents = {
+            value.model
+            for row in staged_rows
+            for value in row.values()
+            if isinstance(value, Ref)
+        }
+        models = sorted(
+            {*self._inserts, *self._updates, *self._links},
+            key=lambda model: model not in parents,
+        )
+
+        for model in models:
+            inserts = self._inserts.pop(model, {})
+            updates = self._updates.pop(model, {})
+            links = self._links.pop(model, [])
+
+            if inserts:
+                self._execute(insert(model), self._resolved(list(inserts.values())))
+                # Ids of new rows are read back only if something references them
+                known = self._known_ids(model)
+                for bsdata_id in inserts:
+                    known.setdefault(bsdata_id, None)
+
+            update_rows = [
+                {**row, "_bsdata_id": bsdata_id}
+                for bsdata_id, row in updates.items()
+                if row
+            ]
+            if update_rows:
+                table = model.__table__
+                statement = update(table).where(
+                    table.c.bsdata_id == bindparam("_bsdata_id")
+                )
+                self._execute(statement, self._resolved(update_rows))
+
+            if links:
+                self._execute(insert(model), self._resolved(links))
@@ -13,6 +13,50 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
 
+    # Database connection pool (PostgreSQL)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = -1  # Seconds before a connection is recycled (-1 = never)
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None  # None = server default
+
+    # Per-request DB timing headers and /metrics
+    DB_METRICS_ENABLED: bool = True
+    # Bearer token Prometheus must send to scrape /metrics (unset = no /metrics)
+    METRICS_TOKEN: Optional[str] = None
+
+    # Authenticated user cache (0 disables)
+    USER_CACHE_MAX_ENTRIES: int = 4096
+    USER_CACHE_TTL: int = 30  # Seconds; bounds staleness in other workers
+
+    # Seconds between AppSettings version checks in other workers
+    SETTINGS_CACHE_VERSION_TTL: int = 5
+
+    # BSData response cache
+    BSDATA_CACHE_MAX_ENTRIES: int = 2048  # 0 disables the cache
+    BSDATA_CACHE_VERSION_TTL: int = 30  # Seconds between sync commit checks
+    BSDATA_LIST_CACHE_MAX_ENTRIES: int = 1024  # Parsed army lists, 0 disables
+
+    # Matchup ids reserved per database round trip
+    MATCHUP_ID_BLOCK_SIZE: int = 100
+    # Idle seconds between SSE keepalive comments on matchup event streams
+    MATCHUP_EVENTS_KEEPALIVE_SECONDS: int = 20
+
+    # BSData sync catalog parsing processes. Syncs run inside a web worker,
+    # so keep this small; 1 parses in-process, 0 uses one per CPU core
+    BSDATA_SYNC_WORKERS: int = 2
+    # Pre-sync snapshots of the rules rows kept for rollback
+    BSDATA_SNAPSHOTS_KEPT: int = 3
+    # Active sync jobs without progress for this long are treated as abandoned
+    BSDATA_SYNC_JOB_STALE_SECONDS: int = 1800
+    # BSData tarball: local .tar.gz path or mirror URL (empty = GitHub main)
+    BSDATA_TARBALL_SOURCE: str = ""
+
+    # Background scheduler (auto-confirm sweeps); one leader across workers
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TICK_SECONDS: int = 60
+    SCHEDULER_LEASE_SECONDS: int = 180  # Leader is replaced after this silence
+
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
@@ -0,0 +1,162 @@
+"""Per-request database timing: query count, DB time and pool checkout wait."""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class RequestDbStats:
+    """Database usage collected while handling a single request."""
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.pool_wait = 0.0
+
+    @property
+    def db_time_ms(self) -> float:
+        return round(self.db_time * 1000, 2)
+
+    @property
+    def pool_wait_ms(self) -> float:
+        return round(self.pool_wait * 1000, 2)
+
+
+class DbMetricsTotals:
+    """Process-wide totals exposed on /metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.queries = 0
+        self.db_time = 0.0
+        self.pool_wait = 0.0
+        self.pool_wait_max = 0.0
+
+    def add_request(self, stats: RequestDbStats) -> None:
+        with self._lock:
+            self.requests += 1
+            self.queries += stats.query_count
+            self.db_time += stats.db_time
+            self.pool_wait += stats.pool_wait
+            self.pool_wait_max = max(self.pool_wait_max, stats.pool_wait)
+
+
+_current_stats: ContextVar[Optional[RequestDbStats]] = ContextVar(
+    "request_db_stats", default=None
+)
+totals = DbMetricsTotals()
+
+
+def start_request_stats() -> RequestDbStats:
+    """Starts collecting DB stats for the current request context."""
+    stats = RequestDbStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def finish_request_stats(stats: RequestDbStats) -> None:
+    """Adds a finished request's stats to the process totals."""
+    _current_stats.set(None)
+    totals.add_request(stats)
+
+
+def _record_pool_wait(elapsed: float) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.pool_wait += elapsed
+
+
+class _CheckoutTimingMixin:
+    """Records how long each pool checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _record_pool_wait(time.perf_counter() - started)
+
+
+class TimedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Counts queries and DB time for the current request on this engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _finish_query(conn) -> None:
+        started = conn.info["query_started"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.query_count += 1
+            stats.db_time += time.perf_counter() - started
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        _finish_query(conn)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # after_cursor_execute does not fire for a failed statement, so its
+        # start time must be popped here or the next query reads it
+        conn = exception_context.connection
+        if (
+            conn is not None
+            and exception_context.execution_context is not None
+            and conn.info.get("query_started")
+        ):
+            _finish_query(conn)
+
+
+def pool_status(engine: Engine) -> dict:
+    """Current pool occupancy (only queue pools report sizes)."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checked_in": pool.checkedin(),
+    }
+
+
+def render_metrics(engines: dict[str, Engine]) -> str:
+    """Renders DB totals and pool occupancy in Prometheus text format."""
+    lines = [
+        "# TYPE db_requests_total counter",
+        f"db_requests_total {totals.requests}",
+        "# TYPE db_queries_total counter",
+        f"db_queries_total {totals.queries}",
+        "# TYPE db_time_seconds_total counter",
+        f"db_time_seconds_total {totals.db_time:.6f}",
+        "# TYPE db_pool_wait_seconds_total counter",
+        f"db_pool_wait_seconds_total {totals.pool_wait:.6f}",
+        "# TYPE db_pool_wait_seconds_max gauge",
+        f"db_pool_wait_seconds_max {totals.pool_wait_max:.6f}",
+    ]
+    pools = {name: pool_status(engine) for name, engine in engines.items()}
+    for key in ("size", "checked_out", "overflow", "checked_in"):
+        samples = [
+            f'db_pool_{key}{{engine="{name}"}} {status[key]}'
+            for name, status in pools.items()
+            if key in status
+        ]
+        if samples:
+            lines.append(f"# TYPE db_pool_{key} gauge")
+            lines.extend(samples)
+    return "\n".join(lines) + "\n"
@@ -1,8 +1,11 @@
+import secrets
 from typing import Optional
 
+from app.config import settings
 from app.core.security import decode_access_token
+from app.core.settings_cache import settings_cache
 from app.db import get_session
-from app.league.models import AppSettings
+from app.users.cache import user_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlmodel import Session, select
@@ -10,6 +13,18 @@ from sqlmodel import Session, select
 security = HTTPBearer(auto_error=False)
 
 
+def _load_user(session: Session, user_id: int):
+    """User by id, from the user cache when possible."""
+    from app.users.models import User
+
+    user = user_cache.get(session, user_id)
+    if user is None:
+        user = session.exec(select(User).where(User.id == user_id)).first()
+        if user:
+            user_cache.put(user)
+    return user
+
+
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     session: Session = Depends(get_session),
@@ -28,12 +43,7 @@ async def get_current_user_optional(
     if not user_id:
         return None
 
-    from app.users.models import User
-
-    statement = select(User).where(User.id == int(user_id))
-    user = session.exec(statement).first()
-
-    return user
+    return _load_user(session, int(user_id))
 
 
 async def get_current_user(
@@ -66,10 +76,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    from app.users.models import User
-
-    statement = select(User).where(User.id == int(user_id))
-    user = session.exec(statement).first()
+    user = _load_user(session, int(user_id))
 
     if not user:
         raise HTTPException(
@@ -111,11 +118,25 @@ async def require_rules_enabled(
     """Block access to rules/bsdata when rules feature is disabled. Admin always passes."""
     if current_user.role == "admin":
         return current_user
-    statement = select(AppSettings).where(AppSettings.key == "rules_enabled")
-    setting = session.scalars(statement).first()
-    if not setting or setting.value != "true":
+    if settings_cache.get(session, "rules_enabled", "false") != "true":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Rules feature is disabled",
         )
     return current_user
+
+
+async def require_metrics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+):
+    """Guard /metrics with METRICS_TOKEN; the endpoint is hidden when unset."""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials, settings.METRICS_TOKEN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
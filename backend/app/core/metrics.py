@@ -0,0 +1,219 @@
+"""In-process metrics registry rendered in Prometheus text format."""
+
+import threading
+from typing import Optional
+
+# Default latency buckets (seconds) for HTTP requests
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(
+                    f"{self.name}{_format_labels(self.labelnames, key)} {value:g}"
+                )
+        return lines
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> (bucket counts, sum, count)
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        with self._lock:
+            for key, (bucket_counts, total, count) in sorted(self._values.items()):
+                for bound, bucket_count in zip(self.buckets, bucket_counts):
+                    labels = _format_labels(self.labelnames, key, f'le="{bound:g}"')
+                    lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+                labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {count}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {total:.6f}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds all metrics of the process."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: Optional[tuple] = None,
+    ) -> Histogram:
+        return self._register(
+            Histogram(name, documentation, labelnames, buckets or DEFAULT_BUCKETS)
+        )
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# ============ HTTP ============
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total",
+    "HTTP requests by method, route and status code.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route.",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+)
+
+# ============ Domain events ============
+
+MATCHES_CONFIRMED = registry.counter(
+    "league_matches_confirmed_total",
+    "League match results confirmed, by phase.",
+    ("phase",),
+)
+ELO_UPDATES = registry.counter(
+    "elo_updates_total",
+    "Matches applied to player ELO ratings.",
+)
+BSDATA_SYNC_DURATION = registry.histogram(
+    "bsdata_sync_duration_seconds",
+    "BSData sync duration by outcome.",
+    ("status",),
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200),
+)
+BSDATA_CACHE_REQUESTS = registry.counter(
+    "bsdata_cache_requests_total",
+    "BSData response cache lookups by result.",
+    ("result",),
+)
+ARMY_STATS_REBUILDS = registry.counter(
+    "army_stats_rebuilds_total",
+    "Full army statistics rebuilds.",
+)
+ARMY_STATS_REBUILD_DURATION = registry.histogram(
+    "army_stats_rebuild_duration_seconds",
+    "Duration of full army statistics rebuilds.",
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+SCHEDULER_TASK_RUNS = registry.counter(
+    "scheduler_task_runs_total",
+    "Background scheduler task runs by task and outcome.",
+    ("task", "outcome"),
+)
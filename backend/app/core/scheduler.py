@@ -0,0 +1,128 @@
+"""In-process scheduler for periodic background sweeps.
+
+Every worker runs the loop, but only the holder of the ``scheduler`` lease
+row in ``scheduler_leases`` executes tasks. The leader renews the lease on
+every tick; if it dies, another worker takes over once the lease expires.
+Tasks are plain functions taking a session and returning how many rows they
+processed; they run on a thread so the event loop is never blocked.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple, Optional
+
+from app.core.metrics import SCHEDULER_TASK_RUNS
+from app.league.models import SchedulerLease
+from sqlalchemy import insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "scheduler"
+
+
+class PeriodicTask(NamedTuple):
+    name: str
+    interval: float  # Seconds between runs
+    run: Callable[[Session], int]
+
+
+class Scheduler:
+    """Run periodic tasks on the worker holding the scheduler lease."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        tasks: list[PeriodicTask],
+        tick_seconds: float,
+        lease_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.tasks = tasks
+        self.tick_seconds = tick_seconds
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._next_run = {task.name: 0.0 for task in tasks}
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def acquire_lease(self, session: Session) -> bool:
+        """Take or renew the leader lease. Commits."""
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        renewed = session.execute(
+            update(SchedulerLease)
+            .where(
+                SchedulerLease.name == LEASE_NAME,
+                or_(
+                    SchedulerLease.owner == self.owner,
+                    SchedulerLease.expires_at < now,
+                ),
+            )
+            .values(owner=self.owner, expires_at=expires_at)
+        )
+        if renewed.rowcount == 0:
+            try:
+                session.execute(
+                    insert(SchedulerLease).values(
+                        name=LEASE_NAME, owner=self.owner, expires_at=expires_at
+                    )
+                )
+            except IntegrityError:
+                # Held by another worker
+                session.rollback()
+                return False
+        session.commit()
+        return True
+
+    def run_due(self) -> dict[str, int]:
+        """Run every task whose interval elapsed, if this worker leads."""
+        with self.session_factory() as session:
+            if not self.acquire_lease(session):
+                return {}
+
+        results = {}
+        for task in self.tasks:
+            now = time.monotonic()
+            if now < self._next_run[task.name]:
+                continue
+            self._next_run[task.name] = now + task.interval
+            try:
+                with self.session_factory() as session:
+                    results[task.name] = task.run(session)
+            except Exception:
+                logger.exception("Scheduled task %s failed", task.name)
+                SCHEDULER_TASK_RUNS.inc(task=task.name, outcome="failed")
+                continue
+            SCHEDULER_TASK_RUNS.inc(task=task.name, outcome="success")
+            if results[task.name]:
+                logger.info(
+                    "Scheduled task %s processed %s rows", task.name, results[task.name]
+                )
+        return results
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.run_due)
+            except Exception:
+                logger.exception("Scheduler tick failed")
+            await asyncio.sleep(self.tick_seconds)
+
+    def start(self) -> None:
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
@@ -0,0 +1,95 @@
+"""Process-wide cache of AppSettings.
+
+All settings are loaded with one query and served from memory. Writes
+through ``set_setting`` bump a ``settings_version`` row; other workers
+compare that counter at most every ``version_ttl`` seconds and reload when
+it changed.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from app.config import settings
+from sqlalchemy import Integer, String, cast, column, table
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, select
+
+VERSION_KEY = "settings_version"
+
+# Core view of AppSettings; importing the model here would be circular
+# (app.league.models -> app.player -> app.player.elo -> this module)
+_settings_table = table(
+    "app_settings", column("key"), column("value"), column("updated_at")
+)
+
+
+class SettingsCache:
+    """AppSettings key -> value, reloaded when the version counter moves."""
+
+    def __init__(self, version_ttl: float):
+        self.version_ttl = version_ttl
+        self._values: Optional[dict[str, str]] = None
+        self._version_checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self, session: Session) -> dict[str, str]:
+        rows = session.execute(
+            select(_settings_table.c.key, _settings_table.c.value)
+        ).all()
+        values = dict(rows)
+        with self._lock:
+            self._values = values
+            self._version_checked_at = time.monotonic()
+        return values
+
+    def _current(self, session: Session) -> dict[str, str]:
+        values = self._values
+        if values is None:
+            return self._load(session)
+
+        if time.monotonic() - self._version_checked_at >= self.version_ttl:
+            version = session.execute(
+                select(_settings_table.c.value).where(
+                    _settings_table.c.key == VERSION_KEY
+                )
+            ).scalar()
+            if version != values.get(VERSION_KEY):
+                return self._load(session)
+            self._version_checked_at = time.monotonic()
+        return values
+
+    def get(self, session: Session, key: str, default: str = "") -> str:
+        return self._current(session).get(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values = None
+            self._version_checked_at = 0.0
+
+
+def bump_settings_version(session: Session) -> None:
+    """Increment the version counter so other workers reload. Does not commit.
+
+    The increment happens in one upsert, so concurrent bumps never read the
+    same value and write the same next version.
+    """
+    dialect = session.get_bind().dialect.name
+    dialect_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    now = datetime.utcnow()
+    statement = dialect_insert(_settings_table).values(
+        key=VERSION_KEY, value="1", updated_at=now
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["key"],
+        set_={
+            "value": cast(cast(_settings_table.c.value, Integer) + 1, String),
+            "updated_at": now,
+        },
+    )
+    session.execute(statement)
+
+
+settings_cache = SettingsCache(version_ttl=settings.SETTINGS_CACHE_VERSION_TTL)
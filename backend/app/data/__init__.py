@@ -4,7 +4,13 @@ Data module - shared game data constants.
 This module contains all game-related constants like maps, factions, and battle plans.
 """
 
-from app.data.armies import ARMY_DETECTION_PATTERNS, ARMY_FACTIONS, detect_army_faction
+from app.data.armies import (
+    ARMY_DETECTION_PATTERNS,
+    ARMY_FACTIONS,
+    ArmyDetection,
+    detect_army,
+    detect_army_faction,
+)
 from app.data.maps import BATTLE_PLAN_DATA, MAP_IMAGES, MISSION_MAPS, draw_random_map
 
 __all__ = [
@@ -16,5 +22,7 @@ __all__ = [
     # Armies
     "ARMY_FACTIONS",
     "ARMY_DETECTION_PATTERNS",
+    "ArmyDetection",
+    "detect_army",
     "detect_army_faction",
 ]
@@ -1,5 +1,9 @@
 """Army faction data and detection for Age of Sigmar."""
 
+import re
+from collections import Counter
+from typing import NamedTuple
+
 # Age of Sigmar 4th Edition army factions
 ARMY_FACTIONS = [
     # Order
@@ -197,32 +201,80 @@ ARMY_DETECTION_PATTERNS = {
 }
 
 
-def detect_army_faction(army_list_text: str, max_lines: int = 10) -> str | None:
+class ArmyDetection(NamedTuple):
+    """Result of scanning an army list for faction keywords."""
+
+    faction: str
+    confidence: float  # Share of all hits that point to ``faction``
+    hits: list[tuple[str, str]]  # (matched keyword, faction) in text order
+
+
+def _build_detection_regex(terms: list[str]) -> re.Pattern:
+    # Longest terms first so "crypt horror" wins over "horror" at the same
+    # position; whole words only, allowing a plural suffix ("Clanrats")
+    alternation = "|".join(
+        re.escape(term) for term in sorted(terms, key=len, reverse=True)
+    )
+    return re.compile(rf"(?<!\w)({alternation})(?:e?s)?(?!\w)")
+
+
+# Lowercase term -> faction; exact faction names are ranked above keywords
+_FACTION_NAMES = {faction.lower(): faction for faction in ARMY_FACTIONS}
+_DETECTION_TERMS = {**ARMY_DETECTION_PATTERNS, **_FACTION_NAMES}
+_DETECTION_REGEX = _build_detection_regex(list(_DETECTION_TERMS))
+
+
+def detect_army(army_list_text: str, max_lines: int = 10) -> ArmyDetection | None:
     """
-    Detect army faction from the first N lines of an army list.
+    Detect the army faction of a list with a single pass over its first lines.
+
+    Factions named outright rank above factions found through unit keywords;
+    ties go to the faction with more hits, then to the one mentioned first.
 
     Args:
         army_list_text: The full army list text
         max_lines: Number of lines from the beginning to analyze (default 10)
 
     Returns:
-        Detected faction name or None if not detected
+        The best-scoring detection or None if nothing matched
     """
     if not army_list_text:
         return None
 
-    # Get first N lines
     lines = army_list_text.strip().split("\n")[:max_lines]
     text_to_search = "\n".join(lines).lower()
 
-    # First, try to match exact faction names (highest priority)
-    for faction in ARMY_FACTIONS:
-        if faction.lower() in text_to_search:
-            return faction
+    hits = [
+        (match.group(1), _DETECTION_TERMS[match.group(1)])
+        for match in _DETECTION_REGEX.finditer(text_to_search)
+    ]
+    if not hits:
+        return None
+
+    name_hits = Counter(faction for term, faction in hits if term in _FACTION_NAMES)
+    all_hits = Counter(faction for _, faction in hits)
+    first_hit = {}
+    for position, (_, faction) in enumerate(hits):
+        first_hit.setdefault(faction, position)
+
+    faction = max(
+        all_hits,
+        key=lambda f: (name_hits[f], all_hits[f], -first_hit[f]),
+    )
+    confidence = round(all_hits[faction] / len(hits), 2)
+    return ArmyDetection(faction, confidence, hits)
 
-    # Then try keyword patterns
-    for pattern, faction in ARMY_DETECTION_PATTERNS.items():
-        if pattern in text_to_search:
-            return faction
 
-    return None
+def detect_army_faction(army_list_text: str, max_lines: int = 10) -> str | None:
+    """
+    Detect army faction from the first N lines of an army list.
+
+    Args:
+        army_list_text: The full army list text
+        max_lines: Number of lines from the beginning to analyze (default 10)
+
+    Returns:
+        Detected faction name or None if not detected
+    """
+    detection = detect_army(army_list_text, max_lines)
+    return detection.faction if detection else None
@@ -1,5 +1,12 @@
 from app.config import settings
+from app.core.db_metrics import (
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    instrument_engine,
+)
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Create database engine with appropriate settings for the database type
 if settings.DATABASE_URL.startswith("sqlite"):
@@ -17,17 +24,72 @@ else:
         settings.DATABASE_URL,
         echo=settings.DEBUG,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        connect_args=(
+            {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+            if settings.DB_STATEMENT_TIMEOUT_MS
+            else {}
+        ),
     )
 
 
+def get_async_database_url(database_url: str) -> str:
+    """Maps a sync database URL onto its async driver (aiosqlite/asyncpg)."""
+    scheme, _, rest = database_url.partition("://")
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    if scheme.startswith("postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    return database_url
+
+
+# Async engine for read-heavy routes, so DB waits don't block the event loop
+if settings.DATABASE_URL.startswith("sqlite"):
+    async_engine = create_async_engine(
+        get_async_database_url(settings.DATABASE_URL),
+        echo=settings.DEBUG,
+    )
+else:
+    async_engine = create_async_engine(
+        get_async_database_url(settings.DATABASE_URL),
+        echo=settings.DEBUG,
+        pool_pre_ping=True,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        connect_args=(
+            {
+                "server_settings": {
+                    "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+                }
+            }
+            if settings.DB_STATEMENT_TIMEOUT_MS
+            else {}
+        ),
+    )
+
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+
 def get_session():
     """Dependency for getting database sessions."""
     with Session(engine) as session:
         yield session
 
 
+async def get_async_session():
+    """Dependency for getting async database sessions (read endpoints)."""
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
 def create_db_and_tables():
     """Create database tables. Called on startup."""
     # Import all models here to ensure they're registered
@@ -35,6 +97,9 @@ def create_db_and_tables():
         Artefact,
         BattleTacticCard,
         BattleTrait,
+        BSDataFileHash,
+        BSDataSnapshot,
+        BSDataSyncJob,
         BSDataSyncStatus,
         CoreAbility,
         Faction,
@@ -46,6 +111,7 @@ def create_db_and_tables():
         PrayerLore,
         RegimentOfRenown,
         RoRUnit,
+        SearchEntry,
         Spell,
         SpellLore,
         Unit,
@@ -57,12 +123,15 @@ def create_db_and_tables():
         ArmyMatchupStats,
         ArmyStats,
         Group,
+        GroupStanding,
         League,
         LeaguePlayer,
         Match,
         PlayerElo,
+        SchedulerLease,
     )
-    from app.matchup.models import Matchup  # noqa: F401
+    from app.lists.models import ArmyList  # noqa: F401
+    from app.matchup.models import Matchup, MatchupIdCounter  # noqa: F401
     from app.users.models import OAuthAccount, User  # noqa: F401
     from sqlmodel import SQLModel
 
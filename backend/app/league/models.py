@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -148,12 +148,14 @@ class LeaguePlayer(SQLModel, table=True):
 
     # Army list for group phase
     group_army_faction: Optional[str] = Field(default=None, max_length=50)
-    group_army_list: Optional[str] = None
+    group_army_list_id: Optional[int] = Field(default=None, foreign_key="army_lists.id")
     group_list_submitted_at: Optional[datetime] = None
 
     # Army list for knockout phase
     knockout_army_faction: Optional[str] = Field(default=None, max_length=50)
-    knockout_army_list: Optional[str] = None
+    knockout_army_list_id: Optional[int] = Field(
+        default=None, foreign_key="army_lists.id"
+    )
     knockout_list_submitted_at: Optional[datetime] = None
 
     # League statistics
@@ -236,10 +238,14 @@ class Match(SQLModel, table=True):
     player2_elo_after: Optional[int] = None
 
     # Per-match army lists (optional, blind exchange like matchups)
-    player1_army_list: Optional[str] = None
+    player1_army_list_id: Optional[int] = Field(
+        default=None, foreign_key="army_lists.id"
+    )
     player1_army_faction: Optional[str] = Field(default=None, max_length=50)
     player1_list_submitted_at: Optional[datetime] = None
-    player2_army_list: Optional[str] = None
+    player2_army_list_id: Optional[int] = Field(
+        default=None, foreign_key="army_lists.id"
+    )
     player2_army_faction: Optional[str] = Field(default=None, max_length=50)
     player2_list_submitted_at: Optional[datetime] = None
     lists_revealed_at: Optional[datetime] = None
@@ -266,7 +272,10 @@ class Match(SQLModel, table=True):
     @property
     def both_lists_submitted(self) -> bool:
         """Check if both players have submitted their army lists."""
-        return self.player1_army_list is not None and self.player2_army_list is not None
+        return (
+            self.player1_army_list_id is not None
+            and self.player2_army_list_id is not None
+        )
 
     @property
     def lists_revealed(self) -> bool:
@@ -285,6 +294,17 @@ class AppSettings(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class SchedulerLease(SQLModel, table=True):
+    """Leader lease for the background scheduler (one row per lease name)."""
+
+    __tablename__ = "scheduler_leases"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(unique=True, index=True, max_length=50)
+    owner: str = Field(max_length=100)
+    expires_at: datetime
+
+
 # Re-export PlayerElo from player module for backward compatibility
 # NOTE: This import MUST come after AppSettings to avoid circular import
 from app.player.models import PlayerElo  # noqa: E402, F401
@@ -310,6 +330,11 @@ class ArmyMatchupStats(SQLModel, table=True):
     """Cached faction vs faction statistics (excludes mirror matches)."""
 
     __tablename__ = "army_matchup_stats"
+    __table_args__ = (
+        UniqueConstraint(
+            "faction", "opponent_faction", name="uq_army_matchup_stats_pair"
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     faction: str = Field(index=True, max_length=100)
@@ -323,6 +348,36 @@ class ArmyMatchupStats(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class GroupStanding(SQLModel, table=True):
+    """Materialized group standings, refreshed whenever group results change."""
+
+    __tablename__ = "group_standings"
+    __table_args__ = (
+        Index(
+            "ix_group_standings_league_group_position",
+            "league_id",
+            "group_id",
+            "position",
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    league_id: int = Field(foreign_key="leagues.id", index=True)
+    group_id: int = Field(foreign_key="groups.id", index=True)
+    player_id: int = Field(foreign_key="league_players.id", unique=True)
+
+    # 1-based rank within the group
+    position: int
+
+    # Qualification for the knockout phase
+    qualifies: bool = Field(default=False)
+    qualifies_as_runner_up: bool = Field(default=False)
+    # Rank among runners-up across all groups (None if not a runner-up)
+    runner_up_rank: Optional[int] = None
+
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class VoteCategory(SQLModel, table=True):
     """Category for voting in a league (e.g., Best Sportsmanship)."""
 
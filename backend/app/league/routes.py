@@ -1,8 +1,9 @@
 """API endpoints for the league module."""
 
 import random
-from datetime import datetime, timedelta
+from datetime import datetime
 
+from app.bsdata.lists import parse_army_lists
 from app.core.deps import get_current_user, get_current_user_optional, require_role
 from app.db import get_session
 from app.league.constants import MISSION_MAPS
@@ -52,31 +53,34 @@ from app.league.service import (
     advance_to_next_knockout_round,
     all_round_matches_confirmed,
     break_tie_random,
-    calculate_knockout_size,
     calculate_phase_dates,
     cast_vote,
     change_player_group,
     close_voting,
     confirm_match_result,
     create_vote_category,
+    delete_league_rows,
     draw_groups,
     enable_voting_for_league,
     generate_group_matches,
     generate_knockout_matches,
     get_allowed_knockout_sizes,
-    get_group_standings,
     get_knockout_constraints,
     get_knockout_round_names,
     get_league_player_count,
+    get_league_standings,
     get_next_knockout_round,
     get_player_vote,
+    get_qualification_spots,
     get_qualified_players,
     get_qualifying_info,
     get_voting_results,
+    refresh_group_standings,
     remove_player_from_league,
     submit_match_result,
     update_match_deadlines,
 )
+from app.lists.service import load_army_list, load_army_lists, store_army_list
 from app.users.models import User
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func
@@ -377,6 +381,11 @@ async def update_league(
     if phase_dates_changed:
         update_match_deadlines(session, league)
 
+    # Knockout size drives qualification flags in materialized standings
+    if "knockout_size" in update_data:
+        refresh_group_standings(session, league)
+        session.commit()
+
     session.refresh(league)
 
     player_count = get_league_player_count(session, league_id)
@@ -407,7 +416,7 @@ async def delete_league(
             detail="League not found",
         )
 
-    session.delete(league)
+    delete_league_rows(session, league)
     session.commit()
 
 
@@ -482,7 +491,7 @@ async def join_league(
         discord_username=player.discord_username,
         username=current_user.username,
         joined_at=player.joined_at,
-        knockout_list_submitted=player.knockout_army_list is not None,
+        knockout_list_submitted=player.knockout_army_list_id is not None,
     )
 
 
@@ -638,6 +647,14 @@ async def list_players(
     )
     group_map = {g.id: g for g in groups}
 
+    # Bulk fetch visible army lists (1 query instead of N)
+    visible_list_ids = []
+    if league and league.group_lists_visible:
+        visible_list_ids += [p.group_army_list_id for p in players]
+    if league and league.knockout_lists_visible:
+        visible_list_ids += [p.knockout_army_list_id for p in players]
+    army_lists = load_army_lists(session, visible_list_ids)
+
     result = []
     for player in players:
         # Get user from cache
@@ -658,9 +675,9 @@ async def list_players(
         knockout_army_list = None
         if league:
             if league.group_lists_visible:
-                group_army_list = player.group_army_list
+                group_army_list = army_lists.get(player.group_army_list_id)
             if league.knockout_lists_visible:
-                knockout_army_list = player.knockout_army_list
+                knockout_army_list = army_lists.get(player.knockout_army_list_id)
 
         result.append(
             LeaguePlayerResponse(
@@ -682,10 +699,10 @@ async def list_players(
                 joined_at=player.joined_at,
                 group_army_faction=player.group_army_faction,
                 group_army_list=group_army_list,
-                group_list_submitted=player.group_army_list is not None,
+                group_list_submitted=player.group_army_list_id is not None,
                 knockout_army_faction=player.knockout_army_faction,
                 knockout_army_list=knockout_army_list,
-                knockout_list_submitted=player.knockout_army_list is not None,
+                knockout_list_submitted=player.knockout_army_list_id is not None,
             )
         )
 
@@ -1044,42 +1061,19 @@ async def get_standings(
     if num_groups == 0:
         return []
 
-    # Calculate knockout qualification rules
-    player_count = get_league_player_count(session, league_id)
-    knockout_size = league.knockout_size
-    if knockout_size is None:
-        knockout_size = calculate_knockout_size(player_count)
-    knockout_size = min(knockout_size, player_count)
-
-    guaranteed_per_group = knockout_size // num_groups
-    extra_spots = knockout_size % num_groups
+    guaranteed_per_group, extra_spots = get_qualification_spots(
+        session, league, num_groups
+    )
 
-    # First pass: collect all runners-up and all user_ids
-    runners_up = []  # (player_id, total_points, games_played, average_points, group_id)
-    group_standings_data = {}
+    # Materialized standings: one indexed read for all groups
+    group_standings_data = {group.id: [] for group in groups}
     all_user_ids = set()
-
-    for group in groups:
-        players = get_group_standings(session, group.id)
-        group_standings_data[group.id] = players
-
-        # Collect user_ids for bulk fetching
-        for player in players:
-            if player.user_id:
-                all_user_ids.add(player.user_id)
-
-        # Collect runner-up (position after guaranteed spots)
-        if extra_spots > 0 and len(players) > guaranteed_per_group:
-            runner_up = players[guaranteed_per_group]
-            runners_up.append(
-                (
-                    runner_up.id,
-                    runner_up.total_points,
-                    runner_up.games_played,
-                    runner_up.average_points,
-                    group.id,
-                )
-            )
+    for standing, player in get_league_standings(session, league):
+        group_standings_data.setdefault(standing.group_id, []).append(
+            (standing, player)
+        )
+        if player.user_id:
+            all_user_ids.add(player.user_id)
 
     # Bulk fetch all users (1 query instead of N)
     users = (
@@ -1089,19 +1083,28 @@ async def get_standings(
     )
     user_map = {u.id: u for u in users}
 
-    # Sort runners-up and find which ones qualify
-    runners_up.sort(
-        key=lambda r: (-r[1], r[2], -r[3])
-    )  # points desc, games asc, avg desc
-    qualifying_runner_up_ids = {r[0] for r in runners_up[:extra_spots]}
-
-    # Second pass: build response with qualification flags
+    # Bulk fetch the visible lists of the current phase (1 query instead of N)
+    knockout = league.status == "knockout_phase"
+    visible = league.knockout_lists_visible if knockout else league.group_lists_visible
+    army_lists = {}
+    if visible:
+        army_lists = load_army_lists(
+            session,
+            [
+                player.knockout_army_list_id if knockout else player.group_army_list_id
+                for players in group_standings_data.values()
+                for _, player in players
+            ],
+        )
+    parsed_lists = await parse_army_lists(session, army_lists.values())
+
+    # Build response with qualification flags
     result = []
     for group in groups:
         players = group_standings_data[group.id]
 
         standings = []
-        for position, player in enumerate(players, 1):
+        for standing, player in players:
             # Get user from cache
             username = None
             avatar_url = None
@@ -1110,29 +1113,24 @@ async def get_standings(
                 username = user.username
                 avatar_url = user.avatar_url
 
-            qualifies = position <= guaranteed_per_group
-            qualifies_as_runner_up = (
-                not qualifies and player.id in qualifying_runner_up_ids
-            )
-
             # Show army faction and list based on phase
             army_faction = None
             army_list = None
             list_submitted = False
             if league.status == "knockout_phase":
                 army_faction = player.knockout_army_faction
-                list_submitted = player.knockout_army_list is not None
+                list_submitted = player.knockout_army_list_id is not None
                 if league.knockout_lists_visible:
-                    army_list = player.knockout_army_list
+                    army_list = army_lists.get(player.knockout_army_list_id)
             else:
                 army_faction = player.group_army_faction
-                list_submitted = player.group_army_list is not None
+                list_submitted = player.group_army_list_id is not None
                 if league.group_lists_visible:
-                    army_list = player.group_army_list
+                    army_list = army_lists.get(player.group_army_list_id)
 
             standings.append(
                 StandingsEntry(
-                    position=position,
+                    position=standing.position,
                     player_id=player.id,
                     user_id=player.user_id,
                     username=username,
@@ -1140,6 +1138,7 @@ async def get_standings(
                     avatar_url=avatar_url,
                     army_faction=army_faction,
                     army_list=army_list,
+                    parsed_army_list=parsed_lists.get(army_list),
                     list_submitted=list_submitted,
                     games_played=player.games_played,
                     games_won=player.games_won,
@@ -1147,8 +1146,8 @@ async def get_standings(
                     games_lost=player.games_lost,
                     total_points=player.total_points,
                     average_points=player.average_points,
-                    qualifies=qualifies,
-                    qualifies_as_runner_up=qualifies_as_runner_up,
+                    qualifies=standing.qualifies,
+                    qualifies_as_runner_up=standing.qualifies_as_runner_up,
                 )
             )
 
@@ -1179,20 +1178,7 @@ async def list_matches(
     # Get league for list visibility settings
     league = session.scalars(select(League).where(League.id == league_id)).first()
 
-    # Auto-confirm matches pending for more than 24 hours
-    if league and league.status not in ("finished",):
-        auto_confirm_cutoff = datetime.utcnow() - timedelta(hours=24)
-        pending_old = session.scalars(
-            select(Match).where(
-                Match.league_id == league_id,
-                Match.status == "pending_confirmation",
-                Match.submitted_at < auto_confirm_cutoff,
-            )
-        ).all()
-
-        for match in pending_old:
-            confirm_match_result(session, match, match.submitted_by_id)
-
+    # Stale pending results are confirmed by the background scheduler
     statement = select(Match).where(Match.league_id == league_id)
     if phase:
         statement = statement.where(Match.phase == phase)
@@ -1237,6 +1223,25 @@ async def list_matches(
     )
     group_map = {g.id: g for g in groups}
 
+    # Bulk fetch the army lists that will be shown (1 query instead of N)
+    visible_list_ids = []
+    for match in matches:
+        if match.lists_revealed:
+            visible_list_ids += [match.player1_army_list_id, match.player2_army_list_id]
+        if not league:
+            continue
+        for player in (
+            player_map.get(match.player1_id),
+            player_map.get(match.player2_id),
+        ):
+            if not player:
+                continue
+            if match.phase == "group" and league.group_lists_visible:
+                visible_list_ids.append(player.group_army_list_id)
+            elif match.phase == "knockout" and league.knockout_lists_visible:
+                visible_list_ids.append(player.knockout_army_list_id)
+    army_lists = load_army_lists(session, visible_list_ids)
+
     result = []
     for match in matches:
         p1 = player_map.get(match.player1_id)
@@ -1276,11 +1281,11 @@ async def list_matches(
         p2_army_list = None
         if league:
             if match.phase == "group" and league.group_lists_visible:
-                p1_army_list = p1.group_army_list if p1 else None
-                p2_army_list = p2.group_army_list if p2 else None
+                p1_army_list = army_lists.get(p1.group_army_list_id) if p1 else None
+                p2_army_list = army_lists.get(p2.group_army_list_id) if p2 else None
             elif match.phase == "knockout" and league.knockout_lists_visible:
-                p1_army_list = p1.knockout_army_list if p1 else None
-                p2_army_list = p2.knockout_army_list if p2 else None
+                p1_army_list = army_lists.get(p1.knockout_army_list_id) if p1 else None
+                p2_army_list = army_lists.get(p2.knockout_army_list_id) if p2 else None
 
         # Get group info from cached data
         group_id = None
@@ -1295,8 +1300,8 @@ async def list_matches(
         match_p1_faction = None
         match_p2_faction = None
         if match.lists_revealed:
-            match_p1_list = match.player1_army_list
-            match_p2_list = match.player2_army_list
+            match_p1_list = army_lists.get(match.player1_army_list_id)
+            match_p2_list = army_lists.get(match.player2_army_list_id)
             match_p1_faction = match.player1_army_faction
             match_p2_faction = match.player2_army_faction
 
@@ -1311,24 +1316,28 @@ async def list_matches(
                 league
                 and league.has_knockout_phase_lists
                 and p1
-                and p1.knockout_army_list
+                and p1.knockout_army_list_id
             )
             p2_has_league_list = (
                 league
                 and league.has_knockout_phase_lists
                 and p2
-                and p2.knockout_army_list
+                and p2.knockout_army_list_id
             )
         else:
             p1_has_league_list = (
-                league and league.has_group_phase_lists and p1 and p1.group_army_list
+                league and league.has_group_phase_lists and p1 and p1.group_army_list_id
             )
             p2_has_league_list = (
-                league and league.has_group_phase_lists and p2 and p2.group_army_list
+                league and league.has_group_phase_lists and p2 and p2.group_army_list_id
             )
 
-        p1_list_submitted = bool(match.player1_army_list) or bool(p1_has_league_list)
-        p2_list_submitted = bool(match.player2_army_list) or bool(p2_has_league_list)
+        p1_list_submitted = match.player1_army_list_id is not None or bool(
+            p1_has_league_list
+        )
+        p2_list_submitted = match.player2_army_list_id is not None or bool(
+            p2_has_league_list
+        )
 
         lists_are_revealed = match.lists_revealed
         if not lists_are_revealed and league:
@@ -1439,8 +1448,8 @@ async def get_match_detail(
     # Determine army faction and list based on phase
     p1_army_faction = None
     p2_army_faction = None
-    p1_army_list = None
-    p2_army_list = None
+    p1_army_list_id = None
+    p2_army_list_id = None
     if player1 and player2:
         if match.phase == "knockout":
             p1_army_faction = player1.knockout_army_faction
@@ -1455,8 +1464,8 @@ async def get_match_detail(
                     or current_user.role == "admin"
                 )
             ):
-                p1_army_list = player1.knockout_army_list
-                p2_army_list = player2.knockout_army_list
+                p1_army_list_id = player1.knockout_army_list_id
+                p2_army_list_id = player2.knockout_army_list_id
         else:
             p1_army_faction = player1.group_army_faction
             p2_army_faction = player2.group_army_faction
@@ -1469,8 +1478,8 @@ async def get_match_detail(
                     or current_user.role == "admin"
                 )
             ):
-                p1_army_list = player1.group_army_list
-                p2_army_list = player2.group_army_list
+                p1_army_list_id = player1.group_army_list_id
+                p2_army_list_id = player2.group_army_list_id
 
     # Determine permissions
     is_participant = bool(
@@ -1495,24 +1504,28 @@ async def get_match_detail(
     if match.phase == "knockout":
         lists_required_for_phase = league.has_knockout_phase_lists
         p1_has_league_list = (
-            lists_required_for_phase and player1 and player1.knockout_army_list
+            lists_required_for_phase and player1 and player1.knockout_army_list_id
         )
         p2_has_league_list = (
-            lists_required_for_phase and player2 and player2.knockout_army_list
+            lists_required_for_phase and player2 and player2.knockout_army_list_id
         )
     else:
         lists_required_for_phase = league.has_group_phase_lists
         p1_has_league_list = (
-            lists_required_for_phase and player1 and player1.group_army_list
+            lists_required_for_phase and player1 and player1.group_army_list_id
         )
         p2_has_league_list = (
-            lists_required_for_phase and player2 and player2.group_army_list
+            lists_required_for_phase and player2 and player2.group_army_list_id
         )
     can_submit_army_list = not lists_required_for_phase
 
     # Player has list if per-match submitted OR league-required list exists
-    p1_list_submitted = bool(match.player1_army_list) or bool(p1_has_league_list)
-    p2_list_submitted = bool(match.player2_army_list) or bool(p2_has_league_list)
+    p1_list_submitted = match.player1_army_list_id is not None or bool(
+        p1_has_league_list
+    )
+    p2_list_submitted = match.player2_army_list_id is not None or bool(
+        p2_has_league_list
+    )
 
     # Lists are revealed if per-match lists revealed OR if league lists are visible
     lists_are_revealed = match.lists_revealed
@@ -1523,8 +1536,12 @@ async def get_match_detail(
             lists_are_revealed = True
 
     # Per-match lists - use them if revealed, otherwise use league lists
-    final_p1_list = match.player1_army_list if match.lists_revealed else p1_army_list
-    final_p2_list = match.player2_army_list if match.lists_revealed else p2_army_list
+    if match.lists_revealed:
+        p1_army_list_id = match.player1_army_list_id
+        p2_army_list_id = match.player2_army_list_id
+    army_lists = load_army_lists(session, [p1_army_list_id, p2_army_list_id])
+    final_p1_list = army_lists.get(p1_army_list_id)
+    final_p2_list = army_lists.get(p2_army_list_id)
     final_p1_faction = (
         match.player1_army_faction
         if match.lists_revealed and match.player1_army_faction
@@ -1696,27 +1713,24 @@ async def submit_match_army_list(
         )
 
     # Auto-detect faction if not provided
-    army_faction = data.army_faction
-    if not army_faction:
-        from app.matchup.constants import detect_army_faction
-
-        army_faction = detect_army_faction(data.army_list)
+    army_list = store_army_list(session, data.army_list)
+    army_faction = data.army_faction or army_list.faction
 
     # Determine which player's list to update
     if is_player1:
-        if match.player1_army_list is not None:
+        if match.player1_army_list_id is not None:
             raise HTTPException(
                 status_code=400, detail="You have already submitted your list"
             )
-        match.player1_army_list = data.army_list
+        match.player1_army_list_id = army_list.id
         match.player1_army_faction = army_faction
         match.player1_list_submitted_at = datetime.utcnow()
     else:
-        if match.player2_army_list is not None:
+        if match.player2_army_list_id is not None:
             raise HTTPException(
                 status_code=400, detail="You have already submitted your list"
             )
-        match.player2_army_list = data.army_list
+        match.player2_army_list_id = army_list.id
         match.player2_army_faction = army_faction
         match.player2_list_submitted_at = datetime.utcnow()
 
@@ -2115,7 +2129,7 @@ async def submit_group_list(
         )
 
     player.group_army_faction = data.army_faction
-    player.group_army_list = data.army_list
+    player.group_army_list_id = store_army_list(session, data.army_list).id
     player.group_list_submitted_at = datetime.utcnow()
     session.add(player)
     session.commit()
@@ -2172,7 +2186,7 @@ async def get_group_list(
         player_id=player.id,
         username=username,
         army_faction=player.group_army_faction,
-        army_list=player.group_army_list,
+        army_list=load_army_list(session, player.group_army_list_id),
         submitted_at=player.group_list_submitted_at,
     )
 
@@ -2299,7 +2313,7 @@ async def edit_group_list_organizer(
         )
 
     player.group_army_faction = data.army_faction
-    player.group_army_list = data.army_list
+    player.group_army_list_id = store_army_list(session, data.army_list).id
     player.group_list_submitted_at = datetime.utcnow()
     session.add(player)
     session.commit()
@@ -2435,7 +2449,7 @@ async def submit_knockout_list(
         )
 
     player.knockout_army_faction = data.army_faction
-    player.knockout_army_list = data.army_list
+    player.knockout_army_list_id = store_army_list(session, data.army_list).id
     player.knockout_list_submitted_at = datetime.utcnow()
     session.add(player)
     session.commit()
@@ -2498,7 +2512,7 @@ async def get_knockout_list(
         player_id=player.id,
         username=username,
         army_faction=player.knockout_army_faction,
-        army_list=player.knockout_army_list,
+        army_list=load_army_list(session, player.knockout_army_list_id),
         submitted_at=player.knockout_list_submitted_at,
     )
 
@@ -2539,7 +2553,7 @@ async def edit_knockout_list_organizer(
         )
 
     player.knockout_army_faction = data.army_faction
-    player.knockout_army_list = data.army_list
+    player.knockout_army_list_id = store_army_list(session, data.army_list).id
     player.knockout_list_submitted_at = datetime.utcnow()
     session.add(player)
     session.commit()
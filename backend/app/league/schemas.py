@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
+from app.bsdata.schemas import ParsedArmyList
 from pydantic import BaseModel, ConfigDict, Field
 
 # ============ League Schemas ============
@@ -192,6 +193,8 @@ class StandingsEntry(BaseModel):
     avatar_url: Optional[str] = None
     army_faction: Optional[str] = None  # Current phase army faction
     army_list: Optional[str] = None  # Army list text (if visible)
+    # Units and points checked against BSData (if visible and rules enabled)
+    parsed_army_list: Optional[ParsedArmyList] = None
     list_submitted: bool = False  # Whether list is submitted for current phase
     games_played: int
     games_won: int
@@ -1,15 +1,24 @@
 """Business logic for the league module."""
 
+import logging
 import math
 import random
+import time
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Optional
 
+from app.core.metrics import (
+    ARMY_STATS_REBUILD_DURATION,
+    ARMY_STATS_REBUILDS,
+    MATCHES_CONFIRMED,
+)
 from app.league.elo import get_or_create_player_elo, update_elo_after_match
 from app.league.models import (
     ArmyMatchupStats,
     ArmyStats,
     Group,
+    GroupStanding,
     League,
     LeaguePlayer,
     Match,
@@ -18,8 +27,17 @@ from app.league.models import (
     VoteCategory,
 )
 from app.league.scoring import calculate_match_points
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
+logger = logging.getLogger(__name__)
+
+# Results not confirmed by the opponent are confirmed automatically after this
+AUTO_CONFIRM_AFTER = timedelta(hours=24)
+
 
 def update_match_deadlines(session: Session, league: League) -> int:
     """Updates all match deadlines to match their phase end date."""
@@ -53,133 +71,163 @@ def update_match_deadlines(session: Session, league: League) -> int:
     return updated
 
 
-def recalculate_all_army_stats(session: Session) -> dict:
-    """Recalculates all army stats from confirmed matches. Run once to populate cache."""
-    # Clear existing stats
-    session.query(ArmyStats).delete()
-    session.query(ArmyMatchupStats).delete()
+# Counter columns shared by ArmyStats and ArmyMatchupStats
+_COUNTER_COLUMNS = ("games_played", "wins", "draws", "losses")
+_RESULT_COLUMNS = {"win": "wins", "draw": "draws", "loss": "losses"}
+
 
-    # Get all confirmed matches
-    matches = session.scalars(select(Match).where(Match.status == "confirmed")).all()
+def _match_outcomes(player1_score: int, player2_score: int) -> tuple[str, str]:
+    """Returns (player1 result, player2 result) as win/draw/loss."""
+    if player1_score > player2_score:
+        return "win", "loss"
+    if player1_score < player2_score:
+        return "loss", "win"
+    return "draw", "draw"
 
-    stats_count = 0
-    matchup_count = 0
 
-    for match in matches:
-        # Get players
-        player1 = session.scalars(
-            select(LeaguePlayer).where(LeaguePlayer.id == match.player1_id)
-        ).first()
-        player2 = session.scalars(
-            select(LeaguePlayer).where(LeaguePlayer.id == match.player2_id)
-        ).first()
-
-        if not player1 or not player2:
-            continue
+def recalculate_all_army_stats(session: Session) -> dict:
+    """
+    Rebuilds all army stats from confirmed matches.
 
-        # Get factions
-        if match.phase == "knockout":
-            p1_faction = player1.knockout_army_faction
-            p2_faction = player2.knockout_army_faction
+    Confirmed matches are loaded together with both players' factions in a
+    single query, counters are aggregated in memory and the cache tables are
+    rewritten with bulk inserts inside one transaction.
+    """
+    started = time.perf_counter()
+
+    player1 = aliased(LeaguePlayer)
+    player2 = aliased(LeaguePlayer)
+    rows = session.execute(
+        select(
+            Match.phase,
+            Match.player1_score,
+            Match.player2_score,
+            player1.group_army_faction,
+            player1.knockout_army_faction,
+            player2.group_army_faction,
+            player2.knockout_army_faction,
+        )
+        .join(player1, player1.id == Match.player1_id)
+        .join(player2, player2.id == Match.player2_id)
+        .where(Match.status == "confirmed")
+    ).all()
+
+    # faction -> {games_played, wins, draws, losses}
+    faction_totals: dict[str, Counter] = defaultdict(Counter)
+    matchup_totals: dict[tuple[str, str], Counter] = defaultdict(Counter)
+
+    for (
+        phase,
+        player1_score,
+        player2_score,
+        p1_group_faction,
+        p1_knockout_faction,
+        p2_group_faction,
+        p2_knockout_faction,
+    ) in rows:
+        if phase == "knockout":
+            p1_faction, p2_faction = p1_knockout_faction, p2_knockout_faction
         else:
-            p1_faction = player1.group_army_faction
-            p2_faction = player2.group_army_faction
+            p1_faction, p2_faction = p1_group_faction, p2_group_faction
 
         if not p1_faction and not p2_faction:
             continue
 
-        # Determine results
-        if match.player1_score > match.player2_score:
-            p1_result, p2_result = "win", "loss"
-        elif match.player1_score < match.player2_score:
-            p1_result, p2_result = "loss", "win"
-        else:
-            p1_result, p2_result = "draw", "draw"
+        p1_result, p2_result = _match_outcomes(player1_score, player2_score)
 
-        is_mirror = p1_faction and p2_faction and p1_faction == p2_faction
-
-        # Update global stats
         for faction, result in [(p1_faction, p1_result), (p2_faction, p2_result)]:
-            if not faction:
-                continue
-
-            stats = session.scalars(
-                select(ArmyStats).where(ArmyStats.faction == faction)
-            ).first()
-
-            if not stats:
-                stats = ArmyStats(faction=faction)
-                session.add(stats)
-                stats_count += 1
-
-            stats.games_played += 1
-            if result == "win":
-                stats.wins += 1
-            elif result == "draw":
-                stats.draws += 1
-            else:
-                stats.losses += 1
-            stats.updated_at = datetime.utcnow()
-
-        # Update matchup stats (skip mirrors)
-        if not is_mirror and p1_faction and p2_faction:
-            # p1 vs p2
-            matchup1 = session.scalars(
-                select(ArmyMatchupStats).where(
-                    ArmyMatchupStats.faction == p1_faction,
-                    ArmyMatchupStats.opponent_faction == p2_faction,
-                )
-            ).first()
-
-            if not matchup1:
-                matchup1 = ArmyMatchupStats(
-                    faction=p1_faction, opponent_faction=p2_faction
-                )
-                session.add(matchup1)
-                matchup_count += 1
-
-            matchup1.games_played += 1
-            if p1_result == "win":
-                matchup1.wins += 1
-            elif p1_result == "draw":
-                matchup1.draws += 1
-            else:
-                matchup1.losses += 1
-            matchup1.updated_at = datetime.utcnow()
-
-            # p2 vs p1
-            matchup2 = session.scalars(
-                select(ArmyMatchupStats).where(
-                    ArmyMatchupStats.faction == p2_faction,
-                    ArmyMatchupStats.opponent_faction == p1_faction,
-                )
-            ).first()
-
-            if not matchup2:
-                matchup2 = ArmyMatchupStats(
-                    faction=p2_faction, opponent_faction=p1_faction
-                )
-                session.add(matchup2)
-                matchup_count += 1
-
-            matchup2.games_played += 1
-            if p2_result == "win":
-                matchup2.wins += 1
-            elif p2_result == "draw":
-                matchup2.draws += 1
-            else:
-                matchup2.losses += 1
-            matchup2.updated_at = datetime.utcnow()
+            if faction:
+                totals = faction_totals[faction]
+                totals["games_played"] += 1
+                totals[_RESULT_COLUMNS[result]] += 1
+
+        # Matchup stats skip mirrors
+        if p1_faction and p2_faction and p1_faction != p2_faction:
+            for key, result in [
+                ((p1_faction, p2_faction), p1_result),
+                ((p2_faction, p1_faction), p2_result),
+            ]:
+                totals = matchup_totals[key]
+                totals["games_played"] += 1
+                totals[_RESULT_COLUMNS[result]] += 1
+
+    now = datetime.utcnow()
+    stats_rows = [
+        {
+            "faction": faction,
+            "games_played": totals["games_played"],
+            "wins": totals["wins"],
+            "draws": totals["draws"],
+            "losses": totals["losses"],
+            "updated_at": now,
+        }
+        for faction, totals in faction_totals.items()
+    ]
+    matchup_rows = [
+        {
+            "faction": faction,
+            "opponent_faction": opponent_faction,
+            "games_played": totals["games_played"],
+            "wins": totals["wins"],
+            "draws": totals["draws"],
+            "losses": totals["losses"],
+            "updated_at": now,
+        }
+        for (faction, opponent_faction), totals in matchup_totals.items()
+    ]
 
+    session.execute(delete(ArmyStats))
+    session.execute(delete(ArmyMatchupStats))
+    if stats_rows:
+        session.execute(insert(ArmyStats), stats_rows)
+    if matchup_rows:
+        session.execute(insert(ArmyMatchupStats), matchup_rows)
     session.commit()
 
+    elapsed = time.perf_counter() - started
+    ARMY_STATS_REBUILDS.inc()
+    ARMY_STATS_REBUILD_DURATION.observe(elapsed)
+
     return {
-        "matches_processed": len(matches),
-        "factions_tracked": stats_count,
-        "matchups_tracked": matchup_count,
+        "matches_processed": len(rows),
+        "factions_tracked": len(stats_rows),
+        "matchups_tracked": len(matchup_rows),
+        "rows_written": len(stats_rows) + len(matchup_rows),
+        "elapsed_seconds": round(elapsed, 3),
+        "matches_per_second": round(len(rows) / elapsed) if elapsed > 0 else 0,
     }
 
 
+def _upsert_stats_rows(
+    session: Session, model, key_columns: list[str], rows: list[dict]
+) -> None:
+    """
+    Adds counter rows to a stats table with a single INSERT ... ON CONFLICT.
+
+    Existing rows keyed on key_columns are incremented in place, so
+    concurrent confirmations never lose increments.
+    """
+    if not rows:
+        return
+
+    dialect = session.get_bind().dialect.name
+    dialect_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+
+    table = model.__table__
+    statement = dialect_insert(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={
+            **{
+                column: table.c[column] + statement.excluded[column]
+                for column in _COUNTER_COLUMNS
+            },
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    session.execute(statement)
+
+
 def update_army_stats_after_match(
     session: Session,
     player1: LeaguePlayer,
@@ -188,7 +236,11 @@ def update_army_stats_after_match(
     player2_score: int,
     phase: str,
 ) -> None:
-    """Updates cached army statistics after a match is confirmed."""
+    """
+    Updates cached army statistics after a match is confirmed.
+
+    Issues one upsert per stats table; the caller commits.
+    """
     # Determine factions based on match phase
     p1_faction = (
         player1.knockout_army_faction
@@ -205,82 +257,40 @@ def update_army_stats_after_match(
     if not p1_faction and not p2_faction:
         return
 
-    # Check if mirror match
-    is_mirror = p1_faction and p2_faction and p1_faction == p2_faction
+    p1_result, p2_result = _match_outcomes(player1_score, player2_score)
+    now = datetime.utcnow()
 
-    # Determine results
-    if player1_score > player2_score:
-        p1_result, p2_result = "win", "loss"
-    elif player1_score < player2_score:
-        p1_result, p2_result = "loss", "win"
-    else:
-        p1_result, p2_result = "draw", "draw"
+    def counter_row(result: str, **keys) -> dict:
+        row = {column: 0 for column in _COUNTER_COLUMNS}
+        row["games_played"] = 1
+        row[_RESULT_COLUMNS[result]] = 1
+        return {**keys, **row, "updated_at": now}
 
-    # Update global stats for each faction (including mirrors)
+    # Global stats for each faction (mirrors count twice for the same faction)
+    stats_rows: dict[str, dict] = {}
     for faction, result in [(p1_faction, p1_result), (p2_faction, p2_result)]:
         if not faction:
             continue
-
-        stats = session.scalars(
-            select(ArmyStats).where(ArmyStats.faction == faction)
-        ).first()
-
-        if not stats:
-            stats = ArmyStats(faction=faction)
-            session.add(stats)
-
-        stats.games_played += 1
-        if result == "win":
-            stats.wins += 1
-        elif result == "draw":
-            stats.draws += 1
+        row = counter_row(result, faction=faction)
+        if faction in stats_rows:
+            for column in _COUNTER_COLUMNS:
+                stats_rows[faction][column] += row[column]
         else:
-            stats.losses += 1
-        stats.updated_at = datetime.utcnow()
-
-    # Update matchup stats (skip mirrors)
-    if not is_mirror and p1_faction and p2_faction:
-        # Update p1 faction vs p2 faction
-        matchup1 = session.scalars(
-            select(ArmyMatchupStats).where(
-                ArmyMatchupStats.faction == p1_faction,
-                ArmyMatchupStats.opponent_faction == p2_faction,
-            )
-        ).first()
-
-        if not matchup1:
-            matchup1 = ArmyMatchupStats(faction=p1_faction, opponent_faction=p2_faction)
-            session.add(matchup1)
-
-        matchup1.games_played += 1
-        if p1_result == "win":
-            matchup1.wins += 1
-        elif p1_result == "draw":
-            matchup1.draws += 1
-        else:
-            matchup1.losses += 1
-        matchup1.updated_at = datetime.utcnow()
-
-        # Update p2 faction vs p1 faction
-        matchup2 = session.scalars(
-            select(ArmyMatchupStats).where(
-                ArmyMatchupStats.faction == p2_faction,
-                ArmyMatchupStats.opponent_faction == p1_faction,
-            )
-        ).first()
+            stats_rows[faction] = row
 
-        if not matchup2:
-            matchup2 = ArmyMatchupStats(faction=p2_faction, opponent_faction=p1_faction)
-            session.add(matchup2)
+    _upsert_stats_rows(session, ArmyStats, ["faction"], list(stats_rows.values()))
 
-        matchup2.games_played += 1
-        if p2_result == "win":
-            matchup2.wins += 1
-        elif p2_result == "draw":
-            matchup2.draws += 1
-        else:
-            matchup2.losses += 1
-        matchup2.updated_at = datetime.utcnow()
+    # Matchup stats (skip mirrors)
+    if p1_faction and p2_faction and p1_faction != p2_faction:
+        _upsert_stats_rows(
+            session,
+            ArmyMatchupStats,
+            ["faction", "opponent_faction"],
+            [
+                counter_row(p1_result, faction=p1_faction, opponent_faction=p2_faction),
+                counter_row(p2_result, faction=p2_faction, opponent_faction=p1_faction),
+            ],
+        )
 
 
 # ============ League Operations ============
@@ -543,6 +553,8 @@ def draw_groups(
             group_index = i % num_groups
             player.group_id = created_groups[group_index].id
 
+    session.flush()
+    refresh_group_standings(session, league, [group.id for group in created_groups])
     session.commit()
 
     return created_groups
@@ -668,6 +680,7 @@ def submit_match_result(
 
         session.add(player1)
         session.add(player2)
+        refresh_group_standings(session, league, [player1.group_id, player2.group_id])
 
     session.add(match)
     session.commit()
@@ -749,12 +762,63 @@ def confirm_match_result(
             match.phase,
         )
 
+        league = session.get(League, match.league_id)
+        if league:
+            refresh_group_standings(
+                session, league, [player1.group_id, player2.group_id]
+            )
+
     session.add(match)
     session.commit()
     session.refresh(match)
+    MATCHES_CONFIRMED.inc(phase=match.phase)
     return match
 
 
+def auto_confirm_pending_matches(
+    session: Session,
+    older_than: Optional[timedelta] = None,
+    batch_size: int = 100,
+) -> int:
+    """
+    Confirms results left pending for longer than ``older_than`` (24h).
+
+    Runs in batches from the background scheduler; finished leagues are
+    skipped. A match that fails to confirm is rolled back, logged and left
+    out of later batches. Returns the number of matches confirmed.
+    """
+    cutoff = datetime.utcnow() - (older_than or AUTO_CONFIRM_AFTER)
+    statement = (
+        select(Match)
+        .join(League, League.id == Match.league_id)
+        .where(
+            Match.status == "pending_confirmation",
+            Match.submitted_at < cutoff,
+            League.status != "finished",
+        )
+        .order_by(Match.submitted_at)
+        .limit(batch_size)
+    )
+
+    count = 0
+    failed: set[int] = set()
+    while True:
+        batch = statement.where(Match.id.not_in(failed)) if failed else statement
+        matches = session.scalars(batch).all()
+        for match in matches:
+            match_id = match.id
+            try:
+                confirm_match_result(session, match, match.submitted_by_id)
+            except Exception:
+                logger.exception("Auto-confirming match %s failed", match_id)
+                session.rollback()
+                failed.add(match_id)
+                continue
+            count += 1
+        if len(matches) < batch_size:
+            return count
+
+
 # ============ Standings ============
 
 
@@ -795,6 +859,144 @@ def get_group_standings(session: Session, group_id: int) -> list[LeaguePlayer]:
     return players
 
 
+def get_qualification_spots(
+    session: Session, league: League, num_groups: int
+) -> tuple[int, int]:
+    """
+    Returns (guaranteed spots per group, extra spots for best runners-up).
+
+    When there are more groups than knockout spots, every spot goes to the
+    best players across groups.
+    """
+    player_count = get_league_player_count(session, league.id)
+    knockout_size = league.knockout_size
+    if knockout_size is None:
+        knockout_size = calculate_knockout_size(player_count)
+    knockout_size = min(knockout_size, player_count)
+
+    guaranteed_per_group = knockout_size // num_groups
+    extra_spots = knockout_size % num_groups
+
+    if guaranteed_per_group == 0:
+        extra_spots = knockout_size
+
+    return guaranteed_per_group, extra_spots
+
+
+def _runner_up_sorting_key(player: LeaguePlayer) -> tuple:
+    return (-player.total_points, player.games_played, -player.average_points)
+
+
+def refresh_group_standings(
+    session: Session, league: League, group_ids: Optional[list[int]] = None
+) -> None:
+    """
+    Refreshes the materialized standings for a league.
+
+    Only the given groups are re-ranked (all groups when group_ids is None);
+    qualification flags and runner-up ranking are then recomputed league-wide
+    from the stored positions. Does not commit.
+    """
+    if group_ids is None:
+        group_ids = session.scalars(
+            select(Group.id).where(Group.league_id == league.id)
+        ).all()
+
+    now = datetime.utcnow()
+    for group_id in {group_id for group_id in group_ids if group_id}:
+        players = get_group_standings(session, group_id)
+        session.execute(delete(GroupStanding).where(GroupStanding.group_id == group_id))
+        if players:
+            session.execute(
+                insert(GroupStanding),
+                [
+                    {
+                        "league_id": league.id,
+                        "group_id": group_id,
+                        "player_id": player.id,
+                        "position": position,
+                        "qualifies": False,
+                        "qualifies_as_runner_up": False,
+                        "runner_up_rank": None,
+                        "updated_at": now,
+                    }
+                    for position, player in enumerate(players, 1)
+                ],
+            )
+
+    _refresh_qualification_flags(session, league)
+
+
+def _refresh_qualification_flags(session: Session, league: League) -> None:
+    """Recomputes knockout qualification flags from stored group positions."""
+    num_groups = len(
+        session.scalars(select(Group.id).where(Group.league_id == league.id)).all()
+    )
+    if num_groups == 0:
+        return
+
+    guaranteed_per_group, extra_spots = get_qualification_spots(
+        session, league, num_groups
+    )
+
+    standings = session.scalars(
+        select(GroupStanding).where(GroupStanding.league_id == league.id)
+    ).all()
+
+    runners_up = []
+    players_by_id = {}
+    if extra_spots > 0:
+        runner_up_position = guaranteed_per_group + 1
+        runner_up_ids = [
+            standing.player_id
+            for standing in standings
+            if standing.position == runner_up_position
+        ]
+        if runner_up_ids:
+            players_by_id = {
+                player.id: player
+                for player in session.scalars(
+                    select(LeaguePlayer).where(LeaguePlayer.id.in_(runner_up_ids))
+                ).all()
+            }
+        runners_up = sorted(
+            (
+                standing
+                for standing in standings
+                if standing.position == runner_up_position
+                and standing.player_id in players_by_id
+            ),
+            key=lambda standing: _runner_up_sorting_key(
+                players_by_id[standing.player_id]
+            ),
+        )
+    runner_up_ranks = {
+        standing.player_id: rank for rank, standing in enumerate(runners_up, 1)
+    }
+
+    for standing in standings:
+        runner_up_rank = runner_up_ranks.get(standing.player_id)
+        standing.qualifies = standing.position <= guaranteed_per_group
+        standing.runner_up_rank = runner_up_rank
+        standing.qualifies_as_runner_up = (
+            runner_up_rank is not None and runner_up_rank <= extra_spots
+        )
+        session.add(standing)
+
+
+def get_league_standings(
+    session: Session, league: League
+) -> list[tuple[GroupStanding, LeaguePlayer]]:
+    """Reads materialized standings for a league ordered by group and position."""
+    statement = (
+        select(GroupStanding, LeaguePlayer)
+        .join(LeaguePlayer, LeaguePlayer.id == GroupStanding.player_id)
+        .where(GroupStanding.league_id == league.id)
+        .order_by(GroupStanding.group_id, GroupStanding.position)
+    )
+    return list(session.exec(statement).all())
+
+
 # ============ Knockout Phase ============
 
 
@@ -841,54 +1043,19 @@ def get_qualified_players(session: Session, league: League) -> list[LeaguePlayer
     - 5 groups, top 8: 1st places (5) + 3 best 2nd places
     - 6 groups, top 8: 1st places (6) + 2 best 2nd places
 
+    Qualification flags are read from the materialized group standings.
+
     Returns:
         List of qualified players sorted by results (best first for seeding)
     """
-    # Get groups
-    groups = session.scalars(select(Group).where(Group.league_id == league.id)).all()
-    num_groups = len(groups)
-
-    if num_groups == 0:
-        return []
-
-    # Calculate knockout size
-    player_count = get_league_player_count(session, league.id)
-    knockout_size = league.knockout_size
-    if knockout_size is None:
-        knockout_size = calculate_knockout_size(player_count)
-    knockout_size = min(knockout_size, player_count)
-
-    # Calculate guaranteed spots per group and extra spots for best runners-up
-    guaranteed_per_group = knockout_size // num_groups
-    extra_spots = knockout_size % num_groups
-
-    if guaranteed_per_group == 0:
-        # Edge case: more groups than knockout spots - just take best players globally
-        guaranteed_per_group = 0
-        extra_spots = knockout_size
-
-    qualified = []
-    runners_up = []
-
-    for group in groups:
-        group_players = get_group_standings(session, group.id)
-
-        # Take guaranteed qualifiers from each group
-        qualified.extend(group_players[:guaranteed_per_group])
-
-        # Collect potential runners-up (next position after guaranteed spots)
-        if extra_spots > 0 and len(group_players) > guaranteed_per_group:
-            runners_up.append(group_players[guaranteed_per_group])
-
-    # Sort runners-up by points and take the best ones
-    if extra_spots > 0 and runners_up:
-        runners_up.sort(
-            key=lambda p: (-p.total_points, p.games_played, -p.average_points)
-        )
-        qualified.extend(runners_up[:extra_spots])
+    qualified = [
+        player
+        for standing, player in get_league_standings(session, league)
+        if standing.qualifies or standing.qualifies_as_runner_up
+    ]
 
     # Sort all qualified players for seeding (best first)
-    qualified.sort(key=lambda p: (-p.total_points, p.games_played, -p.average_points))
+    qualified.sort(key=_runner_up_sorting_key)
 
     return qualified
 
@@ -1089,6 +1256,19 @@ def advance_knockout_winner(session: Session, match: Match) -> Optional[Match]:
 # ============ Tiebreakers ============
 
 
+def delete_league_rows(session: Session, league: League) -> None:
+    """
+    Deletes a league and every row that belongs to it, children first.
+
+    Does not commit.
+    """
+    category_ids = select(VoteCategory.id).where(VoteCategory.league_id == league.id)
+    session.execute(delete(Vote).where(Vote.category_id.in_(category_ids)))
+    for model in (VoteCategory, GroupStanding, Match, LeaguePlayer, Group):
+        session.execute(delete(model).where(model.league_id == league.id))
+    session.delete(league)
+
+
 def remove_player_from_league(
     session: Session,
     player: LeaguePlayer,
@@ -1124,6 +1304,7 @@ def remove_player_from_league(
 
     deleted_count = 0
     walkover_count = 0
+    affected_group_ids = [player.group_id]
 
     for match in matches:
         if match.status == "confirmed":
@@ -1178,6 +1359,7 @@ def remove_player_from_league(
                 opponent.games_won += 1
                 opponent.total_points += WALKOVER_WINNER_POINTS
                 session.add(opponent)
+                affected_group_ids.append(opponent.group_id)
 
                 match.status = "confirmed"
                 match.confirmed_at = datetime.utcnow()
@@ -1189,8 +1371,13 @@ def remove_player_from_league(
         session.delete(match)
         deleted_count += 1
 
-    # Remove player
+    # Remove player along with their standings row
+    league = session.get(League, player.league_id)
+    session.execute(delete(GroupStanding).where(GroupStanding.player_id == player.id))
     session.delete(player)
+    if league:
+        session.flush()
+        refresh_group_standings(session, league, affected_group_ids)
     session.commit()
 
     return {"deleted_matches": deleted_count, "walkover_matches": walkover_count}
@@ -1273,6 +1460,7 @@ def change_player_group(
     # Move player to new group
     player.group_id = new_group.id
     session.add(player)
+    refresh_group_standings(session, league, [old_group_id, new_group.id])
     session.commit()
 
     if regenerate_matches:
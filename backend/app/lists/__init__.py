@@ -0,0 +1 @@
+# Content-addressed army list storage
@@ -0,0 +1,33 @@
+import zlib
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class ArmyList(SQLModel, table=True):
+    """A distinct army list text, stored once and referenced by id.
+
+    Matchups, league players and league matches point at rows of this table
+    instead of carrying the text themselves. Rows are immutable: the id of a
+    text never changes, so callers may cache by id.
+    """
+
+    __tablename__ = "army_lists"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # sha256 of the UTF-8 text
+    content_hash: str = Field(unique=True, index=True, max_length=64)
+    # zlib-compressed UTF-8 text
+    content: bytes
+    length: int  # Characters of the uncompressed text
+
+    # Computed once per distinct list
+    faction: Optional[str] = Field(default=None, max_length=50)
+    faction_confidence: Optional[float] = None
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    @property
+    def text(self) -> str:
+        return zlib.decompress(self.content).decode()
@@ -0,0 +1,65 @@
+"""Storing and loading army lists by content hash."""
+
+import hashlib
+import zlib
+from typing import Iterable, Optional
+
+from app.data.armies import detect_army
+from app.lists.models import ArmyList
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, select
+
+
+def army_list_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def store_army_list(session: Session, text: str) -> ArmyList:
+    """
+    Returns the stored row for ``text``, inserting it on first use.
+
+    Faction detection runs only for new texts. Concurrent inserts of the
+    same list are resolved by the unique hash. Does not commit.
+    """
+    content_hash = army_list_hash(text)
+    statement = select(ArmyList).where(ArmyList.content_hash == content_hash)
+    army_list = session.scalars(statement).first()
+    if army_list:
+        return army_list
+
+    detection = detect_army(text)
+    dialect = session.get_bind().dialect.name
+    dialect_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    session.execute(
+        dialect_insert(ArmyList)
+        .values(
+            content_hash=content_hash,
+            content=zlib.compress(text.encode()),
+            length=len(text),
+            faction=detection.faction if detection else None,
+            faction_confidence=detection.confidence if detection else None,
+        )
+        .on_conflict_do_nothing(index_elements=["content_hash"])
+    )
+    return session.scalars(statement).one()
+
+
+def load_army_lists(
+    session: Session, list_ids: Iterable[Optional[int]]
+) -> dict[int, str]:
+    """Texts of the given lists in one query, keyed by id. Skips None."""
+    wanted = {list_id for list_id in list_ids if list_id is not None}
+    if not wanted:
+        return {}
+    rows = session.execute(
+        select(ArmyList.id, ArmyList.content).where(ArmyList.id.in_(wanted))
+    ).all()
+    return {list_id: zlib.decompress(content).decode() for list_id, content in rows}
+
+
+def load_army_list(session: Session, list_id: Optional[int]) -> Optional[str]:
+    """Text of one list, or None for a missing reference."""
+    if list_id is None:
+        return None
+    return load_army_lists(session, [list_id]).get(list_id)
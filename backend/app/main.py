@@ -1,12 +1,30 @@
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 import sentry_sdk
 from app.config import settings
-from app.db import create_db_and_tables
-from fastapi import FastAPI, Request
+from app.core.db_metrics import (
+    finish_request_stats,
+    render_metrics,
+    start_request_stats,
+)
+from app.core.deps import require_metrics_token
+from app.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    registry,
+)
+from app.core.scheduler import PeriodicTask, Scheduler
+from app.db import async_engine, create_db_and_tables, engine
+from app.league.service import auto_confirm_pending_matches
+from app.matchup.service import auto_confirm_expired_results
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
+from sqlmodel import Session
 from starlette.middleware.base import BaseHTTPMiddleware
 
 # Initialize Sentry (before FastAPI app creation)
@@ -40,13 +58,72 @@ class SentryHttpMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class DBTimingMiddleware(BaseHTTPMiddleware):
+    """Middleware to report per-request query count, DB time and pool wait."""
+
+    async def dispatch(self, request: Request, call_next):
+        stats = start_request_stats()
+        try:
+            response = await call_next(request)
+        finally:
+            finish_request_stats(stats)
+
+        response.headers["X-DB-Query-Count"] = str(stats.query_count)
+        response.headers["X-DB-Time-Ms"] = str(stats.db_time_ms)
+        response.headers["X-DB-Pool-Wait-Ms"] = str(stats.pool_wait_ms)
+        response.headers[
+            "Server-Timing"
+        ] = f"db;dur={stats.db_time_ms}, pool;dur={stats.pool_wait_ms}"
+        return response
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Middleware to record request counts, latency and in-flight requests."""
+
+    async def dispatch(self, request: Request, call_next):
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # Route template keeps label cardinality bounded
+            route = request.scope.get("route")
+            route_path = route.path if route else "unmatched"
+            HTTP_REQUESTS.inc(
+                method=request.method, route=route_path, status=status_code
+            )
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=request.method,
+                route=route_path,
+            )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle manager for startup and shutdown events."""
     # Startup
     create_db_and_tables()
+    scheduler = None
+    if settings.SCHEDULER_ENABLED:
+        scheduler = Scheduler(
+            lambda: Session(engine),
+            [
+                PeriodicTask("league_auto_confirm", 300, auto_confirm_pending_matches),
+                PeriodicTask("matchup_auto_confirm", 60, auto_confirm_expired_results),
+            ],
+            tick_seconds=settings.SCHEDULER_TICK_SECONDS,
+            lease_seconds=settings.SCHEDULER_LEASE_SECONDS,
+        )
+        scheduler.start()
     yield
-    # Shutdown (if needed)
+    # Shutdown
+    if scheduler is not None:
+        await scheduler.stop()
 
 
 app = FastAPI(
@@ -70,6 +147,13 @@ app.add_middleware(
 if settings.SENTRY_DSN:
     app.add_middleware(SentryHttpMiddleware)
 
+# Per-request DB timing headers
+if settings.DB_METRICS_ENABLED:
+    app.add_middleware(DBTimingMiddleware)
+
+# Request latency and counts for /metrics
+app.add_middleware(MetricsMiddleware)
+
 
 @app.get("/health")
 async def health_check():
@@ -81,6 +165,18 @@ async def health_check():
     }
 
 
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_metrics_token)],
+)
+async def metrics():
+    """Request, domain event and DB metrics in Prometheus text format."""
+    return registry.render() + render_metrics(
+        {"sync": engine, "async": async_engine.sync_engine}
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
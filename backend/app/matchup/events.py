@@ -0,0 +1,70 @@
+"""In-process pub/sub of matchup changes for the SSE stream.
+
+Service functions publish after they commit; ``GET /matchup/{name}/events``
+subscribers receive only the event type and refetch the status, so nothing
+about unrevealed lists is pushed. Publishing is thread-safe: events raised
+from the scheduler thread are handed to each subscriber's event loop.
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+
+# Events buffered per subscriber; older ones are dropped when full since
+# every event means "refetch" anyway
+QUEUE_SIZE = 16
+
+LIST_SUBMITTED = "list_submitted"
+REVEALED = "revealed"
+RESULT_SUBMITTED = "result_submitted"
+RESULT_CONFIRMED = "result_confirmed"
+CANCELLED = "cancelled"
+
+
+def _offer(queue: asyncio.Queue, event: str) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+class MatchupEventBroker:
+    """Matchup name -> queues of connected SSE clients."""
+
+    def __init__(self):
+        self._subscribers: dict[str, set] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def subscribe(self, matchup_name: str) -> Iterator[asyncio.Queue]:
+        """Queue receiving event types for ``matchup_name`` while open."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers[matchup_name].add(subscriber)
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                subscribers = self._subscribers[matchup_name]
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[matchup_name]
+
+    def publish(self, matchup_name: str, event: str) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(matchup_name, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                # Subscriber's loop already closed
+                pass
+
+    def subscriber_count(self, matchup_name: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(matchup_name, ()))
+
+
+matchup_events = MatchupEventBroker()
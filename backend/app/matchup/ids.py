@@ -0,0 +1,107 @@
+"""Collision-free matchup id allocation.
+
+Ids are derived from a counter mapped onto the adjective-noun-code space
+(``matchup_id_for``). Each process reserves a block of counter values with
+one committed UPDATE of ``matchup_id_counter`` and hands them out from
+memory, so creating a matchup needs no retry and no round trip per id.
+Names from the reserved block that already exist (random legacy ids, or
+ids from before the word lists grew) are skipped with one query per block.
+"""
+
+import threading
+from collections import deque
+
+from app.config import settings
+from app.matchup.models import Matchup, MatchupIdCounter
+from app.matchup.words import id_space_size, matchup_id_for
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+COUNTER_ID = 1
+
+
+class MatchupIdsExhausted(Exception):
+    """Every id of the current word lists has been handed out."""
+
+
+def _advance_counter(engine: Engine, count: int) -> int:
+    """Reserve ``count`` counter values and return the first one. Commits."""
+    while True:
+        with engine.begin() as connection:
+            reserved = connection.execute(
+                update(MatchupIdCounter)
+                .where(MatchupIdCounter.id == COUNTER_ID)
+                .values(next_value=MatchupIdCounter.next_value + count)
+                .returning(MatchupIdCounter.next_value)
+            ).scalar()
+        if reserved is not None:
+            return reserved - count
+        try:
+            with engine.begin() as connection:
+                connection.execute(
+                    insert(MatchupIdCounter).values(id=COUNTER_ID, next_value=count)
+                )
+            return 0
+        except IntegrityError:
+            # Another process created the row first
+            continue
+
+
+class MatchupIdAllocator:
+    """Hands out matchup ids from blocks reserved in the database."""
+
+    def __init__(self, block_size: int):
+        self.block_size = block_size
+        self._pending: deque[str] = deque()
+        self._lock = threading.Lock()
+
+    def _reserve_block(self, session: Session) -> list[str]:
+        # Own transaction: the block stays reserved even if the caller rolls back
+        start = _advance_counter(session.get_bind(), self.block_size)
+        size = id_space_size()
+        if start >= size:
+            raise MatchupIdsExhausted(f"All {size} matchup ids are allocated")
+
+        names = [
+            matchup_id_for(number)
+            for number in range(start, min(start + self.block_size, size))
+        ]
+        taken = set(
+            session.scalars(select(Matchup.name).where(Matchup.name.in_(names)))
+        )
+        return [name for name in names if name not in taken]
+
+    def allocate(self, session: Session) -> str:
+        """Return an id no other matchup has or will be given."""
+        with self._lock:
+            while not self._pending:
+                self._pending.extend(self._reserve_block(session))
+            return self._pending.popleft()
+
+    def clear(self) -> None:
+        """Drop the unused part of the reserved block."""
+        with self._lock:
+            self._pending.clear()
+
+
+def matchup_id_capacity(session: Session) -> dict:
+    """How much of the id space is used and how many ids remain."""
+    allocated = (
+        session.scalar(
+            select(MatchupIdCounter.next_value).where(MatchupIdCounter.id == COUNTER_ID)
+        )
+        or 0
+    )
+    total = id_space_size()
+    allocated = min(allocated, total)
+    return {
+        "total": total,
+        "allocated": allocated,
+        "remaining": total - allocated,
+        "used_percent": round(100 * allocated / total, 4),
+    }
+
+
+matchup_id_allocator = MatchupIdAllocator(block_size=settings.MATCHUP_ID_BLOCK_SIZE)
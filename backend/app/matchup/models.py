@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from app.matchup.words import generate_matchup_id
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -9,6 +10,12 @@ class Matchup(SQLModel, table=True):
     """Matchup model for blind army list exchange (Herald functionality)."""
 
     __tablename__ = "matchups"
+    # Keyset pagination of the public and per-player lists
+    __table_args__ = (
+        Index("ix_matchups_created_at_id", "created_at", "id"),
+        Index("ix_matchups_player1_created_at_id", "player1_id", "created_at", "id"),
+        Index("ix_matchups_player2_created_at_id", "player2_id", "created_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(
@@ -25,9 +32,9 @@ class Matchup(SQLModel, table=True):
     player1_id: Optional[int] = Field(default=None, foreign_key="users.id")
     player2_id: Optional[int] = Field(default=None, foreign_key="users.id")
 
-    # Army lists
-    player1_list: Optional[str] = None
-    player2_list: Optional[str] = None
+    # Army lists (army_lists rows)
+    player1_list_id: Optional[int] = Field(default=None, foreign_key="army_lists.id")
+    player2_list_id: Optional[int] = Field(default=None, foreign_key="army_lists.id")
 
     # Army factions (detected or selected)
     player1_army_faction: Optional[str] = Field(default=None, max_length=50)
@@ -117,3 +124,12 @@ class Matchup(SQLModel, table=True):
         elif self.result_submitted_by_id == self.player2_id:
             return user_id == self.player1_id
         return False
+
+
+class MatchupIdCounter(SQLModel, table=True):
+    """Single-row counter of matchup id numbers handed out in blocks."""
+
+    __tablename__ = "matchup_id_counter"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    next_value: int = Field(default=0)
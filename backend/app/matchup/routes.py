@@ -1,13 +1,23 @@
+import asyncio
+import json
 from datetime import datetime
+from typing import Optional
 
+from app.bsdata.lists import parse_army_lists
+from app.config import settings
 from app.core.deps import get_current_user, get_current_user_optional
-from app.data import BATTLE_PLAN_DATA, MAP_IMAGES, MISSION_MAPS, detect_army_faction
+from app.data import BATTLE_PLAN_DATA, MAP_IMAGES, MISSION_MAPS
 from app.db import get_session
 from app.league.models import League
+from app.lists.service import load_army_lists, store_army_list
+from app.matchup import events
+from app.matchup.events import matchup_events
+from app.matchup.ids import matchup_id_allocator
 from app.matchup.models import Matchup
 from app.matchup.schemas import (
     MatchupCreate,
     MatchupCreateResponse,
+    MatchupPage,
     MatchupPublicToggle,
     MatchupReveal,
     MatchupStatus,
@@ -17,17 +27,22 @@ from app.matchup.schemas import (
     ResultSubmit,
 )
 from app.matchup.service import (
+    PUBLIC_MATCHUP_FILTER,
     confirm_result,
     edit_result,
+    estimate_matchup_count,
     get_army_factions,
     get_battle_plan_data,
     get_map_image,
     get_result_info_message,
+    list_public_matchups,
+    list_user_matchups,
     submit_list,
     submit_result,
 )
 from app.users.models import User
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import or_
 from sqlmodel import Session, func, select
 
@@ -49,10 +64,9 @@ async def create_matchup(
     current_user=Depends(get_current_user_optional),
 ):
     """Create a new matchup with Player 1's army list and return the UUID link."""
-    # Detect army faction if not provided
-    army_faction = data.army_faction
-    if not army_faction:
-        army_faction = detect_army_faction(data.army_list)
+    army_list = store_army_list(session, data.army_list)
+    # Use the faction detected from the list if not provided
+    army_faction = data.army_faction or army_list.faction
 
     # Look up player2 by username if provided
     player2_id = None
@@ -63,10 +77,11 @@ async def create_matchup(
             player2_id = player2.id
 
     matchup = Matchup(
+        name=matchup_id_allocator.allocate(session),
         player1_id=current_user.id if current_user else None,
         player2_id=player2_id,
         title=data.title,
-        player1_list=data.army_list,
+        player1_list_id=army_list.id,
         player1_army_faction=army_faction,
         player1_submitted=True,
         is_public=data.is_public,
@@ -155,52 +170,67 @@ def _build_matchup_list(
     return matchup_list
 
 
-@router.get("/my-matchups", response_model=list[MatchupStatus])
+@router.get("/my-matchups", response_model=MatchupPage)
 async def get_my_matchups(
     session: Session = Depends(get_session),
     current_user=Depends(get_current_user),
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: Optional[str] = None,
 ):
-    """Get all matchups for the current user."""
-    results = list(
-        session.scalars(
-            select(Matchup)
-            .where(
-                or_(
-                    Matchup.player1_id == current_user.id,
-                    Matchup.player2_id == current_user.id,
-                )
-            )
-            .order_by(Matchup.created_at.desc())
-        ).all()
-    )
+    """Get the current user's matchups, newest first, one page at a time."""
+    try:
+        matchups, next_cursor = list_user_matchups(
+            session, current_user.id, limit, cursor
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
 
-    return _build_matchup_list(session, results, current_user.id)
+    total = None
+    if cursor is None:
+        total = estimate_matchup_count(
+            session,
+            or_(
+                Matchup.player1_id == current_user.id,
+                Matchup.player2_id == current_user.id,
+            ),
+        )
+
+    return MatchupPage(
+        items=_build_matchup_list(session, matchups, current_user.id),
+        next_cursor=next_cursor,
+        total_estimate=total,
+    )
 
 
-@router.get("/public", response_model=list[MatchupStatus])
+@router.get("/public", response_model=MatchupPage)
 async def get_public_matchups(
     session: Session = Depends(get_session),
     current_user=Depends(get_current_user_optional),
-    limit: int = Query(default=50, le=100),
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: Optional[str] = None,
 ):
-    """Get public completed matchups from other users."""
-    # Base query: public, revealed, not cancelled
-    statement = (
-        select(Matchup)
-        .where(
-            Matchup.is_public.is_(True),
-            Matchup.player1_submitted.is_(True),
-            Matchup.player2_submitted.is_(True),
-            Matchup.is_cancelled.is_(False),
+    """Get public completed matchups, newest first, one page at a time."""
+    try:
+        matchups, next_cursor = list_public_matchups(session, limit, cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
         )
-        .order_by(Matchup.revealed_at.desc())
-        .limit(limit)
-    )
 
-    results = list(session.scalars(statement).all())
+    total = None
+    if cursor is None:
+        total = estimate_matchup_count(session, *PUBLIC_MATCHUP_FILTER)
     current_user_id = current_user.id if current_user else None
 
-    return _build_matchup_list(session, results, current_user_id)
+    return MatchupPage(
+        items=_build_matchup_list(session, matchups, current_user_id),
+        next_cursor=next_cursor,
+        total_estimate=total,
+    )
 
 
 @router.get("/search-users")
@@ -350,6 +380,51 @@ async def get_matchup_status(
     )
 
 
+async def _matchup_event_stream(request: Request, matchup_name: str):
+    """SSE frames for one subscriber, with keepalive comments while idle."""
+    with matchup_events.subscribe(matchup_name) as queue:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.MATCHUP_EVENTS_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {event}\ndata: {json.dumps({'type': event})}\n\n"
+
+
+@router.get("/{matchup_name}/events")
+async def stream_matchup_events(
+    matchup_name: str,
+    request: Request,
+    session: Session = Depends(get_session),
+):
+    """Server-sent events announcing changes to a matchup.
+
+    Events carry only their type (list_submitted, revealed, result_submitted,
+    result_confirmed, cancelled); clients refetch the status when one
+    arrives instead of polling.
+    """
+    matchup_id = session.scalars(
+        select(Matchup.id).where(Matchup.name == matchup_name)
+    ).first()
+    if matchup_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Matchup not found",
+        )
+
+    return StreamingResponse(
+        _matchup_event_stream(request, matchup_name),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.patch("/{matchup_name}/public")
 async def toggle_matchup_public(
     matchup_name: str,
@@ -460,6 +535,7 @@ async def cancel_matchup(
     matchup.cancelled_at = datetime.utcnow()
     session.add(matchup)
     session.commit()
+    matchup_events.publish(matchup_name, events.CANCELLED)
 
     return {"message": "Matchup cancelled"}
 
@@ -565,12 +641,16 @@ async def reveal_matchup_endpoint(
     battle_plan = get_battle_plan_data(matchup.map_name) if matchup.map_name else None
 
     current_user_id = current_user.id if current_user else None
+    lists = load_army_lists(session, [matchup.player1_list_id, matchup.player2_list_id])
+    parsed_lists = await parse_army_lists(session, lists.values())
 
     return MatchupReveal(
         name=matchup.name,
         title=matchup.title,
-        player1_list=matchup.player1_list,
-        player2_list=matchup.player2_list,
+        player1_list=lists.get(matchup.player1_list_id),
+        player2_list=lists.get(matchup.player2_list_id),
+        player1_parsed_list=parsed_lists.get(lists.get(matchup.player1_list_id)),
+        player2_parsed_list=parsed_lists.get(lists.get(matchup.player2_list_id)),
         player1_army_faction=matchup.player1_army_faction,
         player2_army_faction=matchup.player2_army_faction,
         map_name=matchup.map_name,
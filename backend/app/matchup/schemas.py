@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
+from app.bsdata.schemas import ParsedArmyList
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -58,6 +59,14 @@ class MatchupStatus(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MatchupPage(BaseModel):
+    """One page of a matchup list."""
+
+    items: list[MatchupStatus]
+    next_cursor: Optional[str] = None  # None on the last page
+    total_estimate: Optional[int] = None  # Only on the first page
+
+
 class MatchupPublicToggle(BaseModel):
     """Schema for toggling matchup public visibility."""
 
@@ -77,6 +86,9 @@ class MatchupReveal(BaseModel):
     title: Optional[str] = None
     player1_list: str
     player2_list: str
+    # Units and points checked against BSData (when rules are enabled)
+    player1_parsed_list: Optional[ParsedArmyList] = None
+    player2_parsed_list: Optional[ParsedArmyList] = None
     player1_army_faction: Optional[str] = None
     player2_army_faction: Optional[str] = None
     map_name: str
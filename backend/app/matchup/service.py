@@ -1,3 +1,4 @@
+import base64
 import random
 from datetime import datetime, timedelta
 from typing import Optional
@@ -7,15 +8,26 @@ from app.data import (
     BATTLE_PLAN_DATA,
     MAP_IMAGES,
     MISSION_MAPS,
-    detect_army_faction,
     draw_random_map,
 )
+from app.lists.service import store_army_list
+from app.matchup import events
+from app.matchup.events import matchup_events
 from app.matchup.models import Matchup
-from sqlmodel import Session, select
+from sqlalchemy import text, tuple_
+from sqlmodel import Session, func, select
 
 # Auto-confirm result after 24 hours
 AUTO_CONFIRM_HOURS = 24
 
+# Public list: public, revealed, not cancelled
+PUBLIC_MATCHUP_FILTER = (
+    Matchup.is_public.is_(True),
+    Matchup.player1_submitted.is_(True),
+    Matchup.player2_submitted.is_(True),
+    Matchup.is_cancelled.is_(False),
+)
+
 
 def get_map_image(map_name: str) -> str | None:
     """Get battle plan image filename for a map name."""
@@ -46,6 +58,7 @@ def reveal_matchup(matchup: Matchup, session: Session) -> Matchup:
     session.add(matchup)
     session.commit()
     session.refresh(matchup)
+    matchup_events.publish(matchup.name, events.REVEALED)
 
     return matchup
 
@@ -59,22 +72,24 @@ def submit_list(
     army_faction: str = None,
 ) -> Matchup:
     """Submit an army list for a matchup."""
-    # If no army faction provided, try to detect from list
+    if is_player1 and matchup.player1_submitted:
+        raise ValueError("Player 1 has already submitted their list")
+    if not is_player1 and matchup.player2_submitted:
+        raise ValueError("Player 2 has already submitted their list")
+
+    stored = store_army_list(session, army_list)
+    # If no army faction provided, use the one detected from the list
     if not army_faction:
-        army_faction = detect_army_faction(army_list)
+        army_faction = stored.faction
 
     if is_player1:
-        if matchup.player1_submitted:
-            raise ValueError("Player 1 has already submitted their list")
-        matchup.player1_list = army_list
+        matchup.player1_list_id = stored.id
         matchup.player1_army_faction = army_faction
         matchup.player1_submitted = True
         if user_id and not matchup.player1_id:
             matchup.player1_id = user_id
     else:
-        if matchup.player2_submitted:
-            raise ValueError("Player 2 has already submitted their list")
-        matchup.player2_list = army_list
+        matchup.player2_list_id = stored.id
         matchup.player2_army_faction = army_faction
         matchup.player2_submitted = True
         if user_id:
@@ -83,6 +98,7 @@ def submit_list(
     session.add(matchup)
     session.commit()
     session.refresh(matchup)
+    matchup_events.publish(matchup.name, events.LIST_SUBMITTED)
 
     # Auto-reveal if both lists are submitted
     if matchup.is_revealed and not matchup.map_name:
@@ -145,6 +161,14 @@ def submit_result(
     session.add(matchup)
     session.commit()
     session.refresh(matchup)
+    matchup_events.publish(
+        matchup.name,
+        (
+            events.RESULT_CONFIRMED
+            if matchup.result_status == "confirmed"
+            else events.RESULT_SUBMITTED
+        ),
+    )
 
     return matchup
 
@@ -173,6 +197,7 @@ def confirm_result(
     session.add(matchup)
     session.commit()
     session.refresh(matchup)
+    matchup_events.publish(matchup.name, events.RESULT_CONFIRMED)
 
     return matchup
 
@@ -215,34 +240,43 @@ def edit_result(
     session.add(matchup)
     session.commit()
     session.refresh(matchup)
+    matchup_events.publish(matchup.name, events.RESULT_SUBMITTED)
 
     return matchup
 
 
-def auto_confirm_expired_results(session: Session) -> int:
+def auto_confirm_expired_results(session: Session, batch_size: int = 500) -> int:
     """
     Auto-confirm results that have passed their auto_confirm_at time.
-    Returns the number of results confirmed.
+    Commits once per batch. Returns the number of results confirmed.
     """
     now = datetime.utcnow()
-    statement = select(Matchup).where(
-        Matchup.result_status == "pending_confirmation",
-        Matchup.result_auto_confirm_at <= now,
+    statement = (
+        select(Matchup)
+        .where(
+            Matchup.result_status == "pending_confirmation",
+            Matchup.result_auto_confirm_at <= now,
+        )
+        .limit(batch_size)
     )
-    matchups = session.scalars(statement).all()
 
     count = 0
-    for matchup in matchups:
-        matchup.result_status = "confirmed"
-        matchup.result_confirmed_at = now
-        matchup.result_auto_confirm_at = None
-        session.add(matchup)
-        count += 1
-
-    if count > 0:
-        session.commit()
-
-    return count
+    while True:
+        matchups = session.scalars(statement).all()
+        for matchup in matchups:
+            matchup.result_status = "confirmed"
+            matchup.result_confirmed_at = now
+            matchup.result_auto_confirm_at = None
+            session.add(matchup)
+        # Read before commit expires the rows
+        names = [matchup.name for matchup in matchups]
+        if matchups:
+            session.commit()
+        for name in names:
+            matchup_events.publish(name, events.RESULT_CONFIRMED)
+        count += len(matchups)
+        if len(matchups) < batch_size:
+            return count
 
 
 def get_result_info_message(
@@ -279,3 +313,85 @@ def get_result_info_message(
             return "Your opponent submitted a result. Please confirm or dispute it."
 
     return None
+
+
+# ============ Pagination ============
+
+
+def encode_matchup_cursor(matchup: Matchup) -> str:
+    """Opaque cursor for the page after ``matchup`` in (created_at, id) order."""
+    raw = f"{matchup.created_at.isoformat()}|{matchup.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_matchup_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of encode_matchup_cursor. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, matchup_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(matchup_id)
+    except (UnicodeDecodeError, ValueError) as error:
+        raise ValueError("Invalid cursor") from error
+
+
+def _page_query(
+    conditions: tuple, limit: int, position: Optional[tuple[datetime, int]]
+):
+    """Newest-first keyset query fetching one row past the page."""
+    statement = select(Matchup).where(*conditions)
+    if position:
+        statement = statement.where(
+            tuple_(Matchup.created_at, Matchup.id) < tuple_(*position)
+        )
+    return statement.order_by(Matchup.created_at.desc(), Matchup.id.desc()).limit(
+        limit + 1
+    )
+
+
+def _split_page(matchups: list, limit: int) -> tuple[list, Optional[str]]:
+    if len(matchups) > limit:
+        return matchups[:limit], encode_matchup_cursor(matchups[limit - 1])
+    return matchups, None
+
+
+def list_public_matchups(
+    session: Session, limit: int, cursor: Optional[str] = None
+) -> tuple[list[Matchup], Optional[str]]:
+    """One page of public revealed matchups and the cursor of the next."""
+    position = decode_matchup_cursor(cursor) if cursor else None
+    statement = _page_query(PUBLIC_MATCHUP_FILTER, limit, position)
+    return _split_page(list(session.scalars(statement).all()), limit)
+
+
+def list_user_matchups(
+    session: Session, user_id: int, limit: int, cursor: Optional[str] = None
+) -> tuple[list[Matchup], Optional[str]]:
+    """One page of a user's matchups and the cursor of the next.
+
+    Runs one keyset query per player column so each uses its
+    (playerN_id, created_at, id) index, then merges the two pages.
+    """
+    position = decode_matchup_cursor(cursor) if cursor else None
+    merged = {}
+    for column in (Matchup.player1_id, Matchup.player2_id):
+        statement = _page_query((column == user_id,), limit, position)
+        for matchup in session.scalars(statement).all():
+            merged[matchup.id] = matchup
+    matchups = sorted(merged.values(), key=lambda m: (m.created_at, m.id), reverse=True)
+    return _split_page(matchups[: limit + 1], limit)
+
+
+def estimate_matchup_count(session: Session, *conditions) -> int:
+    """Row count for ``conditions``; the planner estimate on PostgreSQL."""
+    statement = select(func.count(Matchup.id)).where(*conditions)
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return session.execute(statement).scalar_one()
+
+    query = (
+        select(Matchup.id)
+        .where(*conditions)
+        .compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+    )
+    plan = session.execute(text(f"EXPLAIN (FORMAT JSON) {query}")).scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
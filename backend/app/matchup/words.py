@@ -3,6 +3,15 @@
 import random
 import string
 
+# Suffix code: 4 characters of a-z0-9
+CODE_ALPHABET = string.ascii_lowercase + string.digits
+CODE_LENGTH = 4
+
+# Affine map spreading consecutive counters over the id space; the
+# multiplier must stay coprime with id_space_size() (it is a large prime)
+_SPREAD = 2654435761
+_OFFSET = 1234567891
+
 # Age of Sigmar themed adjectives
 ADJECTIVES = [
     "mighty",
@@ -97,7 +106,7 @@ NOUNS = [
 
 def generate_code() -> str:
     """Generate a random 4-character alphanumeric code."""
-    return "".join(random.choices(string.ascii_lowercase + string.digits, k=4))
+    return "".join(random.choices(CODE_ALPHABET, k=CODE_LENGTH))
 
 
 def generate_matchup_id() -> str:
@@ -106,3 +115,29 @@ def generate_matchup_id() -> str:
     noun = random.choice(NOUNS)
     code = generate_code()
     return f"{adjective}-{noun}-{code}"
+
+
+def id_space_size() -> int:
+    """Number of distinct adjective-noun-code ids."""
+    return len(ADJECTIVES) * len(NOUNS) * len(CODE_ALPHABET) ** CODE_LENGTH
+
+
+def matchup_id_for(number: int) -> str:
+    """Map a counter value onto a unique id like 'mighty-dragon-a7b2'.
+
+    The mapping is a bijection on [0, id_space_size()), so distinct counter
+    values never produce the same id, while consecutive values still look
+    unrelated.
+    """
+    size = id_space_size()
+    if not 0 <= number < size:
+        raise ValueError(f"Matchup id number {number} is outside the id space")
+    index = (number * _SPREAD + _OFFSET) % size
+
+    index, code_value = divmod(index, len(CODE_ALPHABET) ** CODE_LENGTH)
+    adjective_index, noun_index = divmod(index, len(NOUNS))
+    code = []
+    for _ in range(CODE_LENGTH):
+        code_value, digit = divmod(code_value, len(CODE_ALPHABET))
+        code.append(CODE_ALPHABET[digit])
+    return f"{ADJECTIVES[adjective_index]}-{NOUNS[noun_index]}-{''.join(code)}"
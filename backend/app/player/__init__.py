@@ -12,6 +12,7 @@ from app.player.elo import (
     get_new_player_k_factor,
     get_or_create_player_elo,
     get_setting,
+    replay_elo_history,
     set_setting,
     update_elo_after_match,
 )
@@ -29,6 +30,7 @@ __all__ = [
     "get_new_player_k_factor",
     "get_or_create_player_elo",
     "get_setting",
+    "replay_elo_history",
     "set_setting",
     "update_elo_after_match",
     # Constants
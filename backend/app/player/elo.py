@@ -2,8 +2,12 @@
 
 from datetime import datetime
 
-from app.league.models import AppSettings
+from app.core.metrics import ELO_UPDATES
+from app.core.settings_cache import bump_settings_version, settings_cache
+from app.league.models import AppSettings, LeaguePlayer, Match
 from app.player.models import PlayerElo
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
 # Default values
@@ -13,10 +17,8 @@ DEFAULT_NEW_PLAYER_GAMES = 5
 
 
 def get_setting(session: Session, key: str, default: str = "") -> str:
-    """Get a setting value from AppSettings."""
-    statement = select(AppSettings).where(AppSettings.key == key)
-    setting = session.scalars(statement).first()
-    return setting.value if setting else default
+    """Get a setting value from AppSettings (served from the settings cache)."""
+    return settings_cache.get(session, key, default)
 
 
 def set_setting(session: Session, key: str, value: str) -> AppSettings:
@@ -31,7 +33,9 @@ def set_setting(session: Session, key: str, value: str) -> AppSettings:
         setting = AppSettings(key=key, value=value)
 
     session.add(setting)
+    bump_settings_version(session)
     session.commit()
+    settings_cache.clear()
     session.refresh(setting)
     return setting
 
@@ -150,5 +154,170 @@ def update_elo_after_match(
     session.add(player1_elo)
     session.add(player2_elo)
     session.commit()
+    ELO_UPDATES.inc()
 
     return change1, change2
+
+
+def _match_result(player1_score: int, player2_score: int) -> tuple[float, float]:
+    if player1_score > player2_score:
+        return 1.0, 0.0
+    if player1_score < player2_score:
+        return 0.0, 1.0
+    return 0.5, 0.5
+
+
+def replay_elo_history(
+    session: Session, dry_run: bool = False, batch_size: int = 1000
+) -> dict:
+    """
+    Recompute every player's ELO from all confirmed matches.
+
+    Ratings start from 1000 and are replayed in confirmation order with the
+    current K-factor settings, in memory. Unless ``dry_run`` is set,
+    ``PlayerElo`` rows and the per-match before/after values are written
+    with bulk statements and committed.
+
+    Returns:
+        Summary with match/player counts and the players whose rating or
+        game count would change
+    """
+    k_factor = get_global_k_factor(session)
+    new_player_k = get_new_player_k_factor(session)
+    new_player_games = get_new_player_games_threshold(session)
+
+    player1 = aliased(LeaguePlayer)
+    player2 = aliased(LeaguePlayer)
+    statement = (
+        select(
+            Match.id,
+            player1.user_id,
+            player2.user_id,
+            Match.player1_score,
+            Match.player2_score,
+            Match.player1_elo_before,
+            Match.player2_elo_before,
+            Match.player1_elo_after,
+            Match.player2_elo_after,
+        )
+        .join(player1, Match.player1_id == player1.id)
+        .join(player2, Match.player2_id == player2.id)
+        .where(
+            Match.status == "confirmed",
+            Match.player1_score.is_not(None),
+            Match.player2_score.is_not(None),
+            player1.user_id.is_not(None),
+            player2.user_id.is_not(None),
+        )
+        .order_by(Match.confirmed_at.is_(None), Match.confirmed_at, Match.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    # user_id -> [elo, games_played, k_factor_games]
+    ratings: dict[int, list[int]] = {}
+    match_updates = []
+    matches_count = 0
+    for row in session.execute(statement):
+        matches_count += 1
+        (match_id, user1, user2, score1, score2, *stored) = row
+        rating1 = ratings.setdefault(user1, [1000, 0, 0])
+        rating2 = ratings.setdefault(user2, [1000, 0, 0])
+        result1, result2 = _match_result(score1, score2)
+
+        k1 = new_player_k if rating1[2] < new_player_games else k_factor
+        k2 = new_player_k if rating2[2] < new_player_games else k_factor
+        before = (rating1[0], rating2[0])
+        change1 = calculate_elo_change(before[0], before[1], result1, k1)
+        change2 = calculate_elo_change(before[1], before[0], result2, k2)
+        for rating, change in ((rating1, change1), (rating2, change2)):
+            rating[0] += change
+            rating[1] += 1
+            rating[2] += 1
+
+        replayed = (*before, rating1[0], rating2[0])
+        if tuple(stored) != replayed:
+            match_updates.append(
+                {
+                    "_id": match_id,
+                    "player1_elo_before": replayed[0],
+                    "player2_elo_before": replayed[1],
+                    "player1_elo_after": replayed[2],
+                    "player2_elo_after": replayed[3],
+                }
+            )
+
+    existing = {elo.user_id: elo for elo in session.scalars(select(PlayerElo))}
+    changes = []
+    for user_id in sorted(existing.keys() | ratings.keys()):
+        elo, games, k_games = ratings.get(user_id, (1000, 0, 0))
+        current = existing.get(user_id)
+        stored = (
+            (current.elo, current.games_played, current.k_factor_games)
+            if current
+            else None
+        )
+        if stored == (elo, games, k_games):
+            continue
+        changes.append(
+            {
+                "user_id": user_id,
+                "elo_before": current.elo if current else None,
+                "elo_after": elo,
+                "games_before": current.games_played if current else None,
+                "games_after": games,
+                "k_factor_games": k_games,
+            }
+        )
+
+    summary = {
+        "dry_run": dry_run,
+        "matches": matches_count,
+        "players": len(ratings),
+        "matches_changed": len(match_updates),
+        "players_changed": changes,
+    }
+    if dry_run:
+        return summary
+
+    now = datetime.utcnow()
+    player_updates = [
+        {
+            "_user_id": change["user_id"],
+            "elo": change["elo_after"],
+            "games_played": change["games_after"],
+            "k_factor_games": change["k_factor_games"],
+            "updated_at": now,
+        }
+        for change in changes
+        if change["user_id"] in existing
+    ]
+    player_inserts = [
+        {
+            "user_id": change["user_id"],
+            "elo": change["elo_after"],
+            "games_played": change["games_after"],
+            "k_factor_games": change["k_factor_games"],
+            "updated_at": now,
+        }
+        for change in changes
+        if change["user_id"] not in existing
+    ]
+
+    elo_table = PlayerElo.__table__
+    match_table = Match.__table__
+    statements = [
+        (
+            update(elo_table).where(elo_table.c.user_id == bindparam("_user_id")),
+            player_updates,
+        ),
+        (insert(elo_table), player_inserts),
+        (
+            update(match_table).where(match_table.c.id == bindparam("_id")),
+            match_updates,
+        ),
+    ]
+    for statement, rows in statements:
+        for start in range(0, len(rows), batch_size):
+            session.execute(statement, rows[start : start + batch_size])
+    session.commit()
+    return summary
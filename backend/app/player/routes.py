@@ -11,6 +11,7 @@ from app.league.schemas import (
     ProfileLeagueResponse,
     ProfileMatchResponse,
 )
+from app.lists.service import load_army_lists
 from app.users.models import User
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import or_
@@ -299,6 +300,13 @@ async def get_player_profile(
     )
     opponent_user_map = {u.id: u for u in opponent_users}
 
+    # Knockout lists of the player and opponents (1 query)
+    knockout_lists = load_army_lists(
+        session,
+        [lp.knockout_army_list_id for lp in league_players]
+        + [op.knockout_army_list_id for op in opponent_players],
+    )
+
     # Group matches by league_id for the player
     matches_by_league = {}
     for match in all_matches:
@@ -394,9 +402,11 @@ async def get_player_profile(
                 can_see_opponent = league.knockout_lists_visible
 
                 if can_see_own:
-                    player_army_list = lp.knockout_army_list
+                    player_army_list = knockout_lists.get(lp.knockout_army_list_id)
                 if can_see_opponent and opponent_lp:
-                    opponent_army_list = opponent_lp.knockout_army_list
+                    opponent_army_list = knockout_lists.get(
+                        opponent_lp.knockout_army_list_id
+                    )
 
             matches.append(
                 ProfileMatchResponse(
@@ -418,7 +428,11 @@ async def get_player_profile(
 
         is_own_profile = current_user and current_user.id == user_id
         show_knockout_list = league.knockout_lists_visible or is_own_profile
-        knockout_list = league_player.knockout_army_list if show_knockout_list else None
+        knockout_list = (
+            knockout_lists.get(league_player.knockout_army_list_id)
+            if show_knockout_list
+            else None
+        )
 
         leagues_data.append(
             ProfileLeagueResponse(
@@ -432,7 +446,7 @@ async def get_player_profile(
                 total_points=league_player.total_points,
                 average_points=league_player.average_points,
                 knockout_army_list=knockout_list,
-                knockout_list_submitted=league_player.knockout_army_list is not None,
+                knockout_list_submitted=league_player.knockout_army_list_id is not None,
                 knockout_placement=league_player.knockout_placement,
                 matches=matches,
             )
@@ -0,0 +1,81 @@
+"""Short-lived cache of authenticated users.
+
+``get_current_user`` resolves the JWT subject through this cache instead of
+selecting the user on every request. Entries are detached copies of the
+row, merged into the request session without a query. Any ORM update or
+delete of a user (role change, profile edit, deletion) drops the entry in
+this process; other workers serve it for at most ``ttl`` seconds.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import settings
+from app.users.models import User
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import Session
+
+
+class UserCache:
+    """LRU of user id -> detached User with a TTL."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[float, User]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, session: Session, user_id: int) -> Optional[User]:
+        """The cached user attached to ``session``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+        return session.merge(user, load=False)
+
+    def put(self, user: User) -> None:
+        if not self.enabled:
+            return
+        copy = User(
+            **{column.key: getattr(user, column.key) for column in User.__table__.c}
+        )
+        make_transient_to_detached(copy)
+        with self._lock:
+            self._entries[user.id] = (time.monotonic() + self.ttl, copy)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+user_cache = UserCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES, ttl=settings.USER_CACHE_TTL
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target: User) -> None:
+    user_cache.invalidate(target.id)
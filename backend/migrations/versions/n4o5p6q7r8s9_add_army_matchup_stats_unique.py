@@ -0,0 +1,40 @@
+"""Add unique constraint on army matchup stats faction pair.
+
+Army stats are now maintained with INSERT ... ON CONFLICT upserts keyed on
+the faction pair. Duplicate pairs (if any) are collapsed first; run
+/admin/recalculate-army-stats afterwards to restore exact counters.
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "n4o5p6q7r8s9"
+down_revision = "m3n4o5p6q7r8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM army_matchup_stats
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM army_matchup_stats
+            GROUP BY faction, opponent_faction
+        )
+        """
+    )
+    op.create_unique_constraint(
+        "uq_army_matchup_stats_pair",
+        "army_matchup_stats",
+        ["faction", "opponent_faction"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_army_matchup_stats_pair", "army_matchup_stats", type_="unique"
+    )
@@ -0,0 +1,61 @@
+"""Add materialized group standings table.
+
+Standings are refreshed by the league service whenever group results
+change. Existing leagues are backfilled on first read.
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "o5p6q7r8s9t0"
+down_revision = "n4o5p6q7r8s9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "group_standings",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("league_id", sa.Integer(), nullable=False),
+        sa.Column("group_id", sa.Integer(), nullable=False),
+        sa.Column("player_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("qualifies", sa.Boolean(), nullable=False),
+        sa.Column("qualifies_as_runner_up", sa.Boolean(), nullable=False),
+        sa.Column("runner_up_rank", sa.Integer(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("player_id"),
+    )
+    op.create_index(
+        op.f("ix_group_standings_league_id"),
+        "group_standings",
+        ["league_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_group_standings_group_id"),
+        "group_standings",
+        ["group_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_group_standings_league_group_position",
+        "group_standings",
+        ["league_id", "group_id", "position"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_group_standings_league_group_position", table_name="group_standings"
+    )
+    op.drop_index(op.f("ix_group_standings_group_id"), table_name="group_standings")
+    op.drop_index(op.f("ix_group_standings_league_id"), table_name="group_standings")
+    op.drop_table("group_standings")
@@ -0,0 +1,60 @@
+"""Add unified BSData rules search index.
+
+Rows are rebuilt after every sync (and backfilled on the first search).
+On PostgreSQL a generated, weighted tsvector column and a trigram index on
+names back a single ranked query; SQLite builds an FTS5 table at runtime.
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "p6q7r8s9t0u1"
+down_revision = "o5p6q7r8s9t0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bsdata_search_entries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("result_type", sa.String(length=20), nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=False),
+        sa.Column("body", sa.String(), nullable=True),
+        sa.Column("faction_id", sa.Integer(), nullable=True),
+        sa.Column("faction_name", sa.String(length=100), nullable=True),
+        sa.Column("unit_id", sa.Integer(), nullable=True),
+        sa.Column("points", sa.Integer(), nullable=True),
+        sa.Column("extra", sa.String(length=200), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        ALTER TABLE bsdata_search_entries
+        ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(name, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(body, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute(
+        "CREATE INDEX ix_bsdata_search_entries_vector "
+        "ON bsdata_search_entries USING gin (search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX ix_bsdata_search_entries_name_trgm "
+        "ON bsdata_search_entries USING gin (name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bsdata_search_entries")
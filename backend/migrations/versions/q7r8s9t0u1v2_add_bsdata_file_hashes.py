@@ -0,0 +1,31 @@
+"""Add per-file content hashes for incremental BSData sync.
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "q7r8s9t0u1v2"
+down_revision = "p6q7r8s9t0u1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bsdata_file_hashes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("file_name", sa.String(length=255), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("catalog_id", sa.String(length=100), nullable=True),
+        sa.Column("synced_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("file_name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bsdata_file_hashes")
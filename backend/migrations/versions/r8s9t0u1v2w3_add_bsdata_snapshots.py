@@ -0,0 +1,29 @@
+"""Add BSData snapshot table for sync rollback.
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "r8s9t0u1v2w3"
+down_revision = "q7r8s9t0u1v2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bsdata_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("commit_hash", sa.String(length=40), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bsdata_snapshots")
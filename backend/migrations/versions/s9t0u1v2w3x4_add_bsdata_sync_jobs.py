@@ -0,0 +1,39 @@
+"""Add background BSData sync jobs.
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "s9t0u1v2w3x4"
+down_revision = "r8s9t0u1v2w3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bsdata_sync_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("force_full", sa.Boolean(), nullable=False),
+        sa.Column("requested_by", sa.Integer(), nullable=True),
+        sa.Column("phase", sa.String(length=30), nullable=True),
+        sa.Column("phases", sa.String(), nullable=False),
+        sa.Column("result", sa.String(), nullable=True),
+        sa.Column("error_message", sa.String(), nullable=True),
+        sa.Column("active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bsdata_sync_jobs")
@@ -0,0 +1,33 @@
+"""Add scheduler leader leases.
+
+Revision ID: t0u1v2w3x4y5
+Revises: s9t0u1v2w3x4
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "t0u1v2w3x4y5"
+down_revision = "s9t0u1v2w3x4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("owner", sa.String(length=100), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_scheduler_leases_name"), "scheduler_leases", ["name"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_scheduler_leases_name"), table_name="scheduler_leases")
+    op.drop_table("scheduler_leases")
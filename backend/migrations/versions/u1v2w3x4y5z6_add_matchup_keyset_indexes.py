@@ -0,0 +1,33 @@
+"""Add composite indexes for keyset pagination of matchups.
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "u1v2w3x4y5z6"
+down_revision = "t0u1v2w3x4y5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_matchups_created_at_id", "matchups", ["created_at", "id"])
+    op.create_index(
+        "ix_matchups_player1_created_at_id",
+        "matchups",
+        ["player1_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_matchups_player2_created_at_id",
+        "matchups",
+        ["player2_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_matchups_player2_created_at_id", table_name="matchups")
+    op.drop_index("ix_matchups_player1_created_at_id", table_name="matchups")
+    op.drop_index("ix_matchups_created_at_id", table_name="matchups")
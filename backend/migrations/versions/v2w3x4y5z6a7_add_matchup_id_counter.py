@@ -0,0 +1,27 @@
+"""Add the matchup id block counter.
+
+Revision ID: v2w3x4y5z6a7
+Revises: u1v2w3x4y5z6
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "v2w3x4y5z6a7"
+down_revision = "u1v2w3x4y5z6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "matchup_id_counter",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("next_value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("matchup_id_counter")
@@ -0,0 +1,141 @@
+"""Store army lists once in a content-addressed army_lists table.
+
+Revision ID: w3x4y5z6a7b8
+Revises: v2w3x4y5z6a7
+Create Date: 2026-10-17
+"""
+
+import hashlib
+import zlib
+from datetime import datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "w3x4y5z6a7b8"
+down_revision = "v2w3x4y5z6a7"
+branch_labels = None
+depends_on = None
+
+# (table, old text column, new id column)
+LIST_COLUMNS = [
+    ("matchups", "player1_list", "player1_list_id"),
+    ("matchups", "player2_list", "player2_list_id"),
+    ("league_players", "group_army_list", "group_army_list_id"),
+    ("league_players", "knockout_army_list", "knockout_army_list_id"),
+    ("matches", "player1_army_list", "player1_army_list_id"),
+    ("matches", "player2_army_list", "player2_army_list_id"),
+]
+
+army_lists = sa.table(
+    "army_lists",
+    sa.column("id", sa.Integer),
+    sa.column("content_hash", sa.String),
+    sa.column("content", sa.LargeBinary),
+    sa.column("length", sa.Integer),
+    sa.column("faction", sa.String),
+    sa.column("faction_confidence", sa.Float),
+    sa.column("created_at", sa.DateTime),
+)
+
+
+def _foreign_key_name(table: str, column: str) -> str:
+    return f"fk_{table}_{column}_army_lists"
+
+
+def upgrade() -> None:
+    from app.data.armies import detect_army
+
+    op.create_table(
+        "army_lists",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("content", sa.LargeBinary(), nullable=False),
+        sa.Column("length", sa.Integer(), nullable=False),
+        sa.Column("faction", sa.String(length=50), nullable=True),
+        sa.Column("faction_confidence", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_army_lists_content_hash", "army_lists", ["content_hash"], unique=True
+    )
+
+    for table, _, id_column in LIST_COLUMNS:
+        op.add_column(table, sa.Column(id_column, sa.Integer(), nullable=True))
+        op.create_foreign_key(
+            _foreign_key_name(table, id_column),
+            table,
+            "army_lists",
+            [id_column],
+            ["id"],
+        )
+
+    # Move every text into army_lists, detecting each distinct list once
+    conn = op.get_bind()
+    ids_by_hash: dict[str, int] = {}
+    for table, text_column, id_column in LIST_COLUMNS:
+        rows = conn.execute(
+            sa.text(
+                f"SELECT id, {text_column} FROM {table} "
+                f"WHERE {text_column} IS NOT NULL"
+            )
+        ).all()
+        for row_id, text in rows:
+            content_hash = hashlib.sha256(text.encode()).hexdigest()
+            list_id = ids_by_hash.get(content_hash)
+            if list_id is None:
+                detection = detect_army(text)
+                list_id = conn.execute(
+                    army_lists.insert()
+                    .values(
+                        content_hash=content_hash,
+                        content=zlib.compress(text.encode()),
+                        length=len(text),
+                        faction=detection.faction if detection else None,
+                        faction_confidence=detection.confidence if detection else None,
+                        created_at=datetime.utcnow(),
+                    )
+                    .returning(army_lists.c.id)
+                ).scalar_one()
+                ids_by_hash[content_hash] = list_id
+            conn.execute(
+                sa.text(f"UPDATE {table} SET {id_column} = :list_id WHERE id = :id"),
+                {"list_id": list_id, "id": row_id},
+            )
+
+    for table, text_column, _ in LIST_COLUMNS:
+        op.drop_column(table, text_column)
+
+
+def downgrade() -> None:
+    for table, text_column, _ in LIST_COLUMNS:
+        op.add_column(table, sa.Column(text_column, sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    texts = {
+        list_id: zlib.decompress(content).decode()
+        for list_id, content in conn.execute(
+            sa.select(army_lists.c.id, army_lists.c.content)
+        )
+    }
+    for table, text_column, id_column in LIST_COLUMNS:
+        rows = conn.execute(
+            sa.text(
+                f"SELECT id, {id_column} FROM {table} WHERE {id_column} IS NOT NULL"
+            )
+        ).all()
+        for row_id, list_id in rows:
+            conn.execute(
+                sa.text(f"UPDATE {table} SET {text_column} = :text WHERE id = :id"),
+                {"text": texts[list_id], "id": row_id},
+            )
+
+    for table, _, id_column in LIST_COLUMNS:
+        op.drop_constraint(
+            _foreign_key_name(table, id_column), table, type_="foreignkey"
+        )
+        op.drop_column(table, id_column)
+
+    op.drop_index("ix_army_lists_content_hash", table_name="army_lists")
+    op.drop_table("army_lists")
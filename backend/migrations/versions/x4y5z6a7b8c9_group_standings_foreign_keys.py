@@ -0,0 +1,72 @@
+"""Add foreign keys to group standings and backfill drawn leagues.
+
+Standings used to be backfilled on the first read of a league drawn before
+they were materialized; that now happens here so reads never write.
+
+Revision ID: x4y5z6a7b8c9
+Revises: w3x4y5z6a7b8
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "x4y5z6a7b8c9"
+down_revision = "w3x4y5z6a7b8"
+branch_labels = None
+depends_on = None
+
+# (column, referenced table)
+FOREIGN_KEYS = [
+    ("league_id", "leagues"),
+    ("group_id", "groups"),
+    ("player_id", "league_players"),
+]
+
+
+def _foreign_key_name(column: str) -> str:
+    return f"fk_group_standings_{column}"
+
+
+def upgrade() -> None:
+    from app.league.models import League
+    from app.league.service import refresh_group_standings
+    from sqlmodel import Session, select
+
+    conn = op.get_bind()
+
+    # Rows left behind by deleted leagues and removed players
+    for column, table in FOREIGN_KEYS:
+        conn.execute(
+            sa.text(
+                f"DELETE FROM group_standings WHERE {column} NOT IN "
+                f"(SELECT id FROM {table})"
+            )
+        )
+
+    for column, table in FOREIGN_KEYS:
+        op.create_foreign_key(
+            _foreign_key_name(column), "group_standings", table, [column], ["id"]
+        )
+
+    # Leagues drawn before standings were materialized
+    session = Session(bind=conn)
+    league_ids = conn.execute(
+        sa.text(
+            "SELECT DISTINCT groups.league_id FROM groups "
+            "WHERE NOT EXISTS (SELECT 1 FROM group_standings "
+            "WHERE group_standings.league_id = groups.league_id)"
+        )
+    ).scalars()
+    for league_id in list(league_ids):
+        league = session.exec(select(League).where(League.id == league_id)).one()
+        refresh_group_standings(session, league)
+    session.flush()
+    session.close()
+
+
+def downgrade() -> None:
+    for column, _ in FOREIGN_KEYS:
+        op.drop_constraint(
+            _foreign_key_name(column), "group_standings", type_="foreignkey"
+        )
@@ -0,0 +1,40 @@
+"""Backfill the rules search index for databases synced before it existed.
+
+The index used to be built on the first search; /search no longer writes,
+so rows are built here once and by every sync afterwards.
+
+Revision ID: y5z6a7b8c9d0
+Revises: x4y5z6a7b8c9
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "y5z6a7b8c9d0"
+down_revision = "x4y5z6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    from app.bsdata.search import rebuild_search_index
+    from sqlmodel import Session
+
+    conn = op.get_bind()
+    has_entries = conn.execute(
+        sa.text("SELECT 1 FROM bsdata_search_entries LIMIT 1")
+    ).first()
+    has_rules = conn.execute(sa.text("SELECT 1 FROM bsdata_factions LIMIT 1")).first()
+    if has_entries or not has_rules:
+        return
+
+    session = Session(bind=conn)
+    rebuild_search_index(session)
+    session.flush()
+    session.close()
+
+
+def downgrade() -> None:
+    # Index rows are derived data; keeping them is harmless
+    pass
@@ -0,0 +1,24 @@
+"""Record which process owns a BSData sync job.
+
+Revision ID: z6a7b8c9d0e1
+Revises: y5z6a7b8c9d0
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "z6a7b8c9d0e1"
+down_revision = "y5z6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "bsdata_sync_jobs", sa.Column("owner", sa.String(length=100), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("bsdata_sync_jobs", "owner")
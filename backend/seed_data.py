@@ -12,6 +12,7 @@ from app.core.security import get_password_hash
 
 # Avoid circular imports by importing from db first
 from app.db import engine
+from app.lists.service import store_army_list
 from app.matchup.models import Matchup
 
 # Import models directly, avoiding package __init__
@@ -85,11 +86,13 @@ def main():
         for table in [
             "votes",
             "vote_categories",
+            "group_standings",
             "matches",
             "league_players",
             "groups",
             "leagues",
             "matchups",
+            "army_lists",
             "player_elo",
             "users",
             "app_settings",
@@ -238,13 +241,14 @@ def main():
         for i, p in enumerate(players[:8]):
             gid = g1a if i < 4 else g1b
             faction = choice(FACTIONS)
+            group_list = store_army_list(session, f"{faction} list...")
             session.exec(
                 text(
                     f"""
                 INSERT INTO league_players (league_id, user_id, group_id, is_claimed, discord_username,
-                    group_army_faction, group_army_list, knockout_army_faction, games_played, games_won, games_drawn, games_lost, total_points, joined_at)
+                    group_army_faction, group_army_list_id, knockout_army_faction, games_played, games_won, games_drawn, games_lost, total_points, joined_at)
                 VALUES ({league1_id}, {p.id}, {gid}, true, '{p.discord_username}', 
-                    '{faction}', '{faction} list...', '{faction}', 0, 0, 0, 0, 0, NOW())
+                    '{faction}', {group_list.id}, '{faction}', 0, 0, 0, 0, 0, NOW())
             """
                 )
             )
@@ -401,14 +405,16 @@ def main():
         for i, p in enumerate(players[:16]):
             gid = g2_ids[i // 4]
             faction = choice(FACTIONS)
+            group_list = store_army_list(session, f"{faction} list")
+            knockout_list = store_army_list(session, f"{faction} ko list")
             session.exec(
                 text(
                     f"""
                 INSERT INTO league_players (league_id, user_id, group_id, is_claimed, discord_username,
-                    group_army_faction, group_army_list, knockout_army_faction, knockout_army_list,
+                    group_army_faction, group_army_list_id, knockout_army_faction, knockout_army_list_id,
                     games_played, games_won, games_drawn, games_lost, total_points, joined_at)
                 VALUES ({league2_id}, {p.id}, {gid}, true, '{p.discord_username}',
-                    '{faction}', '{faction} list', '{faction}', '{faction} ko list', 0, 0, 0, 0, 0, NOW())
+                    '{faction}', {group_list.id}, '{faction}', {knockout_list.id}, 0, 0, 0, 0, 0, NOW())
             """
                 )
             )
@@ -542,13 +548,14 @@ def main():
         for i, p in enumerate(players[5:17]):
             gid = g3a if i < 6 else g3b
             faction = choice(FACTIONS)
+            group_list = store_army_list(session, f"{faction} list")
             session.exec(
                 text(
                     f"""
                 INSERT INTO league_players (league_id, user_id, group_id, is_claimed, discord_username,
-                    group_army_faction, group_army_list, games_played, total_points, joined_at)
+                    group_army_faction, group_army_list_id, games_played, total_points, joined_at)
                 VALUES ({league3_id}, {p.id}, {gid}, true, '{p.discord_username}',
-                    '{faction}', '{faction} list', 0, 0, NOW())
+                    '{faction}', {group_list.id}, 0, 0, NOW())
             """
                 )
             )
@@ -707,6 +714,14 @@ def main():
             )
         session.commit()
 
+        # Materialize group standings for the drawn leagues
+        from app.league.models import League
+        from app.league.service import refresh_group_standings
+
+        for league in session.exec(select(League)).all():
+            refresh_group_standings(session, league)
+        session.commit()
+
         # Create matchups
         print("\nCreating matchups...")
         matchups_data = [
@@ -722,13 +737,17 @@ def main():
             ),
         ]
         for name, p1, p2, sub1, sub2, list1, list2 in matchups_data:
+            list1_id, list2_id = (
+                store_army_list(session, army_list).id if army_list else "NULL"
+                for army_list in (list1, list2)
+            )
             session.exec(
                 text(
                     f"""
                 INSERT INTO matchups (name, player1_id, player2_id, player1_submitted, player2_submitted,
-                    player1_list, player2_list, is_public, created_at)
+                    player1_list_id, player2_list_id, is_public, created_at)
                 VALUES ('{name}', {p1}, {p2}, {str(sub1).lower()}, {str(sub2).lower()},
-                    {f"'{list1}'" if list1 else 'NULL'}, {f"'{list2}'" if list2 else 'NULL'}, true, NOW())
+                    {list1_id}, {list2_id}, true, NOW())
             """
                 )
             )
@@ -2,6 +2,7 @@ import random
 
 from app.data.armies import ARMY_FACTIONS
 from app.db import engine
+from app.lists.service import store_army_list
 from sqlmodel import Session, text
 
 with Session(engine) as session:
@@ -34,15 +35,15 @@ Behemoth:
 - Monster/War Machine
 
 Total: 2000/2000 points"""
-            safe_list = list_text.replace("'", "''")
+            army_list = store_army_list(session, list_text)
             session.exec(
                 text(
                     f"""
                 UPDATE league_players 
                 SET group_army_faction = '{faction}',
-                    group_army_list = '{safe_list}',
+                    group_army_list_id = {army_list.id},
                     knockout_army_faction = '{faction}',
-                    knockout_army_list = '{safe_list}'
+                    knockout_army_list_id = {army_list.id}
                 WHERE id = {row[0]}
             """
                 )
@@ -53,9 +54,9 @@ Total: 2000/2000 points"""
                     f"""
                 UPDATE league_players 
                 SET group_army_faction = '{faction}',
-                    group_army_list = NULL,
+                    group_army_list_id = NULL,
                     knockout_army_faction = '{faction}',
-                    knockout_army_list = NULL
+                    knockout_army_list_id = NULL
                 WHERE id = {row[0]}
             """
                 )
@@ -84,11 +85,11 @@ Total: 2000/2000 points"""
 
     print("Updated factions!")
     with_list = session.exec(
-        text("SELECT COUNT(*) FROM league_players WHERE group_army_list IS NOT NULL")
+        text("SELECT COUNT(*) FROM league_players WHERE group_army_list_id IS NOT NULL")
     ).first()[0]
     without_list = session.exec(
         text(
-            "SELECT COUNT(*) FROM league_players WHERE group_army_list IS NULL AND group_id IS NOT NULL"
+            "SELECT COUNT(*) FROM league_players WHERE group_army_list_id IS NULL AND group_id IS NOT NULL"
         )
     ).first()[0]
     print(f"Players with lists: {with_list}, without: {without_list}")
@@ -2,11 +2,15 @@
 
 import os
 import sys
+import uuid
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.pool import StaticPool
 
 # Add app directory to path
@@ -24,6 +28,9 @@ from app.bsdata.models import (
     BattleFormation,
     BattleTacticCard,
     BattleTrait,
+    BSDataFileHash,
+    BSDataSnapshot,
+    BSDataSyncJob,
     BSDataSyncStatus,
     CoreAbility,
     Faction,
@@ -34,6 +41,7 @@ from app.bsdata.models import (
     Prayer,
     PrayerLore,
     RegimentOfRenown,
+    SearchEntry,
     Spell,
     SpellLore,
     Unit,
@@ -41,6 +49,8 @@ from app.bsdata.models import (
     UnitFaction,
     Weapon,
 )
+from app.core.db_metrics import instrument_engine
+from app.core.settings_cache import settings_cache
 from app.league.models import (
     AppSettings,
     ArmyMatchupStats,
@@ -50,10 +60,13 @@ from app.league.models import (
     LeaguePlayer,
     Match,
     PlayerElo,
+    SchedulerLease,
     Vote,
     VoteCategory,
 )
-from app.matchup.models import Matchup
+from app.lists.models import ArmyList
+from app.matchup.models import Matchup, MatchupIdCounter
+from app.users.cache import user_cache
 from app.users.models import OAuthAccount, User
 
 
@@ -63,14 +76,22 @@ def session_fixture():
     from datetime import datetime, timedelta
 
     from app.core.security import get_password_hash
+    from app.lists.service import store_army_list
 
+    # Named shared-cache database so async routes (aiosqlite) see the same data
+    database = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true"
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{database}",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
     SQLModel.metadata.create_all(engine)
+    instrument_engine(engine)
+    settings_cache.clear()
+    user_cache.clear()
     with Session(engine) as session:
+        session.info["test_database"] = database
+
         # Seed test user: alakhaine@dundrafts.com / Alakhaine / FinFan11
         test_user = User(
             email="alakhaine@dundrafts.com",
@@ -92,8 +113,7 @@ def session_fixture():
             player1_id=test_user.id,
             player1_submitted=True,
             player2_submitted=False,
-            player1_list="Cities of Sigmar",
-            player2_list=None,
+            player1_list_id=store_army_list(session, "Cities of Sigmar").id,
             map_name="Age of Sigmar Mission 1",
             created_at=datetime.utcnow(),
         )
@@ -106,13 +126,30 @@ def session_fixture():
 @pytest.fixture(name="client")
 def client_fixture(session: Session):
     """Create a test client with database session override"""
-    from app.db import get_session
+    from app.bsdata.cache import response_cache
+    from app.bsdata.lists import army_list_parser
+    from app.db import get_async_session, get_session
     from app.main import app
+    from app.matchup.ids import matchup_id_allocator
+
+    response_cache.clear()
+    army_list_parser.clear()
+    matchup_id_allocator.clear()
+
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{session.info['test_database']}",
+        poolclass=NullPool,
+    )
 
     def get_session_override():
         return session
 
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+            yield async_session
+
     app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_async_session] = get_async_session_override
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
@@ -137,3 +174,10 @@ def auth_headers_fixture(client: TestClient):
     )
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(name="metrics_headers")
+def metrics_headers_fixture(monkeypatch):
+    """Configure a metrics token and return headers that pass it"""
+    monkeypatch.setattr("app.core.deps.settings.METRICS_TOKEN", "test-metrics-token")
+    return {"Authorization": "Bearer test-metrics-token"}
@@ -1,6 +1,7 @@
 """Tests for army faction detection."""
 
 import pytest
+from app.data.armies import detect_army
 from app.matchup.constants import ARMY_FACTIONS, detect_army_faction
 
 
@@ -264,3 +265,46 @@ class TestDetectArmyFaction:
         for army_list, expected in destruction_tests:
             result = detect_army_faction(army_list)
             assert result == expected, f"Failed to detect {expected}"
+
+    def test_keywords_match_whole_words_only(self):
+        """Keywords inside longer words are not hits."""
+        assert detect_army_faction("Hobgrot Slittaz\nBeast-skewer Killbow") == (
+            "Kruleboyz"
+        )
+        assert detect_army_faction("Horrorshow Warband\nLauric Company") is None
+
+    def test_longest_keyword_wins(self):
+        """'Crypt Horrors' are Flesh-eater Courts, not Tzeentch horrors."""
+        army_list = """Ghoul Party
+
+        Abhorrant Archregent
+        20x Crypt Horrors
+        """
+        assert detect_army_faction(army_list) == "Flesh-eater Courts"
+
+
+class TestDetectArmy:
+    """Test detection results with confidence and hits."""
+
+    def test_reports_hits_and_confidence(self):
+        detection = detect_army(
+            "Sylvaneth\nTreelord Ancient\n3x Kurnoth Hunters\nGrots"
+        )
+
+        assert detection.faction == "Sylvaneth"
+        assert detection.confidence == 0.75
+        assert detection.hits == [
+            ("sylvaneth", "Sylvaneth"),
+            ("treelord", "Sylvaneth"),
+            ("kurnoth", "Sylvaneth"),
+            ("grot", "Gloomspite Gitz"),
+        ]
+
+    def test_most_hits_wins_without_faction_name(self):
+        detection = detect_army("Grand Army\nSquig Hoppers\nLoonboss\n10x Brutes")
+
+        assert detection.faction == "Gloomspite Gitz"
+        assert detection.confidence == 0.67
+
+    def test_no_hits(self):
+        assert detect_army("Random Text\nSome Unit") is None
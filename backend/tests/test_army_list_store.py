@@ -0,0 +1,79 @@
+"""Tests for the content-addressed army list store."""
+
+from unittest.mock import patch
+
+from app.data.armies import detect_army
+from app.lists.models import ArmyList
+from app.lists.service import (
+    army_list_hash,
+    load_army_list,
+    load_army_lists,
+    store_army_list,
+)
+from app.matchup.models import Matchup
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+IRONJAWZ = "Ironjawz\n- Megaboss on Maw-krusha\n- 10 Brutes"
+
+
+class TestStoreArmyList:
+    def test_stores_compressed_text_with_faction(self, session: Session):
+        army_list = store_army_list(session, IRONJAWZ)
+
+        assert army_list.id is not None
+        assert army_list.content_hash == army_list_hash(IRONJAWZ)
+        assert army_list.content != IRONJAWZ.encode()
+        assert army_list.text == IRONJAWZ
+        assert army_list.length == len(IRONJAWZ)
+        assert army_list.faction == "Ironjawz"
+
+    def test_same_text_is_stored_once(self, session: Session):
+        with patch("app.lists.service.detect_army", wraps=detect_army) as detect:
+            first = store_army_list(session, IRONJAWZ)
+            second = store_army_list(session, IRONJAWZ)
+
+        assert first.id == second.id
+        assert detect.call_count == 1
+        rows = session.exec(
+            select(ArmyList).where(ArmyList.content_hash == army_list_hash(IRONJAWZ))
+        ).all()
+        assert len(rows) == 1
+
+    def test_different_texts_get_different_ids(self, session: Session):
+        first = store_army_list(session, IRONJAWZ)
+        second = store_army_list(session, IRONJAWZ + "\n- 5 Ardboys")
+
+        assert first.id != second.id
+
+
+class TestLoadArmyLists:
+    def test_loads_many_and_skips_missing(self, session: Session):
+        first = store_army_list(session, "List A")
+        second = store_army_list(session, "List B")
+
+        assert load_army_lists(session, [first.id, second.id, None]) == {
+            first.id: "List A",
+            second.id: "List B",
+        }
+        assert load_army_lists(session, [None]) == {}
+
+    def test_load_single(self, session: Session):
+        army_list = store_army_list(session, "List A")
+
+        assert load_army_list(session, army_list.id) == "List A"
+        assert load_army_list(session, None) is None
+
+
+class TestMatchupListsShareRows:
+    def test_identical_lists_reference_one_row(
+        self, client: TestClient, session: Session
+    ):
+        names = [
+            client.post("/matchup", json={"army_list": IRONJAWZ}).json()["name"]
+            for _ in range(2)
+        ]
+
+        matchups = session.exec(select(Matchup).where(Matchup.name.in_(names))).all()
+        assert len({matchup.player1_list_id for matchup in matchups}) == 1
+        assert {matchup.player1_army_faction for matchup in matchups} == {"Ironjawz"}
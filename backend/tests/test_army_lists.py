@@ -0,0 +1,231 @@
+"""Tests for army list parsing against BSData units."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from app.bsdata import lists
+from app.bsdata.lists import ArmyListParser, IndexedUnit, UnitNameIndex, parse_army_list
+from app.bsdata.models import BSDataSyncStatus, Faction, GrandAlliance, Unit
+from app.league.elo import set_setting
+from app.league.models import League, LeaguePlayer
+from app.league.service import draw_groups
+from app.lists.service import store_army_list
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+UNITS = [
+    IndexedUnit(1, "Lord-Celestant on Stardrake", "Stormcast Eternals", 500, False),
+    IndexedUnit(2, "Liberators", "Stormcast Eternals", 100, True),
+    IndexedUnit(3, "Knight-Incantor", "Stormcast Eternals", 130, False),
+    IndexedUnit(4, "Liberators", "Vigilant Brotherhood", 110, True),
+    IndexedUnit(5, "Brutes", "Ironjawz", 180, True),
+]
+
+APP_EXPORT = """Stormcast Eternals - 1000 points
+Scions of the Storm
+
+General's Regiment
+Lord-Celestant on Stardrake (500 points)
+• General
+10x Liberators (Reinforced) (200 points)
+Knight-Incantor (130 points)
+
+Total: 830/1000 pts
+Created with Warhammer Age of Sigmar: The App
+"""
+
+
+@pytest.fixture(name="index")
+def index_fixture() -> UnitNameIndex:
+    return UnitNameIndex(UNITS)
+
+
+class TestParseArmyList:
+    def test_app_export(self, index):
+        result = parse_army_list(APP_EXPORT, index)
+
+        assert result.faction == "Stormcast Eternals"
+        assert [unit.unit_id for unit in result.units] == [1, 2, 3]
+        assert result.units[1].quantity == 10
+        assert result.points_total == 830
+        assert (result.declared_points, result.points_limit) == (830, 1000)
+        assert result.valid
+        assert result.errors == []
+
+    def test_prefers_units_of_detected_faction(self, index):
+        result = parse_army_list("Stormcast Eternals\n5x Liberators - 100pts", index)
+
+        assert result.units[0].unit_id == 2
+
+    def test_fuzzy_match(self, index):
+        result = parse_army_list("Stormcast Eternals\nKnight Incantor - 130pts", index)
+
+        unit = result.units[0]
+        assert (unit.unit_id, unit.exact_match) == (3, False)
+        assert unit.matched_name == "Knight-Incantor"
+
+    def test_points_errors(self, index):
+        army_list = """Ironjawz
+        Brutes - 200pts
+        Gutrippaz - 150pts
+        Total: 400/300 pts
+        """
+
+        result = parse_army_list(army_list, index)
+
+        assert not result.valid
+        assert result.errors == [
+            "Line 2: Brutes listed at 200 pts, BSData has 180 pts",
+            "Line 3: unknown unit 'Gutrippaz'",
+            "Declared total 400 pts does not match unit points 200 pts",
+        ]
+
+    def test_points_limit(self, index):
+        result = parse_army_list("Ironjawz - 300 points\nBrutes (360 pts)", index)
+
+        assert result.errors == ["Army is 360 pts, over the 300 pts limit"]
+
+    def test_bracketed_number_without_suffix_is_not_points(self, index):
+        result = parse_army_list("Ironjawz\nBrutes (20)", index)
+
+        assert result.units[0].points == 180
+        assert result.valid
+
+    def test_reinforced_doubles_points_once(self, index):
+        army_list = """Stormcast Eternals
+        Liberators (Reinforced) (200 pts)
+        Liberators (Reinforced) (400 pts)
+        Liberators (200 pts)
+        """
+
+        result = parse_army_list(army_list, index)
+
+        assert result.errors == [
+            "Line 3: Liberators listed at 400 pts, BSData has 200 pts"
+        ]
+
+    def test_unpriced_units_use_bsdata_points(self, index):
+        result = parse_army_list("Ironjawz\nBrutes\nSome Header", index)
+
+        assert [unit.points for unit in result.units] == [180]
+        assert result.points_total == 180
+
+
+class TestArmyListParser:
+    def test_caches_per_commit_and_list(self, session: Session, monkeypatch):
+        alliance = GrandAlliance(name="Destruction")
+        session.add(alliance)
+        session.commit()
+        faction = Faction(
+            bsdata_id="ij", name="Ironjawz", grand_alliance_id=alliance.id
+        )
+        session.add(faction)
+        session.commit()
+        session.add(
+            Unit(bsdata_id="b", faction_id=faction.id, name="Brutes", points=180)
+        )
+        session.commit()
+
+        loads = []
+        load = UnitNameIndex.load.__func__
+        monkeypatch.setattr(
+            UnitNameIndex,
+            "load",
+            classmethod(lambda cls, s: loads.append(1) or load(cls, s)),
+        )
+        parser = ArmyListParser(max_entries=10)
+
+        first = parser.parse(session, "Ironjawz\nBrutes (180)", "a" * 40)
+        assert parser.parse(session, "Ironjawz\nBrutes (180)", "a" * 40) is first
+        parser.parse(session, "Ironjawz\n5x Brutes (180)", "a" * 40)
+        parser.parse(session, "Ironjawz\nBrutes (180)", "b" * 40)
+
+        assert first.units[0].matched_name == "Brutes"
+        assert len(loads) == 2
+
+
+@pytest.fixture(name="synced_rules")
+def synced_rules_fixture(session: Session) -> Unit:
+    """Ironjawz Brutes from a successful sync, with the rules feature on."""
+    alliance = GrandAlliance(name="Destruction")
+    session.add(alliance)
+    session.commit()
+    faction = Faction(bsdata_id="ij", name="Ironjawz", grand_alliance_id=alliance.id)
+    session.add(faction)
+    session.commit()
+    unit = Unit(bsdata_id="b", faction_id=faction.id, name="Brutes", points=180)
+    session.add(unit)
+    session.add(
+        BSDataSyncStatus(commit_hash="a" * 40, commit_short="a" * 7, sync_type="full")
+    )
+    session.commit()
+    set_setting(session, "rules_enabled", "true")
+    return unit
+
+
+def create_revealed_matchup(client: TestClient) -> str:
+    name = client.post(
+        "/matchup", json={"army_list": "Ironjawz\nBrutes (180 pts)"}
+    ).json()["name"]
+    client.post(
+        f"/matchup/{name}/submit", json={"army_list": "Ironjawz\n5x Brutes - 360pts"}
+    )
+    return name
+
+
+class TestParsedListsInResponses:
+    def test_reveal_parses_each_list_once(self, client: TestClient, synced_rules: Unit):
+        name = create_revealed_matchup(client)
+
+        with patch.object(lists, "parse_army_list", wraps=parse_army_list) as parse:
+            first = client.get(f"/matchup/{name}/reveal").json()
+            second = client.get(f"/matchup/{name}/reveal").json()
+
+        assert parse.call_count == 2
+        assert first == second
+        assert first["player1_parsed_list"]["units"][0]["unit_id"] == synced_rules.id
+        assert first["player1_parsed_list"]["valid"]
+        assert first["player2_parsed_list"]["points_total"] == 360
+
+    def test_reveal_without_rules_has_no_parsed_lists(
+        self, client: TestClient, session: Session, synced_rules: Unit
+    ):
+        set_setting(session, "rules_enabled", "false")
+        name = create_revealed_matchup(client)
+
+        data = client.get(f"/matchup/{name}/reveal").json()
+
+        assert data["player1_parsed_list"] is None
+        assert data["player2_parsed_list"] is None
+
+    def test_standings_include_parsed_visible_lists(
+        self, client: TestClient, session: Session, synced_rules: Unit
+    ):
+        league = League(
+            name="Test League",
+            organizer_id=1,
+            registration_end=datetime.utcnow() + timedelta(days=7),
+            group_lists_visible=True,
+        )
+        session.add(league)
+        session.commit()
+        army_list = store_army_list(session, "Ironjawz\nBrutes (180 pts)")
+        for i in range(4):
+            session.add(
+                LeaguePlayer(
+                    league_id=league.id,
+                    user_id=100 + i,
+                    group_army_list_id=army_list.id if i == 0 else None,
+                )
+            )
+        session.commit()
+        draw_groups(session, league)
+
+        response = client.get(f"/league/{league.id}/standings")
+
+        assert response.status_code == 200
+        entries = response.json()[0]["standings"]
+        parsed = [entry["parsed_army_list"] for entry in entries]
+        assert [p["units"][0]["unit_id"] for p in parsed if p] == [synced_rules.id]
+        assert parsed.count(None) == 3
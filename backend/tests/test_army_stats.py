@@ -11,7 +11,7 @@ from app.league.models import (
     LeaguePlayer,
     Match,
 )
-from app.league.service import update_army_stats_after_match
+from app.league.service import recalculate_all_army_stats, update_army_stats_after_match
 from sqlmodel import Session, select
 
 
@@ -437,3 +437,153 @@ class TestArmyMatchupStats:
         # No matchup stats (need both factions)
         matchup_stats = session.scalars(select(ArmyMatchupStats)).all()
         assert len(matchup_stats) == 0
+
+    def test_repeated_matchups_accumulate_on_single_row(self, session: Session):
+        """Upserts keep one row per faction pair and add to its counters."""
+        league = League(
+            name="Test League",
+            organizer_id=1,
+            registration_end=datetime.utcnow() + timedelta(days=7),
+        )
+        session.add(league)
+        session.commit()
+
+        player1 = LeaguePlayer(
+            league_id=league.id, user_id=101, group_army_faction="Seraphon"
+        )
+        player2 = LeaguePlayer(
+            league_id=league.id, user_id=102, group_army_faction="Skaven"
+        )
+        session.add_all([player1, player2])
+        session.commit()
+
+        for p1_score, p2_score in [(80, 40), (40, 80), (60, 60)]:
+            update_army_stats_after_match(
+                session=session,
+                player1=player1,
+                player2=player2,
+                player1_score=p1_score,
+                player2_score=p2_score,
+                phase="group",
+            )
+        session.commit()
+
+        matchups = session.scalars(
+            select(ArmyMatchupStats).where(ArmyMatchupStats.faction == "Seraphon")
+        ).all()
+        assert len(matchups) == 1
+        assert matchups[0].games_played == 3
+        assert (matchups[0].wins, matchups[0].draws, matchups[0].losses) == (1, 1, 1)
+
+        seraphon = session.scalars(
+            select(ArmyStats).where(ArmyStats.faction == "Seraphon")
+        ).one()
+        assert seraphon.games_played == 3
+
+
+class TestRecalculateAllArmyStats:
+    """Test the bulk rebuild of army statistics from confirmed matches."""
+
+    def _create_players(self, session: Session, factions: list[str]):
+        league = League(
+            name="Test League",
+            organizer_id=1,
+            registration_end=datetime.utcnow() + timedelta(days=7),
+        )
+        session.add(league)
+        session.commit()
+
+        players = [
+            LeaguePlayer(
+                league_id=league.id,
+                user_id=100 + i,
+                group_army_faction=faction,
+                knockout_army_faction=f"{faction} KO",
+            )
+            for i, faction in enumerate(factions)
+        ]
+        session.add_all(players)
+        session.commit()
+        return league, players
+
+    def _add_match(
+        self, session, league, p1, p2, s1, s2, phase="group", status="confirmed"
+    ):
+        match = Match(
+            league_id=league.id,
+            player1_id=p1.id,
+            player2_id=p2.id,
+            phase=phase,
+            player1_score=s1,
+            player2_score=s2,
+            status=status,
+        )
+        session.add(match)
+        session.commit()
+        return match
+
+    def test_rebuild_matches_incremental_updates(self, session: Session):
+        """Rebuild yields the same counters as per-match updates."""
+        league, (p1, p2, p3) = self._create_players(
+            session, ["Stormcast Eternals", "Ironjawz", "Stormcast Eternals"]
+        )
+        self._add_match(session, league, p1, p2, 72, 65)
+        self._add_match(session, league, p2, p1, 50, 50)
+        self._add_match(session, league, p1, p3, 60, 40)  # mirror
+        self._add_match(session, league, p2, p3, 70, 30, status="pending_confirmation")
+
+        result = recalculate_all_army_stats(session)
+
+        assert result["matches_processed"] == 3
+        assert result["factions_tracked"] == 2
+        assert result["matchups_tracked"] == 2
+        assert result["rows_written"] == 4
+        assert "matches_per_second" in result
+
+        stormcast = session.scalars(
+            select(ArmyStats).where(ArmyStats.faction == "Stormcast Eternals")
+        ).first()
+        assert stormcast.games_played == 4
+        assert stormcast.wins == 2
+        assert stormcast.draws == 1
+        assert stormcast.losses == 1
+
+        ironjawz = session.scalars(
+            select(ArmyStats).where(ArmyStats.faction == "Ironjawz")
+        ).first()
+        assert (
+            ironjawz.games_played,
+            ironjawz.wins,
+            ironjawz.draws,
+            ironjawz.losses,
+        ) == (
+            2,
+            0,
+            1,
+            1,
+        )
+
+        matchup = session.scalars(
+            select(ArmyMatchupStats).where(
+                ArmyMatchupStats.faction == "Stormcast Eternals",
+                ArmyMatchupStats.opponent_faction == "Ironjawz",
+            )
+        ).first()
+        assert matchup.games_played == 2
+        assert matchup.wins == 1
+        assert matchup.draws == 1
+
+    def test_rebuild_replaces_existing_stats(self, session: Session):
+        """Stale cached rows are discarded and knockout factions are used."""
+        session.add(ArmyStats(faction="Stale Faction", games_played=9, wins=9))
+        session.commit()
+
+        league, (p1, p2) = self._create_players(session, ["Seraphon", "Skaven"])
+        self._add_match(session, league, p1, p2, 40, 80, phase="knockout")
+
+        recalculate_all_army_stats(session)
+
+        factions = {s.faction: s for s in session.scalars(select(ArmyStats)).all()}
+        assert set(factions) == {"Seraphon KO", "Skaven KO"}
+        assert factions["Skaven KO"].wins == 1
+        assert factions["Seraphon KO"].losses == 1
@@ -0,0 +1,318 @@
+"""Tests for BSData read endpoints, response caching and rules search."""
+
+import json
+from datetime import datetime
+
+import pytest
+from app.bsdata.jobs import sync_job_runner
+from app.bsdata.models import (
+    BattleTrait,
+    BSDataSyncJob,
+    Faction,
+    GrandAlliance,
+    SearchEntry,
+    Unit,
+    UnitAbility,
+    Weapon,
+)
+from app.bsdata.search import rebuild_search_index
+from app.core.security import create_access_token, get_password_hash
+from app.users.models import User
+from sqlmodel import Session, select
+
+
+@pytest.fixture(name="admin_headers")
+def admin_headers_fixture(session: Session) -> dict:
+    """Admin bypasses the rules feature toggle."""
+    admin = User(
+        email="admin@test.com",
+        username="TestAdmin",
+        hashed_password=get_password_hash("AdminPass123"),
+        role="admin",
+        is_active=True,
+        is_verified=True,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+    session.add(admin)
+    session.commit()
+    token = create_access_token(data={"sub": str(admin.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(name="stormcast")
+def stormcast_fixture(session: Session) -> Faction:
+    order = GrandAlliance(name="Order")
+    session.add(order)
+    session.commit()
+
+    faction = Faction(
+        bsdata_id="sce", name="Stormcast Eternals", grand_alliance_id=order.id
+    )
+    session.add(faction)
+    session.commit()
+
+    unit = Unit(bsdata_id="liberators", faction_id=faction.id, name="Liberators")
+    session.add(unit)
+    session.commit()
+
+    session.add(
+        Weapon(
+            bsdata_id="warhammer",
+            unit_id=unit.id,
+            name="Warhammer",
+            weapon_type="melee",
+        )
+    )
+    session.commit()
+    session.refresh(faction)
+    return faction
+
+
+class TestAsyncBSDataReads:
+    """Read endpoints run on the async engine and see committed data."""
+
+    def test_list_factions(self, client, admin_headers, stormcast):
+        response = client.get("/bsdata/factions", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data[0]["name"] == "Stormcast Eternals"
+        assert data[0]["grand_alliance"] == "Order"
+        assert data[0]["units_count"] == 1
+
+    def test_get_faction_loads_grand_alliance(self, client, admin_headers, stormcast):
+        response = client.get(f"/bsdata/factions/{stormcast.id}", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["grand_alliance"]["name"] == "Order"
+
+    def test_get_unit_with_weapons(self, client, admin_headers, stormcast):
+        units = client.get(
+            f"/bsdata/factions/{stormcast.id}/units", headers=admin_headers
+        ).json()
+        response = client.get(f"/bsdata/units/{units[0]['id']}", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["faction_name"] == "Stormcast Eternals"
+        assert [w["name"] for w in data["weapons"]] == ["Warhammer"]
+
+    def test_missing_faction_returns_404(self, client, admin_headers):
+        response = client.get("/bsdata/factions/999", headers=admin_headers)
+        assert response.status_code == 404
+
+
+class TestBSDataResponseCache:
+    """Read endpoints are cached per sync commit and honour If-None-Match."""
+
+    def test_response_has_strong_etag(self, client, admin_headers, stormcast):
+        response = client.get("/bsdata/factions", headers=admin_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('"') and not etag.startswith("W/")
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_matching_etag_returns_304(self, client, admin_headers, stormcast):
+        etag = client.get("/bsdata/factions", headers=admin_headers).headers["etag"]
+        response = client.get(
+            "/bsdata/factions", headers={**admin_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_cached_until_new_sync_commit(
+        self, client, session, admin_headers, stormcast
+    ):
+        from app.bsdata.cache import response_cache
+
+        url = f"/bsdata/factions/{stormcast.id}/units"
+        first = client.get(url, headers=admin_headers)
+        session.add(Unit(bsdata_id="prosecutors", faction_id=stormcast.id, name="P"))
+        session.commit()
+
+        cached = client.get(url, headers=admin_headers)
+        assert cached.json() == first.json()
+
+        response_cache.set_version("abc123")
+        fresh = client.get(url, headers=admin_headers)
+        assert len(fresh.json()) == 2
+        assert fresh.headers["etag"] != first.headers["etag"]
+
+    def test_query_parameters_are_part_of_the_key(
+        self, client, admin_headers, stormcast
+    ):
+        assert client.get("/bsdata/factions", headers=admin_headers).json()
+        response = client.get(
+            "/bsdata/factions?grand_alliance=Chaos", headers=admin_headers
+        )
+        assert response.json() == []
+
+    def test_rules_toggle_still_applies(self, client, admin_headers, stormcast):
+        client.get("/bsdata/factions", headers=admin_headers)
+        assert client.get("/bsdata/factions").status_code in (401, 403)
+
+
+@pytest.fixture(name="searchable_rules")
+def searchable_rules_fixture(session: Session, stormcast: Faction) -> Faction:
+    unit = session.exec(select(Unit).where(Unit.name == "Liberators")).one()
+    session.add(
+        UnitAbility(
+            bsdata_id="lay-low",
+            unit_id=unit.id,
+            name="Lay Low the Tyrants",
+            ability_type="passive",
+            effect="Add 1 to hit rolls against Warmaster units.",
+        )
+    )
+    session.add(
+        BattleTrait(
+            bsdata_id="scions",
+            faction_id=stormcast.id,
+            name="Scions of the Storm",
+            effect="Deploy Liberators in the heavens.",
+        )
+    )
+
+    aor = Faction(
+        bsdata_id="aor",
+        name="Ruination Brotherhood",
+        grand_alliance_id=stormcast.grand_alliance_id,
+        is_aor=True,
+        parent_faction_id=stormcast.id,
+    )
+    session.add(aor)
+    session.commit()
+    session.add(Unit(bsdata_id="aor-liberators", faction_id=aor.id, name="Liberators"))
+    session.commit()
+    # Built by the sync in production
+    rebuild_search_index(session)
+    session.commit()
+    return stormcast
+
+
+class TestRulesSearch:
+    """/search runs one ranked query over the rules search index."""
+
+    def test_search_does_not_build_index(
+        self, client, session, admin_headers, stormcast
+    ):
+        response = client.get("/bsdata/search?query=liberators", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json() == []
+        assert session.exec(select(SearchEntry)).all() == []
+
+    def test_like_wildcards_are_literal(self, client, admin_headers, searchable_rules):
+        for query in ("l_", "%%"):
+            response = client.get(
+                "/bsdata/search", params={"query": query}, headers=admin_headers
+            )
+            assert response.json() == []
+
+    def test_name_matches_rank_above_effect_text(
+        self, client, admin_headers, searchable_rules
+    ):
+        data = client.get(
+            "/bsdata/search?query=liberators", headers=admin_headers
+        ).json()
+        assert [(r["result_type"], r["name"]) for r in data] == [
+            ("unit", "Liberators"),
+            ("battle_trait", "Scions of the Storm"),
+        ]
+        assert data[0]["faction_name"] == "Stormcast Eternals"
+
+    def test_ability_links_back_to_unit(self, client, admin_headers, searchable_rules):
+        data = client.get("/bsdata/search?query=tyrant", headers=admin_headers).json()
+        assert data[0]["result_type"] == "ability"
+        assert data[0]["extra"] == "Liberators"
+        assert data[0]["unit_id"] is not None
+
+    def test_short_query_matches_names(self, client, admin_headers, searchable_rules):
+        data = client.get("/bsdata/search?query=ty", headers=admin_headers).json()
+        assert [r["name"] for r in data] == ["Lay Low the Tyrants"]
+
+    def test_rebuild_replaces_entries(self, session, searchable_rules):
+        first = rebuild_search_index(session)
+        assert rebuild_search_index(session) == first == 3
+
+
+class TestSyncRollbackRoute:
+    def test_requires_admin(self, client, auth_headers):
+        response = client.post("/bsdata/sync/rollback", headers=auth_headers)
+        assert response.status_code == 403
+
+    def test_conflict_without_snapshot(self, client, admin_headers):
+        response = client.post("/bsdata/sync/rollback", headers=admin_headers)
+        assert response.status_code == 409
+        assert response.json()["detail"] == "No previous snapshot"
+
+
+class TestSyncJobRoutes:
+    @pytest.fixture(autouse=True)
+    def idle_runner(self, monkeypatch):
+        # Jobs are recorded but never started
+        monkeypatch.setattr(sync_job_runner, "submit", lambda job_id: None)
+
+    def test_trigger_returns_queued_job(self, client, admin_headers):
+        response = client.post("/bsdata/sync?force_full=true", headers=admin_headers)
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued"
+        assert job["force_full"] is True
+
+    def test_concurrent_trigger_conflicts(self, client, admin_headers):
+        job_id = client.post("/bsdata/sync", headers=admin_headers).json()["id"]
+
+        response = client.post("/bsdata/sync", headers=admin_headers)
+
+        assert response.status_code == 409
+        assert str(job_id) in response.json()["detail"]
+
+    def test_job_status(self, client, session, admin_headers):
+        job_id = client.post("/bsdata/sync", headers=admin_headers).json()["id"]
+        job = session.get(BSDataSyncJob, job_id)
+        job.status = "running"
+        job.phase = "parse"
+        job.phases = json.dumps(
+            [{"name": "parse", "started_at": "2026-01-01T00:00:00"}]
+        )
+        session.add(job)
+        session.commit()
+
+        response = client.get(f"/bsdata/sync/jobs/{job_id}", headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["status"], data["phase"]) == ("running", "parse")
+        assert data["phases"][0]["duration_seconds"] is None
+
+    def test_missing_job_returns_404(self, client, admin_headers):
+        response = client.get("/bsdata/sync/jobs/999", headers=admin_headers)
+        assert response.status_code == 404
+
+    def test_requires_admin(self, client, auth_headers):
+        assert client.post("/bsdata/sync", headers=auth_headers).status_code == 403
+        response = client.get("/bsdata/sync/jobs/1", headers=auth_headers)
+        assert response.status_code == 403
+
+
+class TestParseListRoute:
+    def test_parse_list(self, client, admin_headers, session, stormcast):
+        unit = session.exec(select(Unit).where(Unit.bsdata_id == "liberators")).one()
+        unit.points = 100
+        session.add(unit)
+        session.commit()
+
+        response = client.post(
+            "/bsdata/lists/parse",
+            json={"army_list": "Stormcast Eternals\n5x Liberators - 100pts"},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["valid"]
+        assert data["units"][0]["unit_id"] == unit.id
+
+    def test_requires_login(self, client):
+        response = client.post("/bsdata/lists/parse", json={"army_list": "x"})
+        assert response.status_code == 401
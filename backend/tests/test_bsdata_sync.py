@@ -0,0 +1,603 @@
+"""Tests for BSData sync against the fixture catalogs in tests/fixtures/bsdata."""
+
+import asyncio
+import hashlib
+import io
+import json
+import shutil
+import socket
+import tarfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import pytest
+from app.bsdata.cache import ResponseCache, response_cache
+from app.bsdata.jobs import SyncAlreadyRunning, SyncJobRunner
+from app.bsdata.models import (
+    BSDataFileHash,
+    BSDataSnapshot,
+    BSDataSyncJob,
+    BSDataSyncStatus,
+    Faction,
+    Spell,
+    SpellLore,
+    Unit,
+    UnitFaction,
+    Weapon,
+)
+from app.bsdata.parser import (
+    PROFILE_TYPE_UNIT,
+    BSDataParser,
+    EntryIndex,
+    iter_unit_entries,
+)
+from app.bsdata.snapshot import load_snapshot
+from app.bsdata.sync import BSDataSync
+from app.bsdata.writer import BulkWriter
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, create_engine, select
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "bsdata"
+
+
+class FixtureSync(BSDataSync):
+    """BSDataSync reading a local copy of the fixture catalogs."""
+
+    def __init__(
+        self,
+        session: Session,
+        repo_path: Path,
+        commit: str,
+        workers: int = 1,
+        progress=None,
+    ):
+        super().__init__(session, workers=workers, progress=progress)
+        self.repo_path = repo_path
+        self.commit = commit
+
+    def _get_latest_commit(self) -> str:
+        return self.commit
+
+    def _download_and_extract(self) -> str:
+        return self.commit
+
+
+@pytest.fixture(name="repo_path")
+def repo_path_fixture(tmp_path: Path) -> Path:
+    repo_path = tmp_path / "age-of-sigmar-4th"
+    shutil.copytree(FIXTURE_PATH, repo_path)
+    return repo_path
+
+
+def run_sync(
+    session: Session, repo_path: Path, commit: str, workers: int = 1, **kwargs
+) -> dict:
+    return FixtureSync(session, repo_path, commit, workers).sync(**kwargs)
+
+
+def edit_file(repo_path: Path, name: str, old: str, new: str):
+    path = repo_path / name
+    path.write_text(path.read_text().replace(old, new))
+
+
+def unit_ids(session: Session, faction_name: str) -> set[int]:
+    statement = select(Unit.id).join(Faction).where(Faction.name == faction_name)
+    return set(session.exec(statement).all())
+
+
+class TestFullSync:
+    def test_first_sync_is_full(self, session, repo_path):
+        result = run_sync(session, repo_path, "a" * 40)
+
+        assert result["sync_type"] == "full"
+        assert result["factions_count"] == 3
+        assert result["units_count"] == 3
+        names = set(session.exec(select(Faction.name)).all())
+        assert names == {"Stormcast Eternals", "Ironjawz", "Vigilant Brotherhood"}
+
+    def test_army_of_renown_links_parent_units(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+
+        aor = session.exec(
+            select(Faction).where(Faction.name == "Vigilant Brotherhood")
+        ).one()
+        links = session.exec(
+            select(UnitFaction).where(UnitFaction.faction_id == aor.id)
+        ).all()
+        assert aor.is_aor
+        assert len(links) == 1
+
+    def test_stores_file_hashes(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+
+        hashes = {row.file_name: row for row in session.exec(select(BSDataFileHash))}
+        assert len(hashes) == 8
+        assert hashes["Ironjawz.cat"].catalog_id == "cat-ironjawz"
+        assert hashes["Age of Sigmar 4.0.gst"].catalog_id is None
+
+    def test_forced_resync_of_same_commit_changes_cache_version(
+        self, session, repo_path
+    ):
+        other_worker = ResponseCache(max_entries=10, version_ttl=0)
+        run_sync(session, repo_path, "a" * 40)
+        before = asyncio.run(other_worker.current_version(session))
+
+        run_sync(session, repo_path, "a" * 40, force_full=True)
+
+        after = asyncio.run(other_worker.current_version(session))
+        assert before and after != before
+        assert asyncio.run(response_cache.current_version(session)) == after
+
+
+class TestBulkWriter:
+    def test_children_reference_their_parent_rows(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+
+        rows = session.exec(select(Unit.name, Weapon.name).join(Weapon)).all()
+        assert ("Brutes", "Jagged Gore-hacka") in rows
+        spell = session.exec(select(Spell)).one()
+        assert session.get(SpellLore, spell.lore_id).bsdata_id == "lore-storm"
+
+    def test_full_sync_uses_few_statements(self, session, repo_path):
+        sync = FixtureSync(session, repo_path, "a" * 40)
+        sync.sync()
+
+        # One statement per table and column set, not one per row
+        assert 0 < sync.writer.statements < 40
+
+    def test_upsert_merges_rows_staged_in_the_same_run(self, session):
+        writer = BulkWriter(session)
+        faction = Faction(bsdata_id="f", name="F", grand_alliance_id=1)
+        session.add(faction)
+        session.flush()
+
+        first = {"bsdata_id": "u", "name": "Old", "faction_id": faction.id}
+        writer.upsert(Unit, first, keep=("faction_id",))
+        second = {"bsdata_id": "u", "name": "New", "faction_id": 999}
+        writer.upsert(Unit, second, keep=("faction_id",))
+        writer.flush()
+        writer.upsert(Unit, {"bsdata_id": "u", "name": "Newer"})
+        writer.flush()
+
+        unit = session.exec(select(Unit)).one()
+        assert (unit.name, unit.faction_id) == ("Newer", faction.id)
+
+
+class TestParallelParsing:
+    def test_process_pool_matches_sequential_parse(self, repo_path):
+        parser = BSDataParser(repo_path)
+        catalogs = parser.get_faction_catalogs()
+
+        sequential = parser.parse_faction_catalogs(catalogs, workers=1)
+        parallel = parser.parse_faction_catalogs(catalogs, workers=2)
+
+        assert parallel == sequential
+        assert [parsed["catalog"]["file_path"] for parsed in parallel] == [
+            str(main_cat) for main_cat, _ in catalogs
+        ]
+
+    def test_sync_with_workers(self, session, repo_path):
+        result = run_sync(session, repo_path, "a" * 40, workers=2)
+
+        assert result["factions_count"] == 3
+        assert result["units_count"] == 3
+
+
+LIBRARY_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<catalogue id="lib" name="Test - Library" xmlns="http://www.battlescribe.net/schema/catalogueSchema">
+  <sharedSelectionEntries>
+    <selectionEntry id="outer" name="Warband" type="unit">
+      <profiles>
+        <profile id="outer-profile" name="Warband" typeId="ff03-376e-972f-8ab2"/>
+      </profiles>
+      <selectionEntries>
+        <selectionEntry id="inner" name="Champion" type="unit">
+          <profiles>
+            <profile id="inner-profile" name="Champion" typeId="ff03-376e-972f-8ab2"/>
+          </profiles>
+        </selectionEntry>
+      </selectionEntries>
+    </selectionEntry>
+    <selectionEntry id="old" name="Old Hero" type="unit">
+      <categoryLinks>
+        <categoryLink id="old-legends" name="Legends" targetId="legends"/>
+      </categoryLinks>
+      <profiles>
+        <profile id="old-profile" name="Old Hero" typeId="ff03-376e-972f-8ab2"/>
+      </profiles>
+    </selectionEntry>
+    <selectionEntry id="manif" name="Scuttling Idol" type="unit">
+      <profiles>
+        <profile id="manif-profile" name="Idol" typeId="1287-3a-9799-7e40"/>
+      </profiles>
+    </selectionEntry>
+  </sharedSelectionEntries>
+</catalogue>
+"""
+
+
+class TestStreamingLibraryParse:
+    def test_nested_units_legends_and_manifestations(self, tmp_path):
+        lib_path = tmp_path / "Test - Library.cat"
+        lib_path.write_text(LIBRARY_XML)
+
+        result = BSDataParser(tmp_path).parse_library_catalog(lib_path)
+
+        assert [unit["name"] for unit in result["units"]] == ["Warband", "Champion"]
+        assert [manif["name"] for manif in result["manifestations"]] == [
+            "Scuttling Idol"
+        ]
+
+    def test_entries_are_cleared_after_parsing(self, tmp_path):
+        lib_path = tmp_path / "Test - Library.cat"
+        lib_path.write_text(LIBRARY_XML)
+
+        entries = list(iter_unit_entries(lib_path))
+
+        assert len(entries) == 3
+        assert all(len(entry) == 0 and not entry.attrib for entry in entries)
+
+    def test_entry_index_groups_profiles_by_type(self, tmp_path):
+        lib_path = tmp_path / "Test - Library.cat"
+        lib_path.write_text(LIBRARY_XML)
+        entry = next(iter_unit_entries(lib_path))
+
+        index = EntryIndex(entry)
+
+        assert [p.get("id") for p in index.profiles_of(PROFILE_TYPE_UNIT)] == [
+            "outer-profile",
+            "inner-profile",
+        ]
+        assert list(index.entries) == ["inner"]
+
+
+class TestIncrementalSync:
+    def test_only_changed_catalog_is_resynced(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+        stormcast_units = unit_ids(session, "Stormcast Eternals")
+
+        edit_file(repo_path, "Ironjawz - Library.cat", '"Brutes"', '"Ardboys"')
+        result = run_sync(session, repo_path, "b" * 40)
+
+        assert result["sync_type"] == "incremental"
+        assert result["changed_files"] == ["Ironjawz - Library.cat"]
+        assert result["units_count"] == 3
+        assert unit_ids(session, "Stormcast Eternals") == stormcast_units
+        names = session.exec(
+            select(Unit.name).join(Faction).where(Faction.name == "Ironjawz")
+        ).all()
+        assert names == ["Ardboys"]
+        assert len(session.exec(select(Weapon)).all()) == 3
+
+    def test_parent_change_relinks_army_of_renown(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+
+        edit_file(repo_path, "Stormcast Eternals - Library.cat", "3+</char", "2+</char")
+        result = run_sync(session, repo_path, "b" * 40)
+
+        assert result["sync_type"] == "incremental"
+        assert len(session.exec(select(UnitFaction)).all()) == 1
+        assert len(session.exec(select(Spell)).all()) == 1
+
+    def test_shared_file_change_forces_full_sync(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+
+        edit_file(repo_path, "Lores.cat", "D3 mortal", "D6 mortal")
+        result = run_sync(session, repo_path, "b" * 40)
+
+        assert result["sync_type"] == "full"
+        assert "D6" in session.exec(select(Spell.effect)).one()
+
+    def test_removed_catalog_deletes_faction(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+
+        (repo_path / "Ironjawz.cat").unlink()
+        (repo_path / "Ironjawz - Library.cat").unlink()
+        result = run_sync(session, repo_path, "b" * 40)
+
+        assert result["sync_type"] == "incremental"
+        assert not session.exec(
+            select(Faction).where(Faction.name == "Ironjawz")
+        ).first()
+        assert result["units_count"] == 2
+
+    def test_force_full_skips_hash_comparison(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+
+        result = run_sync(session, repo_path, "b" * 40, force_full=True)
+
+        assert result["sync_type"] == "full"
+        status = session.exec(
+            select(BSDataSyncStatus).order_by(BSDataSyncStatus.id.desc())
+        ).first()
+        assert status.sync_type == "full"
+        assert status.commit_hash == "b" * 40
+
+
+class TestSnapshotRollback:
+    def test_failed_full_sync_keeps_previous_data(
+        self, session, repo_path, monkeypatch
+    ):
+        run_sync(session, repo_path, "a" * 40)
+
+        def fail(self, parsed):
+            raise RuntimeError("parse error")
+
+        monkeypatch.setattr(FixtureSync, "_sync_faction", fail)
+        result = run_sync(session, repo_path, "b" * 40, force_full=True)
+
+        assert result["status"] == "failed"
+        assert len(session.exec(select(Faction)).all()) == 3
+        assert len(session.exec(select(Unit)).all()) == 3
+
+    def test_rollback_swaps_with_previous_sync(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+        edit_file(repo_path, "Ironjawz - Library.cat", '"Brutes"', '"Ardboys"')
+        run_sync(session, repo_path, "b" * 40)
+
+        result = FixtureSync(session, repo_path, "b" * 40).rollback()
+
+        assert result["commit"] == "a" * 40
+        assert result["units_count"] == 3
+        names = session.exec(
+            select(Unit.name).join(Faction).where(Faction.name == "Ironjawz")
+        ).all()
+        assert names == ["Brutes"]
+        assert session.exec(select(BSDataFileHash)).first() is None
+        assert FixtureSync(session, repo_path, "c" * 40).get_current_commit() == (
+            "a" * 40
+        )
+
+        FixtureSync(session, repo_path, "b" * 40).rollback()
+
+        names = session.exec(
+            select(Unit.name).join(Faction).where(Faction.name == "Ironjawz")
+        ).all()
+        assert names == ["Ardboys"]
+
+    def test_rollback_without_snapshot_fails(self, session, repo_path):
+        result = FixtureSync(session, repo_path, "a" * 40).rollback()
+
+        assert result["status"] == "failed"
+
+    def test_unchanged_files_store_no_snapshot(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+
+        result = run_sync(session, repo_path, "b" * 40)
+
+        assert result["sync_type"] == "incremental"
+        assert session.exec(select(BSDataSnapshot)).first() is None
+
+    def test_incremental_snapshot_holds_only_touched_faction(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+        edit_file(repo_path, "Ironjawz - Library.cat", '"Brutes"', '"Ardboys"')
+        run_sync(session, repo_path, "b" * 40)
+
+        scope, tables = load_snapshot(session.exec(select(BSDataSnapshot)).one())
+
+        assert scope.factions is not None
+        assert [row["name"] for row in tables[Faction.__tablename__]] == ["Ironjawz"]
+        assert [row["name"] for row in tables[Unit.__tablename__]] == ["Brutes"]
+
+    def test_old_snapshots_are_pruned(self, session, repo_path, monkeypatch):
+        monkeypatch.setattr("app.bsdata.snapshot.settings.BSDATA_SNAPSHOTS_KEPT", 2)
+        for commit in "abcd":
+            run_sync(session, repo_path, commit * 40, force_full=True)
+
+        snapshots = session.exec(select(BSDataSnapshot)).all()
+        assert [snapshot.commit_hash for snapshot in snapshots] == [
+            "b" * 40,
+            "c" * 40,
+        ]
+
+    def test_rollback_restores_removed_catalog(self, session, repo_path):
+        run_sync(session, repo_path, "a" * 40)
+        stormcast_units = unit_ids(session, "Stormcast Eternals")
+        (repo_path / "Ironjawz.cat").unlink()
+        (repo_path / "Ironjawz - Library.cat").unlink()
+        run_sync(session, repo_path, "b" * 40)
+
+        result = FixtureSync(session, repo_path, "b" * 40).rollback()
+
+        assert result["factions_count"] == 3
+        assert result["units_count"] == 3
+        assert unit_ids(session, "Ironjawz")
+        assert unit_ids(session, "Stormcast Eternals") == stormcast_units
+
+
+@pytest.fixture(name="job_runner")
+def job_runner_fixture(session: Session, repo_path: Path, monkeypatch):
+    """Runner whose jobs sync the fixture catalogs; submit() does not start them."""
+    engine = create_engine(
+        f"sqlite:///{session.info['test_database']}",
+        connect_args={"check_same_thread": False},
+        poolclass=NullPool,
+    )
+    monkeypatch.setattr(
+        "app.bsdata.jobs.BSDataSync",
+        lambda sync_session, progress: FixtureSync(
+            sync_session, repo_path, "a" * 40, progress=progress
+        ),
+    )
+    runner = SyncJobRunner(lambda: Session(engine), stale_after=60)
+    monkeypatch.setattr(runner, "submit", lambda job_id: None)
+    yield runner
+    engine.dispose()
+
+
+class TestSyncJobs:
+    def test_job_records_phases_and_result(self, session, job_runner):
+        job = job_runner.enqueue(session, force_full=False)
+
+        job_runner.run(job.id)
+
+        session.refresh(job)
+        assert job.status == "success"
+        assert job.active is None
+        assert json.loads(job.result)["factions_count"] == 3
+        phases = json.loads(job.phases)
+        assert [phase["name"] for phase in phases] == [
+            "download",
+            "parse",
+            "factions",
+            "lores",
+            "write",
+            "search_index",
+        ]
+        assert all(phase["duration_seconds"] is not None for phase in phases)
+
+    def test_second_job_is_rejected_while_one_is_active(self, session, job_runner):
+        job = job_runner.enqueue(session, force_full=False)
+
+        with pytest.raises(SyncAlreadyRunning) as error:
+            job_runner.enqueue(session, force_full=True)
+
+        assert error.value.job_id == job.id
+        job_runner.run(job.id)
+        assert job_runner.enqueue(session, force_full=True).id != job.id
+
+    def test_rollback_is_rejected_while_a_job_is_active(self, session, job_runner):
+        job = job_runner.enqueue(session, force_full=False)
+
+        with pytest.raises(SyncAlreadyRunning) as error:
+            job_runner.rollback(session)
+
+        assert error.value.job_id == job.id
+        rollbacks = session.exec(
+            select(BSDataSyncJob).where(BSDataSyncJob.phase == "rollback")
+        ).all()
+        assert rollbacks == []
+
+    def test_job_of_restarted_process_is_released(self, session, job_runner):
+        orphan = job_runner.enqueue(session, force_full=False)
+        # Same host and PID 1 as this container, but an earlier process
+        orphan.owner = f"{socket.gethostname()}:1:0123abcd"
+        session.add(orphan)
+        session.commit()
+
+        job = job_runner.enqueue(session, force_full=False)
+
+        session.refresh(orphan)
+        assert orphan.status == "failed"
+        assert orphan.active is None
+        assert job.active
+
+    def test_job_of_other_host_is_released_once_stale(self, session, job_runner):
+        remote = job_runner.enqueue(session, force_full=False)
+        remote.owner = "other-host:1:0123abcd"
+        session.add(remote)
+        session.commit()
+
+        with pytest.raises(SyncAlreadyRunning):
+            job_runner.enqueue(session, force_full=False)
+
+        remote.updated_at = datetime.utcnow() - timedelta(hours=1)
+        session.add(remote)
+        session.commit()
+        job = job_runner.enqueue(session, force_full=False)
+
+        session.refresh(remote)
+        assert remote.status == "failed"
+        assert job.active
+
+    def test_stale_job_of_live_process_is_kept(self, session, job_runner):
+        stale = job_runner.enqueue(session, force_full=False)
+        stale.updated_at = datetime.utcnow() - timedelta(hours=1)
+        session.add(stale)
+        session.commit()
+
+        with pytest.raises(SyncAlreadyRunning):
+            job_runner.enqueue(session, force_full=False)
+
+        session.refresh(stale)
+        assert stale.active
+
+    def test_beat_advances_updated_at(self, session, job_runner):
+        job = job_runner.enqueue(session, force_full=False)
+        job.updated_at = datetime.utcnow() - timedelta(hours=1)
+        session.add(job)
+        session.commit()
+
+        job_runner.beat(job.id)
+
+        session.refresh(job)
+        assert job.updated_at > datetime.utcnow() - timedelta(minutes=1)
+
+
+ARCHIVE_COMMIT = "c0ffee" + "0" * 34
+
+
+def build_archive(path: Path, commit: Optional[str] = ARCHIVE_COMMIT) -> Path:
+    """GitHub-style tarball of the fixture catalogs."""
+    pax_headers = {"comment": commit} if commit else {}
+    with tarfile.open(
+        path, "w:gz", format=tarfile.PAX_FORMAT, pax_headers=pax_headers
+    ) as tar:
+        tar.add(FIXTURE_PATH, arcname="age-of-sigmar-4th-main")
+        readme = b"not a catalog"
+        info = tarfile.TarInfo("age-of-sigmar-4th-main/README.md")
+        info.size = len(readme)
+        tar.addfile(info, io.BytesIO(readme))
+        info = tarfile.TarInfo("age-of-sigmar-4th-main/../escape.cat")
+        info.size = len(readme)
+        tar.addfile(info, io.BytesIO(readme))
+    return path
+
+
+def archive_sync(session: Session, tmp_path: Path, source: str) -> BSDataSync:
+    sync = BSDataSync(session, workers=1, source=source)
+    sync.repo_path = tmp_path / "extracted" / "age-of-sigmar-4th"
+    return sync
+
+
+class TestTarballSource:
+    def test_sync_from_local_archive(self, session, tmp_path):
+        archive = build_archive(tmp_path / "bsdata.tar.gz")
+        sync = archive_sync(session, tmp_path, str(archive))
+
+        result = sync.sync()
+
+        assert result["commit"] == ARCHIVE_COMMIT
+        assert result["factions_count"] == 3
+        extracted = sorted(path.name for path in sync.repo_path.iterdir())
+        assert len(extracted) == 8
+        assert all(name.endswith((".cat", ".gst")) for name in extracted)
+        assert not (tmp_path / "extracted" / "escape.cat").exists()
+
+        again = archive_sync(session, tmp_path, str(archive)).sync()
+        assert again["message"] == "No changes"
+
+    def test_archive_without_commit_uses_digest(self, session, tmp_path):
+        archive = build_archive(tmp_path / "bsdata.tar.gz", commit=None)
+
+        result = archive_sync(session, tmp_path, str(archive)).sync()
+
+        assert result["commit"] == hashlib.sha1(archive.read_bytes()).hexdigest()
+
+    def test_mirror_download_is_conditional(self, session, tmp_path, monkeypatch):
+        payload = build_archive(tmp_path / "bsdata.tar.gz").read_bytes()
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=payload, headers={"ETag": '"v1"'})
+
+        client = httpx.Client
+        monkeypatch.setattr(
+            "app.bsdata.sync.httpx.Client",
+            lambda **kwargs: client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        url = "https://mirror.example/bsdata.tar.gz"
+
+        first = archive_sync(session, tmp_path, url).sync()
+        second = archive_sync(session, tmp_path, url).sync()
+
+        assert first["factions_count"] == 3
+        assert second["message"] == "No changes"
+        assert second["commit"] == ARCHIVE_COMMIT
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == '"v1"'
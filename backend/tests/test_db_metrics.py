@@ -0,0 +1,83 @@
+"""Tests for per-request DB timing headers and the /metrics endpoint."""
+
+import pytest
+from app.core.db_metrics import (
+    RequestDbStats,
+    TimedQueuePool,
+    finish_request_stats,
+    instrument_engine,
+    start_request_stats,
+    totals,
+)
+from app.db import get_async_database_url
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+
+class TestDBTimingHeaders:
+    """Every response reports the DB work done for it."""
+
+    def test_headers_count_queries(self, client):
+        response = client.get("/admin/settings/features")
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Query-Count"]) >= 1
+        assert float(response.headers["X-DB-Time-Ms"]) >= 0
+        assert "X-DB-Pool-Wait-Ms" in response.headers
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+
+    def test_no_queries_for_static_endpoint(self, client):
+        response = client.get("/health")
+        assert response.headers["X-DB-Query-Count"] == "0"
+
+    def test_totals_accumulate(self, client):
+        before = totals.queries
+        client.get("/admin/settings/features")
+        assert totals.queries > before
+
+
+class TestMetricsEndpoint:
+    def test_prometheus_text(self, client, metrics_headers):
+        client.get("/admin/settings/features")
+        response = client.get("/metrics", headers=metrics_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "db_queries_total" in response.text
+        assert "db_pool_wait_seconds_total" in response.text
+
+
+class TestHelpers:
+    def test_request_stats_rounding(self):
+        stats = RequestDbStats()
+        stats.db_time = 0.0123456
+        assert stats.db_time_ms == 12.35
+
+    def test_timed_pool_records_checkout_wait(self):
+        engine = create_engine("sqlite://", poolclass=TimedQueuePool, pool_size=1)
+        stats = start_request_stats()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        finish_request_stats(stats)
+        assert stats.pool_wait > 0
+
+    def test_async_database_url(self):
+        assert (
+            get_async_database_url("postgresql://u:p@db:5432/app")
+            == "postgresql+asyncpg://u:p@db:5432/app"
+        )
+        assert get_async_database_url("sqlite:///:memory:") == (
+            "sqlite+aiosqlite:///:memory:"
+        )
+
+
+class TestFailedQueries:
+    def test_failed_query_does_not_leak_start_time(self):
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        stats = start_request_stats()
+        with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            assert conn.info["query_started"] == []
+            conn.execute(text("SELECT 1"))
+        finish_request_stats(stats)
+        assert stats.query_count == 2
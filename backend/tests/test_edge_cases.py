@@ -12,7 +12,9 @@ from app.league.service import (
     generate_knockout_matches,
     get_group_standings,
     get_qualified_players,
+    refresh_group_standings,
 )
+from app.lists.service import load_army_list, store_army_list
 from app.matchup.models import Matchup
 from app.matchup.service import submit_list, submit_result
 from sqlmodel import Session
@@ -236,7 +238,7 @@ class TestMatchupEdgeCases:
         )
 
         assert result.player1_submitted is True
-        assert result.player1_list == ""
+        assert load_army_list(session, result.player1_list_id) == ""
 
     def test_matchup_with_very_long_list(self, session: Session):
         """Matchup handles very long army lists."""
@@ -261,7 +263,7 @@ class TestMatchupEdgeCases:
         )
 
         assert result.player1_submitted is True
-        assert len(result.player1_list) >= 10000
+        assert len(load_army_list(session, result.player1_list_id)) >= 10000
 
     def test_matchup_both_anonymous(self, session: Session):
         """Both players anonymous - result can't be submitted."""
@@ -271,8 +273,8 @@ class TestMatchupEdgeCases:
             player2_id=None,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
         )
@@ -290,8 +292,8 @@ class TestMatchupEdgeCases:
             player2_id=None,  # Anonymous
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
         )
@@ -333,6 +335,7 @@ class TestKnockoutEdgeCases:
             session.add(player)
         session.commit()
 
+        refresh_group_standings(session, league)
         qualified = get_qualified_players(session, league)
         # Should return all 4, not try to return 8
         assert len(qualified) == 4
@@ -370,6 +373,7 @@ class TestKnockoutEdgeCases:
         session.add_all([p1, p2])
         session.commit()
 
+        refresh_group_standings(session, league)
         matches = generate_knockout_matches(session, league)
         assert len(matches) == 1
         assert matches[0].knockout_round == "final"
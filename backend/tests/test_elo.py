@@ -1,5 +1,7 @@
 """Tests for ELO rating system."""
 
+from datetime import datetime, timedelta
+
 import pytest
 from app.league.elo import (
     DEFAULT_K_FACTOR,
@@ -9,10 +11,13 @@ from app.league.elo import (
     calculate_expected_score,
     get_k_factor,
     get_or_create_player_elo,
+    replay_elo_history,
+    set_setting,
     update_elo_after_match,
 )
-from app.league.models import AppSettings, PlayerElo
-from sqlmodel import Session
+from app.league.models import AppSettings, League, LeaguePlayer, Match, PlayerElo
+from app.league.service import confirm_match_result, submit_match_result
+from sqlmodel import Session, select
 
 
 class TestExpectedScore:
@@ -265,3 +270,99 @@ class TestUpdateEloAfterMatch:
         assert player1.k_factor_games == 4
         assert player2.games_played == 9
         assert player2.k_factor_games == 7
+
+
+def _play_league(session: Session) -> list[Match]:
+    """Three players, three confirmed matches through the normal flow."""
+    league = League(
+        name="Replay League",
+        organizer_id=1,
+        registration_end=datetime.utcnow() + timedelta(days=7),
+    )
+    session.add(league)
+    session.commit()
+    players = [LeaguePlayer(league_id=league.id, user_id=500 + i) for i in range(3)]
+    session.add_all(players)
+    session.commit()
+
+    matches = []
+    for (a, b), scores in zip([(0, 1), (1, 2), (0, 2)], [(80, 60), (70, 70), (50, 90)]):
+        match = Match(
+            league_id=league.id,
+            player1_id=players[a].id,
+            player2_id=players[b].id,
+            phase="group",
+        )
+        session.add(match)
+        session.commit()
+        submit_match_result(session, match, *scores, submitted_by_id=500 + a)
+        confirm_match_result(session, match, confirmed_by_id=500 + b)
+        matches.append(match)
+    return matches
+
+
+def _ratings(session: Session) -> dict[int, tuple[int, int]]:
+    elos = session.exec(select(PlayerElo)).all()
+    return {elo.user_id: (elo.elo, elo.games_played) for elo in elos}
+
+
+class TestReplayEloHistory:
+    """Test recomputing ratings from match history."""
+
+    def test_replay_matches_incremental_updates(self, session: Session):
+        """Replaying unchanged history reproduces the stored ratings."""
+        _play_league(session)
+        incremental = _ratings(session)
+
+        summary = replay_elo_history(session, dry_run=True)
+
+        assert summary["matches"] == 3
+        assert summary["matches_changed"] == 0
+        assert summary["players_changed"] == []
+        assert _ratings(session) == incremental
+
+    def test_dry_run_reports_without_writing(self, session: Session):
+        """Dry run lists drifted ratings but leaves them in place."""
+        _play_league(session)
+        drifted = session.exec(select(PlayerElo).where(PlayerElo.user_id == 500)).one()
+        expected = drifted.elo
+        drifted.elo = 2000
+        session.add(drifted)
+        session.commit()
+
+        summary = replay_elo_history(session, dry_run=True)
+
+        assert summary["players_changed"] == [
+            {
+                "user_id": 500,
+                "elo_before": 2000,
+                "elo_after": expected,
+                "games_before": 2,
+                "games_after": 2,
+                "k_factor_games": 2,
+            }
+        ]
+        session.refresh(drifted)
+        assert drifted.elo == 2000
+
+        replay_elo_history(session)
+        session.refresh(drifted)
+        assert drifted.elo == expected
+
+    def test_new_k_factor_rewrites_history(self, session: Session):
+        """Changed K-factor settings are applied to every past match."""
+        matches = _play_league(session)
+        set_setting(session, "elo_new_player_k", "10")
+
+        summary = replay_elo_history(session)
+
+        assert summary["matches_changed"] == 3
+        session.refresh(matches[0])
+        assert (matches[0].player1_elo_after, matches[0].player2_elo_after) == (
+            1005,
+            995,
+        )
+        assert _ratings(session)[500] == (
+            matches[2].player1_elo_after,
+            2,
+        )
@@ -12,6 +12,7 @@ from app.league.service import (
     get_qualified_players,
     get_round_matches,
     get_round_winners,
+    refresh_group_standings,
 )
 from sqlmodel import Session
 
@@ -160,6 +161,7 @@ class TestGetQualifiedPlayers:
         session.add_all([a1, a2, a3, a4, b1, b2, b3, b4])
         session.commit()
 
+        refresh_group_standings(session, league)
         qualified = get_qualified_players(session, league)
 
         # Top 4: a1 (3000), b1 (2800), a2 (2500), b2 (2400)
@@ -205,6 +207,7 @@ class TestGetQualifiedPlayers:
                 all_players.append(player)
         session.commit()
 
+        refresh_group_standings(session, league)
         qualified = get_qualified_players(session, league)
 
         # With 3 groups and knockout_size=4:
@@ -262,6 +265,7 @@ class TestGetQualifiedPlayers:
         session.add_all([a1, a2, b1, b2])
         session.commit()
 
+        refresh_group_standings(session, league)
         qualified = get_qualified_players(session, league)
 
         # Should be sorted: a1(3500) > b1(3000) > a2(2500) > b2(2000)
@@ -302,6 +306,7 @@ class TestGenerateKnockoutMatches:
             session.add(player)
         session.commit()
 
+        refresh_group_standings(session, league)
         matches = generate_knockout_matches(session, league)
 
         # 4 players = 2 matches in first round (semi-finals)
@@ -340,6 +345,7 @@ class TestGenerateKnockoutMatches:
         for p in players:
             session.refresh(p)
 
+        refresh_group_standings(session, league)
         matches = generate_knockout_matches(session, league)
 
         # Match 1: seed 1 (3000pts) vs seed 4 (1500pts)
@@ -389,6 +395,7 @@ class TestGenerateKnockoutMatches:
             session.add(player)
         session.commit()
 
+        refresh_group_standings(session, league)
         matches = generate_knockout_matches(session, league)
 
         # Top 4 starts with semi-finals
@@ -3,7 +3,15 @@
 from datetime import datetime, timedelta
 
 import pytest
-from app.league.models import Group, League, LeaguePlayer, Match, PlayerElo
+from app.core.security import create_access_token, get_password_hash
+from app.league.models import (
+    Group,
+    GroupStanding,
+    League,
+    LeaguePlayer,
+    Match,
+    PlayerElo,
+)
 from app.league.service import (
     calculate_knockout_rounds,
     calculate_knockout_size,
@@ -16,10 +24,16 @@ from app.league.service import (
     get_knockout_constraints,
     get_knockout_round_names,
     get_league_player_count,
+    get_league_standings,
     get_next_knockout_round,
     get_qualified_players,
+    refresh_group_standings,
+    remove_player_from_league,
     submit_match_result,
 )
+from app.users.models import User
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
 from sqlmodel import Session, select
 
 
@@ -326,6 +340,117 @@ class TestGenerateGroupMatches:
             assert match.status == "scheduled"
 
 
+class TestMaterializedStandings:
+    """Test the persisted group standings projection."""
+
+    def _drawn_league(self, session: Session, player_count: int = 8):
+        league = League(
+            name="Test League",
+            organizer_id=1,
+            registration_end=datetime.utcnow() + timedelta(days=7),
+            knockout_size=4,
+        )
+        session.add(league)
+        session.commit()
+
+        for i in range(player_count):
+            session.add(LeaguePlayer(league_id=league.id, user_id=100 + i))
+        session.commit()
+
+        draw_groups(session, league)
+        generate_group_matches(session, league)
+        return league
+
+    def test_draw_creates_standings_rows(self, session: Session):
+        """Every drawn player gets a standings row."""
+        league = self._drawn_league(session)
+
+        standings = session.scalars(
+            select(GroupStanding).where(GroupStanding.league_id == league.id)
+        ).all()
+        assert len(standings) == 8
+        assert {s.position for s in standings} == {1, 2, 3, 4}
+
+    def test_submit_result_reranks_group(self, session: Session):
+        """Submitting a result moves the winner to the top of the group."""
+        league = self._drawn_league(session)
+        match = session.scalars(select(Match)).first()
+
+        submit_match_result(session, match, 10, 80, submitted_by_id=1)
+
+        rows = get_league_standings(session, league)
+        winner_standing = next(s for s, p in rows if p.id == match.player2_id)
+        assert winner_standing.position == 1
+        assert winner_standing.qualifies is True
+
+    def test_remove_player_updates_standings(self, session: Session):
+        """Removed players disappear and the opponent gets the walkover."""
+        league = self._drawn_league(session)
+        match = session.scalars(select(Match)).first()
+        removed = session.get(LeaguePlayer, match.player1_id)
+        removed_id = removed.id
+
+        remove_player_from_league(session, removed)
+
+        rows = get_league_standings(session, league)
+        assert removed_id not in {player.id for _, player in rows}
+        assert len(rows) == 7
+        top = [player for standing, player in rows if standing.position == 1]
+        assert match.player2_id in {player.id for player in top}
+
+    def test_qualified_players_match_flags(self, session: Session):
+        """get_qualified_players returns the flagged players."""
+        league = self._drawn_league(session)
+
+        qualified = get_qualified_players(session, league)
+        flagged = [
+            player
+            for standing, player in get_league_standings(session, league)
+            if standing.qualifies or standing.qualifies_as_runner_up
+        ]
+        assert len(qualified) == 4
+        assert {p.id for p in qualified} == {p.id for p in flagged}
+
+    def test_reading_does_not_materialize(self, session: Session):
+        """Standings are written by draws and results, never by reads."""
+        league = self._drawn_league(session)
+        session.execute(delete(GroupStanding))
+        session.commit()
+
+        assert get_league_standings(session, league) == []
+
+        refresh_group_standings(session, league)
+        session.commit()
+        assert len(get_league_standings(session, league)) == 8
+
+    def test_delete_league_removes_its_rows(self, client: TestClient, session: Session):
+        """Deleting a league removes its standings, matches and players."""
+        league = self._drawn_league(session)
+        league_id = league.id
+
+        admin = User(
+            email="admin@test.com",
+            username="TestAdmin",
+            hashed_password=get_password_hash("AdminPass123"),
+            role="admin",
+            is_active=True,
+            is_verified=True,
+        )
+        session.add(admin)
+        session.commit()
+        token = create_access_token(data={"sub": str(admin.id)})
+
+        response = client.delete(
+            f"/league/{league_id}", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 204
+        for model in (GroupStanding, Match, LeaguePlayer, Group):
+            rows = session.scalars(
+                select(model).where(model.league_id == league_id)
+            ).all()
+            assert rows == []
+
+
 class TestGetGroupStandings:
     """Test group standings calculation."""
 
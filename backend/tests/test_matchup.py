@@ -1,6 +1,9 @@
 """Tests for matchup module"""
 
+from datetime import datetime, timedelta
+
 import pytest
+from app.lists.service import load_army_list, store_army_list
 from app.matchup.models import Matchup
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
@@ -32,7 +35,7 @@ class TestMatchupCreation:
         assert matchup.player1_submitted is True
         assert matchup.player2_submitted is False
         assert (
-            matchup.player1_list
+            load_army_list(session, matchup.player1_list_id)
             == "My awesome Gloomspite Gitz army\n- 20 Stabbas\n- 3 Fanatics"
         )
         assert matchup.map_name is None
@@ -207,8 +210,8 @@ class TestMatchupTitleUpdate:
             player1_id=test_user.id,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             result_status="confirmed",
             player1_score=70,
@@ -258,8 +261,8 @@ class TestMatchupPublicToggle:
             player1_id=test_user.id,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             result_status="confirmed",
             player1_score=70,
@@ -396,3 +399,92 @@ class TestStatsEndpoint:
         # Version is dynamic, just check it's a string
         assert isinstance(data["version"], str)
         assert isinstance(data["exchanges_completed"], int)
+
+
+def add_matchups(session: Session, count: int, **fields) -> list[Matchup]:
+    """Revealed public matchups created one minute apart, oldest first."""
+    start = datetime(2026, 1, 1)
+    matchups = [
+        Matchup(
+            player1_submitted=True,
+            player2_submitted=True,
+            created_at=start + timedelta(minutes=index),
+            **fields,
+        )
+        for index in range(count)
+    ]
+    session.add_all(matchups)
+    session.commit()
+    return matchups
+
+
+class TestMatchupPagination:
+    """Test keyset pagination of the matchup lists"""
+
+    def test_public_pages_cover_all_matchups(
+        self, client: TestClient, session: Session
+    ):
+        matchups = add_matchups(session, 5)
+        add_matchups(session, 2, is_public=False)
+
+        first = client.get("/matchup/public", params={"limit": 2}).json()
+        assert first["total_estimate"] == 5
+        names = [item["name"] for item in first["items"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = client.get(
+                "/matchup/public", params={"limit": 2, "cursor": cursor}
+            ).json()
+            assert page["total_estimate"] is None
+            names += [item["name"] for item in page["items"]]
+            cursor = page["next_cursor"]
+
+        assert names == [m.name for m in reversed(matchups)]
+
+    def test_ties_on_created_at_are_ordered_by_id(
+        self, client: TestClient, session: Session
+    ):
+        matchups = add_matchups(session, 3)
+        for matchup in matchups:
+            matchup.created_at = datetime(2026, 1, 1)
+            session.add(matchup)
+        session.commit()
+
+        first = client.get("/matchup/public", params={"limit": 2}).json()
+        second = client.get(
+            "/matchup/public", params={"limit": 2, "cursor": first["next_cursor"]}
+        ).json()
+
+        names = [item["name"] for item in first["items"] + second["items"]]
+        assert names == [m.name for m in reversed(matchups)]
+        assert second["next_cursor"] is None
+
+    def test_my_matchups_merges_both_player_slots(
+        self, client: TestClient, session: Session, test_user, auth_headers
+    ):
+        as_player1 = add_matchups(session, 2, player1_id=test_user.id)
+        as_player2 = add_matchups(session, 2, player2_id=test_user.id)
+        add_matchups(session, 2)
+
+        pages = [
+            client.get(
+                "/matchup/my-matchups", params={"limit": 3}, headers=auth_headers
+            ).json()
+        ]
+        while pages[-1]["next_cursor"]:
+            pages.append(
+                client.get(
+                    "/matchup/my-matchups",
+                    params={"limit": 3, "cursor": pages[-1]["next_cursor"]},
+                    headers=auth_headers,
+                ).json()
+            )
+
+        names = [item["name"] for page in pages for item in page["items"]]
+        assert len(pages[0]["items"]) == 3
+        assert pages[0]["total_estimate"] == len(names) == len(set(names))
+        assert {m.name for m in as_player1 + as_player2} <= set(names)
+
+    def test_invalid_cursor_is_rejected(self, client: TestClient):
+        response = client.get("/matchup/public", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
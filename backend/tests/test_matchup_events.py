@@ -0,0 +1,151 @@
+"""Tests for matchup change events and the SSE stream."""
+
+import asyncio
+import threading
+
+import pytest
+from app.lists.service import store_army_list
+from app.matchup import events
+from app.matchup.events import MatchupEventBroker, matchup_events
+from app.matchup.models import Matchup
+from app.matchup.routes import _matchup_event_stream
+from app.matchup.service import confirm_result, submit_list, submit_result
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+
+async def drain(queue: asyncio.Queue) -> list[str]:
+    """Let scheduled callbacks run, then return everything queued."""
+    await asyncio.sleep(0)
+    received = []
+    while not queue.empty():
+        received.append(queue.get_nowait())
+    return received
+
+
+class FakeRequest:
+    def __init__(self, disconnected: bool = False):
+        self.disconnected = disconnected
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+class TestMatchupEventBroker:
+    @pytest.mark.asyncio
+    async def test_subscriber_receives_published_events(self):
+        broker = MatchupEventBroker()
+        with broker.subscribe("a") as queue:
+            broker.publish("a", events.REVEALED)
+            broker.publish("b", events.CANCELLED)
+            assert await drain(queue) == [events.REVEALED]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribes_on_exit(self):
+        broker = MatchupEventBroker()
+        with broker.subscribe("a"):
+            assert broker.subscriber_count("a") == 1
+        assert broker.subscriber_count("a") == 0
+        broker.publish("a", events.REVEALED)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_event(self):
+        broker = MatchupEventBroker()
+        with broker.subscribe("a") as queue:
+            for _ in range(events.QUEUE_SIZE):
+                broker.publish("a", events.LIST_SUBMITTED)
+            broker.publish("a", events.REVEALED)
+
+            received = await drain(queue)
+            assert len(received) == events.QUEUE_SIZE
+            assert received[-1] == events.REVEALED
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self):
+        broker = MatchupEventBroker()
+        with broker.subscribe("a") as queue:
+            thread = threading.Thread(
+                target=broker.publish, args=("a", events.RESULT_CONFIRMED)
+            )
+            thread.start()
+            thread.join()
+            event = await asyncio.wait_for(queue.get(), timeout=1)
+            assert event == events.RESULT_CONFIRMED
+
+
+class TestServiceEvents:
+    @pytest.mark.asyncio
+    async def test_second_list_publishes_submission_and_reveal(self, session: Session):
+        matchup = Matchup(
+            name="event-reveal",
+            player1_id=1,
+            player1_submitted=True,
+            player1_list_id=store_army_list(session, "Stormcast list").id,
+        )
+        session.add(matchup)
+        session.commit()
+
+        with matchup_events.subscribe("event-reveal") as queue:
+            submit_list(matchup, "Skaven list", False, session, user_id=2)
+            assert await drain(queue) == [events.LIST_SUBMITTED, events.REVEALED]
+
+    @pytest.mark.asyncio
+    async def test_result_submission_and_confirmation(self, session: Session):
+        matchup = Matchup(
+            name="event-result",
+            player1_id=1,
+            player2_id=2,
+            player1_submitted=True,
+            player2_submitted=True,
+            map_name="Age of Sigmar Mission 1",
+        )
+        session.add(matchup)
+        session.commit()
+
+        with matchup_events.subscribe("event-result") as queue:
+            submit_result(matchup, 80, 60, 1, session)
+            confirm_result(matchup, 2, session)
+            assert await drain(queue) == [
+                events.RESULT_SUBMITTED,
+                events.RESULT_CONFIRMED,
+            ]
+
+    @pytest.mark.asyncio
+    async def test_cancel_route_publishes(self, client: TestClient, auth_headers: dict):
+        with matchup_events.subscribe("test-matchup") as queue:
+            response = client.post("/matchup/test-matchup/cancel", headers=auth_headers)
+            assert response.status_code == 200
+            assert await drain(queue) == [events.CANCELLED]
+
+
+class TestEventStream:
+    def test_unknown_matchup_is_404(self, client: TestClient):
+        response = client.get("/matchup/no-such-matchup/events")
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_stream_frames(self):
+        stream = _matchup_event_stream(FakeRequest(), "stream-test")
+        assert await anext(stream) == "retry: 5000\n\n"
+
+        matchup_events.publish("stream-test", events.REVEALED)
+        frame = await asyncio.wait_for(anext(stream), timeout=1)
+        assert frame == 'event: revealed\ndata: {"type": "revealed"}\n\n'
+
+        await stream.aclose()
+        assert matchup_events.subscriber_count("stream-test") == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_keepalive_and_stops_on_disconnect(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.matchup.routes.settings.MATCHUP_EVENTS_KEEPALIVE_SECONDS", 0.01
+        )
+        request = FakeRequest()
+        stream = _matchup_event_stream(request, "keepalive-test")
+        await anext(stream)
+
+        assert await anext(stream) == ": keepalive\n\n"
+        request.disconnected = True
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+        assert matchup_events.subscriber_count("keepalive-test") == 0
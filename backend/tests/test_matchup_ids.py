@@ -0,0 +1,110 @@
+"""Tests for block-based matchup id allocation."""
+
+from datetime import datetime
+
+import pytest
+from app.core.security import create_access_token, get_password_hash
+from app.matchup.ids import MatchupIdAllocator, MatchupIdsExhausted, matchup_id_capacity
+from app.matchup.models import Matchup, MatchupIdCounter
+from app.matchup.words import id_space_size, matchup_id_for
+from app.users.models import User
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+
+def counter_value(session: Session) -> int:
+    session.expire_all()
+    return session.exec(select(MatchupIdCounter.next_value)).one()
+
+
+class TestMatchupIdAllocator:
+    def test_allocates_unique_ids_from_one_block(self, session: Session):
+        allocator = MatchupIdAllocator(block_size=10)
+
+        names = [allocator.allocate(session) for _ in range(10)]
+
+        assert len(set(names)) == 10
+        assert names == [matchup_id_for(number) for number in range(10)]
+        assert counter_value(session) == 10
+
+    def test_reserves_next_block_when_exhausted(self, session: Session):
+        allocator = MatchupIdAllocator(block_size=3)
+
+        names = [allocator.allocate(session) for _ in range(4)]
+
+        assert len(set(names)) == 4
+        assert counter_value(session) == 6
+
+    def test_allocators_never_share_ids(self, session: Session):
+        """Two processes reserve disjoint blocks."""
+        first = MatchupIdAllocator(block_size=5)
+        second = MatchupIdAllocator(block_size=5)
+
+        names = [first.allocate(session), second.allocate(session)]
+        names += [first.allocate(session) for _ in range(4)]
+        names += [second.allocate(session) for _ in range(4)]
+
+        assert len(set(names)) == 10
+
+    def test_skips_names_already_in_use(self, session: Session):
+        session.add(Matchup(name=matchup_id_for(1)))
+        session.commit()
+        allocator = MatchupIdAllocator(block_size=3)
+
+        names = [allocator.allocate(session) for _ in range(3)]
+
+        assert matchup_id_for(1) not in names
+        assert names[:2] == [matchup_id_for(0), matchup_id_for(2)]
+
+    def test_raises_when_id_space_is_used_up(self, session: Session):
+        session.add(MatchupIdCounter(id=1, next_value=id_space_size()))
+        session.commit()
+        allocator = MatchupIdAllocator(block_size=3)
+
+        with pytest.raises(MatchupIdsExhausted):
+            allocator.allocate(session)
+
+
+class TestMatchupIdCapacity:
+    def test_capacity_before_any_allocation(self, session: Session):
+        capacity = matchup_id_capacity(session)
+
+        assert capacity["allocated"] == 0
+        assert capacity["remaining"] == capacity["total"] == id_space_size()
+
+    def test_capacity_counts_reserved_blocks(self, session: Session):
+        MatchupIdAllocator(block_size=50).allocate(session)
+
+        capacity = matchup_id_capacity(session)
+        assert capacity["allocated"] == 50
+        assert capacity["remaining"] == id_space_size() - 50
+
+    def test_admin_capacity_endpoint(self, client: TestClient, session: Session):
+        admin = User(
+            email="admin@test.com",
+            username="TestAdmin",
+            hashed_password=get_password_hash("AdminPass123"),
+            role="admin",
+            is_active=True,
+            is_verified=True,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        session.add(admin)
+        session.commit()
+        token = create_access_token(data={"sub": str(admin.id)})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        client.post("/matchup", json={"army_list": "Test army list for capacity"})
+        response = client.get("/admin/matchups/id-capacity", headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["allocated"] > 0
+        assert data["remaining"] == data["total"] - data["allocated"]
+
+    def test_capacity_endpoint_requires_admin(
+        self, client: TestClient, auth_headers: dict
+    ):
+        response = client.get("/admin/matchups/id-capacity", headers=auth_headers)
+        assert response.status_code == 403
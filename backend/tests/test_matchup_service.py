@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
+from app.lists.service import load_army_list, store_army_list
 from app.matchup.models import Matchup
 from app.matchup.service import (
     AUTO_CONFIRM_HOURS,
@@ -42,7 +43,10 @@ class TestSubmitList:
         )
 
         assert result.player1_submitted is True
-        assert result.player1_list == "Stormcast Eternals\n- 10 Liberators"
+        assert (
+            load_army_list(session, result.player1_list_id)
+            == "Stormcast Eternals\n- 10 Liberators"
+        )
         assert result.player1_army_faction == "Stormcast Eternals"
         assert result.player2_submitted is False
         assert result.map_name is None  # Not revealed yet
@@ -54,7 +58,7 @@ class TestSubmitList:
             player1_id=1,
             player2_id=2,
             player1_submitted=True,
-            player1_list="Stormcast list",
+            player1_list_id=store_army_list(session, "Stormcast list").id,
             player2_submitted=False,
         )
         session.add(matchup)
@@ -70,7 +74,10 @@ class TestSubmitList:
         )
 
         assert result.player2_submitted is True
-        assert result.player2_list == "Gloomspite Gitz\n- 20 Stabbas"
+        assert (
+            load_army_list(session, result.player2_list_id)
+            == "Gloomspite Gitz\n- 20 Stabbas"
+        )
         assert result.player2_army_faction == "Gloomspite Gitz"
 
     def test_submit_list_auto_reveal_when_both_submitted(self, session: Session):
@@ -80,7 +87,7 @@ class TestSubmitList:
             player1_id=1,
             player2_id=2,
             player1_submitted=True,
-            player1_list="Player 1 list",
+            player1_list_id=store_army_list(session, "Player 1 list").id,
             player2_submitted=False,
         )
         session.add(matchup)
@@ -128,7 +135,7 @@ class TestSubmitList:
             name="test-double-submit",
             player1_id=1,
             player1_submitted=True,
-            player1_list="Already submitted",
+            player1_list_id=store_army_list(session, "Already submitted").id,
             player2_submitted=False,
         )
         session.add(matchup)
@@ -155,8 +162,8 @@ class TestRevealMatchup:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name=None,
         )
         session.add(matchup)
@@ -176,7 +183,7 @@ class TestRevealMatchup:
             player1_id=1,
             player1_submitted=True,
             player2_submitted=False,
-            player1_list="List 1",
+            player1_list_id=store_army_list(session, "List 1").id,
         )
         session.add(matchup)
         session.commit()
@@ -192,8 +199,8 @@ class TestRevealMatchup:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Already Set",
             revealed_at=datetime.utcnow(),
         )
@@ -216,8 +223,8 @@ class TestSubmitResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
         )
@@ -249,8 +256,8 @@ class TestSubmitResult:
             player2_id=None,  # Anonymous opponent
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
         )
@@ -277,7 +284,7 @@ class TestSubmitResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=False,
-            player1_list="List 1",
+            player1_list_id=store_army_list(session, "List 1").id,
         )
         session.add(matchup)
         session.commit()
@@ -299,8 +306,8 @@ class TestSubmitResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
             result_status="confirmed",
@@ -327,8 +334,8 @@ class TestSubmitResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
         )
@@ -356,8 +363,8 @@ class TestConfirmResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
             result_status="pending_confirmation",
@@ -389,8 +396,8 @@ class TestConfirmResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
             result_status="pending_confirmation",
@@ -416,8 +423,8 @@ class TestConfirmResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
             result_status=None,  # No result submitted
@@ -444,8 +451,8 @@ class TestEditResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
             result_status="pending_confirmation",
@@ -479,8 +486,8 @@ class TestEditResult:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
             result_status="pending_confirmation",
@@ -513,8 +520,8 @@ class TestAutoConfirmExpiredResults:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
             result_status="pending_confirmation",
@@ -543,8 +550,8 @@ class TestAutoConfirmExpiredResults:
             player2_id=2,
             player1_submitted=True,
             player2_submitted=True,
-            player1_list="List 1",
-            player2_list="List 2",
+            player1_list_id=store_army_list(session, "List 1").id,
+            player2_list_id=store_army_list(session, "List 2").id,
             map_name="Test Map",
             revealed_at=datetime.utcnow(),
             result_status="pending_confirmation",
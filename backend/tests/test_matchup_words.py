@@ -1,7 +1,14 @@
 """Tests for matchup ID generation (word pairs)."""
 
+import math
+
 import pytest
-from app.matchup.words import generate_matchup_id
+from app.matchup.words import (
+    _SPREAD,
+    generate_matchup_id,
+    id_space_size,
+    matchup_id_for,
+)
 
 
 class TestGenerateMatchupId:
@@ -50,3 +57,30 @@ class TestGenerateMatchupId:
             matchup_id = generate_matchup_id()
             # Should be between 5 and 50 characters
             assert 5 <= len(matchup_id) <= 50
+
+
+class TestMatchupIdFor:
+    """Test the counter to id mapping."""
+
+    def test_mapping_is_a_bijection(self):
+        """The spread multiplier is coprime with the id space size."""
+        assert math.gcd(_SPREAD, id_space_size()) == 1
+
+    def test_consecutive_numbers_give_distinct_ids(self):
+        ids = [matchup_id_for(number) for number in range(10_000)]
+        assert len(set(ids)) == len(ids)
+
+    def test_format_matches_random_ids(self):
+        adjective, noun, code = matchup_id_for(42).split("-")
+        assert adjective and noun
+        assert len(code) == 4
+        assert code.isalnum() and code == code.lower()
+
+    def test_deterministic(self):
+        assert matchup_id_for(7) == matchup_id_for(7)
+
+    def test_rejects_numbers_outside_the_space(self):
+        with pytest.raises(ValueError):
+            matchup_id_for(id_space_size())
+        with pytest.raises(ValueError):
+            matchup_id_for(-1)
@@ -0,0 +1,85 @@
+"""Tests for the in-process metrics registry and /metrics endpoint."""
+
+import pytest
+from app.core.metrics import (
+    ELO_UPDATES,
+    HTTP_REQUESTS,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
+from app.league.elo import update_elo_after_match
+from sqlmodel import Session
+
+
+class TestRegistry:
+    def test_counter_renders_labels(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs.", ("kind",))
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+
+        text = registry.render()
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a"} 3' in text
+
+    def test_counter_rejects_wrong_labels(self):
+        counter = Counter("x_total", "X.", ("kind",))
+        with pytest.raises(ValueError):
+            counter.inc(other="a")
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        text = "\n".join(histogram.render())
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 2' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+        assert "latency_seconds_count 3" in text
+
+    def test_duplicate_metric_names_rejected(self):
+        registry = MetricsRegistry()
+        registry.gauge("in_flight", "In flight.")
+        with pytest.raises(ValueError):
+            registry.gauge("in_flight", "In flight.")
+
+
+class TestMetricsMiddleware:
+    def test_requests_labelled_by_route_template(self, client):
+        before = HTTP_REQUESTS.value(
+            method="GET", route="/matchup/{matchup_name}", status="404"
+        )
+        client.get("/matchup/does-not-exist")
+        after = HTTP_REQUESTS.value(
+            method="GET", route="/matchup/{matchup_name}", status="404"
+        )
+        assert after == before + 1
+
+    def test_metrics_endpoint_lists_http_and_domain_metrics(
+        self, client, metrics_headers
+    ):
+        client.get("/health")
+        text = client.get("/metrics", headers=metrics_headers).text
+        assert 'http_requests_total{method="GET",route="/health",status="200"}' in text
+        assert "http_request_duration_seconds_bucket" in text
+        assert "# TYPE http_requests_in_flight gauge" in text
+        assert "# TYPE league_matches_confirmed_total counter" in text
+        assert "db_queries_total" in text
+
+    def test_metrics_endpoint_requires_token(self, client, metrics_headers):
+        assert client.get("/metrics").status_code == 401
+        wrong = {"Authorization": "Bearer not-the-token"}
+        assert client.get("/metrics", headers=wrong).status_code == 401
+
+    def test_metrics_endpoint_hidden_without_token(self, client):
+        assert client.get("/metrics").status_code == 404
+
+
+class TestDomainCounters:
+    def test_elo_update_increments_counter(self, session: Session):
+        before = ELO_UPDATES.value()
+        update_elo_after_match(session, 1, 2, 80, 40)
+        assert ELO_UPDATES.value() == before + 1
@@ -339,8 +339,8 @@ class TestMatchModel:
                 player2_id=2,
                 phase="group",
                 status="scheduled",
-                player1_army_list=None,
-                player2_army_list=None,
+                player1_army_list_id=None,
+                player2_army_list_id=None,
             )
             assert match.both_lists_submitted is False
 
@@ -351,8 +351,8 @@ class TestMatchModel:
                 player2_id=2,
                 phase="group",
                 status="scheduled",
-                player1_army_list="some list",
-                player2_army_list=None,
+                player1_army_list_id=1,
+                player2_army_list_id=None,
             )
             assert match.both_lists_submitted is False
 
@@ -363,8 +363,8 @@ class TestMatchModel:
                 player2_id=2,
                 phase="group",
                 status="scheduled",
-                player1_army_list="list 1",
-                player2_army_list="list 2",
+                player1_army_list_id=1,
+                player2_army_list_id=2,
             )
             assert match.both_lists_submitted is True
 
@@ -0,0 +1,180 @@
+"""Tests for the background scheduler and the auto-confirm sweeps."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from app.core.scheduler import PeriodicTask, Scheduler
+from app.league import service
+from app.league.models import Group, League, LeaguePlayer, Match, SchedulerLease
+from app.league.service import auto_confirm_pending_matches
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, create_engine, select
+
+
+@pytest.fixture(name="session_factory")
+def session_factory_fixture(session: Session):
+    """Sessions on their own connections to the test database."""
+    engine = create_engine(
+        f"sqlite:///{session.info['test_database']}",
+        connect_args={"check_same_thread": False},
+        poolclass=NullPool,
+    )
+    yield lambda: Session(engine)
+    engine.dispose()
+
+
+def make_scheduler(session_factory, tasks=(), lease_seconds=60) -> Scheduler:
+    return Scheduler(
+        session_factory, list(tasks), tick_seconds=1, lease_seconds=lease_seconds
+    )
+
+
+def make_pending_match(
+    session: Session, submitted_ago: timedelta, league_status: str = "group_phase"
+) -> Match:
+    league = League(
+        name="Auto League",
+        organizer_id=1,
+        registration_end=datetime.utcnow() - timedelta(days=7),
+        status=league_status,
+    )
+    session.add(league)
+    session.commit()
+    group = Group(league_id=league.id, name="Group A")
+    session.add(group)
+    session.commit()
+    players = [
+        LeaguePlayer(league_id=league.id, group_id=group.id, user_id=user_id)
+        for user_id in (101, 102)
+    ]
+    session.add_all(players)
+    session.commit()
+
+    match = Match(
+        league_id=league.id,
+        group_id=group.id,
+        player1_id=players[0].id,
+        player2_id=players[1].id,
+        phase="group",
+        status="pending_confirmation",
+        player1_score=80,
+        player2_score=60,
+        submitted_by_id=101,
+        submitted_at=datetime.utcnow() - submitted_ago,
+    )
+    session.add(match)
+    session.commit()
+    return match
+
+
+class TestSchedulerLease:
+    def test_first_worker_becomes_leader(self, session, session_factory):
+        scheduler = make_scheduler(session_factory)
+        with session_factory() as worker_session:
+            assert scheduler.acquire_lease(worker_session)
+
+        lease = session.exec(select(SchedulerLease)).one()
+        assert lease.owner == scheduler.owner
+        assert lease.expires_at > datetime.utcnow()
+
+    def test_leader_renews_and_others_are_rejected(self, session_factory):
+        leader = make_scheduler(session_factory)
+        follower = make_scheduler(session_factory)
+        with session_factory() as worker_session:
+            assert leader.acquire_lease(worker_session)
+            assert not follower.acquire_lease(worker_session)
+            assert leader.acquire_lease(worker_session)
+
+    def test_expired_lease_is_taken_over(self, session, session_factory):
+        leader = make_scheduler(session_factory, lease_seconds=-1)
+        follower = make_scheduler(session_factory)
+        with session_factory() as worker_session:
+            assert leader.acquire_lease(worker_session)
+            assert follower.acquire_lease(worker_session)
+
+        lease = session.exec(select(SchedulerLease)).one()
+        assert lease.owner == follower.owner
+
+
+class TestRunDue:
+    def test_runs_tasks_only_on_leader(self, session_factory):
+        calls = []
+        task = PeriodicTask("count", 60, lambda session: calls.append(1) or 1)
+        leader = make_scheduler(session_factory, [task])
+        follower = make_scheduler(session_factory, [task])
+
+        assert leader.run_due() == {"count": 1}
+        assert follower.run_due() == {}
+        assert len(calls) == 1
+
+    def test_task_waits_for_its_interval(self, session_factory):
+        calls = []
+        task = PeriodicTask("count", 3600, lambda session: calls.append(1) or 0)
+        scheduler = make_scheduler(session_factory, [task])
+
+        scheduler.run_due()
+        scheduler.run_due()
+        assert len(calls) == 1
+
+    def test_failing_task_does_not_stop_others(self, session_factory):
+        def fail(session):
+            raise RuntimeError("boom")
+
+        scheduler = make_scheduler(
+            session_factory,
+            [PeriodicTask("fail", 60, fail), PeriodicTask("ok", 60, lambda s: 2)],
+        )
+        assert scheduler.run_due() == {"ok": 2}
+
+
+class TestAutoConfirmPendingMatches:
+    def test_confirms_results_older_than_a_day(self, session: Session):
+        old = make_pending_match(session, timedelta(hours=25))
+        fresh = make_pending_match(session, timedelta(hours=1))
+
+        assert auto_confirm_pending_matches(session) == 1
+        session.refresh(old)
+        session.refresh(fresh)
+        assert old.status == "confirmed"
+        assert fresh.status == "pending_confirmation"
+
+    def test_skips_finished_leagues(self, session: Session):
+        match = make_pending_match(session, timedelta(days=2), league_status="finished")
+
+        assert auto_confirm_pending_matches(session) == 0
+        session.refresh(match)
+        assert match.status == "pending_confirmation"
+
+    def test_works_through_batches(self, session: Session):
+        matches = [make_pending_match(session, timedelta(days=2)) for _ in range(3)]
+
+        assert auto_confirm_pending_matches(session, batch_size=2) == 3
+        for match in matches:
+            session.refresh(match)
+            assert match.status == "confirmed"
+
+    def test_failing_match_does_not_block_later_batches(
+        self, session: Session, monkeypatch
+    ):
+        matches = [make_pending_match(session, timedelta(days=2)) for _ in range(3)]
+        broken_id = matches[0].id
+        confirm = service.confirm_match_result
+
+        def confirm_or_fail(session, match, confirmed_by_id):
+            if match.id == broken_id:
+                raise RuntimeError("boom")
+            return confirm(session, match, confirmed_by_id)
+
+        monkeypatch.setattr(service, "confirm_match_result", confirm_or_fail)
+
+        assert auto_confirm_pending_matches(session, batch_size=1) == 2
+        statuses = [session.get(Match, match.id).status for match in matches]
+        assert statuses == ["pending_confirmation", "confirmed", "confirmed"]
+
+    def test_listing_matches_does_not_confirm(self, client, session: Session):
+        match = make_pending_match(session, timedelta(days=2))
+
+        response = client.get(f"/league/{match.league_id}/matches")
+        assert response.status_code == 200
+        session.refresh(match)
+        assert match.status == "pending_confirmation"
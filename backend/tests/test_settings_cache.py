@@ -0,0 +1,69 @@
+"""Tests for the process-wide AppSettings cache."""
+
+from app.core.settings_cache import (
+    VERSION_KEY,
+    SettingsCache,
+    bump_settings_version,
+    settings_cache,
+)
+from app.league.elo import get_global_k_factor, get_setting, set_setting
+from app.league.models import AppSettings
+from sqlmodel import Session, select
+
+
+def _write_directly(session: Session, key: str, value: str) -> None:
+    """Change a setting without going through set_setting."""
+    setting = session.scalars(select(AppSettings).where(AppSettings.key == key)).first()
+    setting = setting or AppSettings(key=key, value=value)
+    setting.value = value
+    session.add(setting)
+    session.commit()
+
+
+class TestSettingsCache:
+    def test_reads_are_served_from_memory(self, session: Session):
+        set_setting(session, "elo_k_factor", "40")
+        assert get_global_k_factor(session) == 40
+
+        _write_directly(session, "elo_k_factor", "20")
+
+        assert get_global_k_factor(session) == 40
+
+    def test_set_setting_refreshes_and_bumps_version(self, session: Session):
+        assert get_setting(session, "elo_k_factor", "32") == "32"
+
+        set_setting(session, "elo_k_factor", "24")
+        set_setting(session, "elo_new_player_k", "60")
+
+        assert get_setting(session, "elo_k_factor") == "24"
+        assert get_setting(session, VERSION_KEY) == "2"
+
+    def test_bump_increments_the_stored_version(self, session: Session):
+        _write_directly(session, VERSION_KEY, "9")
+
+        bump_settings_version(session)
+        session.commit()
+
+        version = session.scalars(
+            select(AppSettings.value).where(AppSettings.key == VERSION_KEY)
+        ).one()
+        assert version == "10"
+
+    def test_other_workers_reload_on_version_change(self, session: Session):
+        worker = SettingsCache(version_ttl=0)
+        stale = SettingsCache(version_ttl=3600)
+        for cache in (worker, stale):
+            assert cache.get(session, "rules_enabled", "false") == "false"
+
+        set_setting(session, "rules_enabled", "true")
+
+        assert worker.get(session, "rules_enabled", "false") == "true"
+        assert stale.get(session, "rules_enabled", "false") == "false"
+
+    def test_clear(self, session: Session):
+        get_setting(session, "rules_enabled")
+        _write_directly(session, "rules_enabled", "true")
+
+        settings_cache.clear()
+
+        assert get_setting(session, "rules_enabled") == "true"
@@ -0,0 +1,63 @@
+"""Tests for the authenticated user cache."""
+
+import time
+
+from app.users.cache import UserCache
+from app.users.models import User
+from sqlmodel import Session
+
+
+def _query_count(response) -> int:
+    return int(response.headers["X-DB-Query-Count"])
+
+
+class TestUserCache:
+    def test_repeat_request_skips_user_query(self, client, auth_headers):
+        first = client.get("/auth/me", headers=auth_headers)
+        second = client.get("/auth/me", headers=auth_headers)
+
+        assert second.json() == first.json()
+        assert _query_count(second) == _query_count(first) - 1
+
+    def test_role_change_invalidates(self, client, session, auth_headers, test_user):
+        assert client.get("/admin/users", headers=auth_headers).status_code == 403
+
+        test_user.role = "admin"
+        session.add(test_user)
+        session.commit()
+
+        assert client.get("/admin/users", headers=auth_headers).status_code == 200
+
+    def test_profile_update_is_visible(self, client, auth_headers):
+        client.get("/auth/me", headers=auth_headers)
+
+        client.patch("/auth/me", json={"city": "Ulthuan"}, headers=auth_headers)
+
+        assert client.get("/auth/me", headers=auth_headers).json()["city"] == "Ulthuan"
+
+    def test_deleted_user_is_not_served(self, client, session, auth_headers, test_user):
+        client.get("/auth/me", headers=auth_headers)
+
+        session.delete(test_user)
+        session.commit()
+
+        assert client.get("/auth/me", headers=auth_headers).status_code == 404
+
+    def test_entries_are_bounded(self, session: Session, test_user):
+        cache = UserCache(max_entries=1, ttl=60)
+        cache.put(test_user)
+        assert cache.get(session, test_user.id) is test_user
+
+        cache.put(User(id=999, email="x@example.com", username="x"))
+
+        assert len(cache) == 1
+        assert cache.get(session, test_user.id) is None
+
+    def test_entries_expire(self, session: Session, test_user, monkeypatch):
+        cache = UserCache(max_entries=10, ttl=30)
+        cache.put(test_user)
+        now = time.monotonic()
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+
+        assert cache.get(session, test_user.id) is None